@@ -20,7 +20,29 @@ from propylean.instruments.safety import PressureSafetyValve
 # Import streams.
 from propylean.streams import EnergyStream, MaterialStream
 
+# Import model. Flowsheet, PipeNetwork, CaseStudy, load_many and Series are
+# imported on first use (see __getattr__) so that 'import propylean'
+# does not load scipy or multiprocessing.
+from propylean.model import Model
+
 # Import properties.
 from propylean.properties import Length, Time, Pressure, Temperature, MassFlowRate,\
     Mass, MolecularWeigth, MolarFlowRate, VolumetricFlowRate, Volume, Density,\
-    DViscosity, Power, Frequency, Components
\ No newline at end of file
+    DViscosity, Power, Frequency, Components, PropertyArray
+
+_LAZY_IMPORTS = {"Flowsheet": "propylean.flowsheet",
+                 "PipeNetwork": "propylean.network",
+                 "CaseStudy": "propylean.case_study",
+                 "load_many": "propylean.interchange",
+                 "Series": "propylean.series"}
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError("module 'propylean' has no attribute '{}'".format(name))
+    from importlib import import_module
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
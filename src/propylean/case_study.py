@@ -0,0 +1,204 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from os import cpu_count
+import pandas as pd
+from propylean.settings import Settings
+from propylean.model import Model
+from propylean.properties import _Property
+from propylean.validators import _Validators
+
+class CaseStudy(object):
+    def __init__(self, cases, outputs=None, function=None):
+        """
+        DESCRIPTION:
+            Class to run what-if cases on the present model (all streams, equipments,
+            instruments, their connections and Settings) in parallel processes.
+            Model is serialized once and sent once to every worker process, which
+            restores a fresh copy of the model from it for every case. So every case
+            starts from the same model, changes inputs as per the case, and records
+            outputs, without changes of earlier cases.
+
+        PARAMETERS:
+            cases:
+                Required: Yes
+                Type: pandas.DataFrame or list of dict
+                Description: One row or dict per case. Keys are '<tag>.<property>' of a stream,
+                             equipment or instrument, or 'Settings.<setting>'. Values are
+                             set to the property or setting, for e.g.
+                             {'K-101.efficiency': 0.7, 'Settings.compression_process': 'Polytropic'}.
+
+            outputs:
+                Required: No
+                Type: list
+                Acceptable values: '<tag>.<property>' or tuple ('<tag>.<property>', unit).
+                Default value: None
+                Description: Properties recorded after the case is set. Values of physical
+                             properties are recorded in unit provided or in their own unit.
+
+            function:
+                Required: No
+                Type: function
+                Default value: None
+                Description: Module level function called with case dict after the case is set.
+                             Dict returned by it is added to results of the case.
+
+        RETURN VALUE:
+            Type: CaseStudy
+            Description: Object of type CaseStudy
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If cases or outputs are of incorrect type.
+
+        SAMPLE USE CASES:
+            >>> from propylean import CaseStudy
+            >>> study = CaseStudy(cases=[{'K-101.efficiency': e} for e in [0.6, 0.7, 0.8]],
+                                  outputs=[('K-101.power', 'kW')])
+            >>> results = study.run(max_workers=4)
+        """
+        _Validators.validate_arg_prop_value_type("cases", cases, (pd.DataFrame, list))
+        if isinstance(cases, pd.DataFrame):
+            cases = cases.to_dict(orient="records")
+        for case in cases:
+            _Validators.validate_arg_prop_value_type("cases", case, dict)
+        if outputs is None:
+            outputs = []
+        _Validators.validate_arg_prop_value_type("outputs", outputs, list)
+        self._cases = cases
+        self._outputs = [output if isinstance(output, tuple) else (output, None)
+                         for output in outputs]
+        self._function = function
+
+    def run(self, max_workers=None, chunksize=None):
+        """
+        DESCRIPTION:
+            Runs all cases across a pool of processes.
+
+        PARAMETERS:
+            max_workers:
+                Required: No
+                Type: int
+                Default value: Number of CPUs.
+
+            chunksize:
+                Required: No
+                Type: int
+                Default value: Cases divided in about 4 chunks per worker.
+                Description: Number of cases sent to a worker at a time.
+
+        RETURN VALUE:
+            Type: pandas.DataFrame
+            Description: One row per case in order of cases, with case inputs, outputs
+                         and 'error' which has error message if case failed, else None.
+        """
+        if max_workers is None:
+            max_workers = cpu_count() or 1
+        if chunksize is None:
+            chunksize = max(1, ceil(len(self._cases) / (4 * max_workers)))
+        snapshot = _model_snapshot()
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_initialize_worker,
+                                 initargs=(snapshot, self._outputs, self._function)) as executor:
+            rows = list(executor.map(_run_case, self._cases, chunksize=chunksize))
+        return pd.DataFrame(rows)
+
+def _registered_classes():
+    """
+    Internal function to get all classes with their own registry of objects.
+    """
+    from propylean.streams import Stream
+    from propylean.equipments.abstract_equipment_classes import _EquipmentOneInletOutlet
+    from propylean.instruments.measurement import _MeasuringInstruments
+    classes = {}
+    pending = [Stream, _EquipmentOneInletOutlet, _MeasuringInstruments]
+    while pending:
+        cls = pending.pop()
+        if "items" in cls.__dict__:
+            classes[cls.__module__ + "." + cls.__qualname__] = cls
+        pending.extend(cls.__subclasses__())
+    return classes
+
+def _settings_state():
+    return {name: value for name, value in vars(Settings).items()
+            if not name.startswith("_")}
+
+def _model_snapshot():
+    """
+    Internal function to serialize active model and Settings.
+    """
+    return pickle.dumps({"model": Model.current()._dumps(),
+                         "settings": _settings_state()},
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+def _load_model_snapshot(snapshot):
+    state = pickle.loads(snapshot)
+    for name, value in state["settings"].items():
+        setattr(Settings, name, value)
+    return Model._loads(state["model"])
+
+def _get_object(tag):
+    found = [obj for obj in (cls.items.get_by_tag(tag) for cls in _registered_classes().values())
+             if obj is not None]
+    if len(found) == 0:
+        raise Exception("No object with tag '{}' found.".format(tag))
+    if len(found) > 1:
+        raise Exception("Tag '{}' is assigned to objects of more than one class.".format(tag))
+    return found[0]
+
+def _set_case_value(key, value):
+    tag, _, name = key.rpartition(".")
+    if tag == "":
+        raise Exception("Case key '{}' should be '<tag>.<property>' or 'Settings.<setting>'.".format(key))
+    if tag == "Settings":
+        setattr(Settings, name, value)
+    else:
+        setattr(_get_object(tag), name, value)
+
+def _get_output_value(key, unit):
+    tag, _, name = key.rpartition(".")
+    value = getattr(_get_object(tag), name)
+    if isinstance(value, _Property):
+        if unit is not None:
+            value = value.to_unit(unit)
+        return value.value
+    return value
+
+def _refresh_dirty_equipments():
+    """
+    Internal function to propagate changes of the case through the model.
+    """
+    for cls in _registered_classes().values():
+        for obj in cls.items:
+            if getattr(obj, "_dirty_inlet", False) or getattr(obj, "_dirty_outlet", False):
+                obj._refresh_dirty_upstream()
+
+_worker_state = {}
+
+def _initialize_worker(snapshot, outputs, function):
+    _worker_state["snapshot"] = snapshot
+    _worker_state["outputs"] = outputs
+    _worker_state["function"] = function
+
+def _run_case(case):
+    """
+    Internal function run in worker processes for every case. Model is
+    restored from the snapshot for every case, so that changes of the case
+    or the function do not carry over to next case.
+    """
+    model = _load_model_snapshot(_worker_state["snapshot"])
+    row = dict(case)
+    error = None
+    with model:
+        try:
+            for key, value in case.items():
+                _set_case_value(key, value)
+            _refresh_dirty_equipments()
+            for key, unit in _worker_state["outputs"]:
+                row[key] = _get_output_value(key, unit)
+            if _worker_state["function"] is not None:
+                row.update(_worker_state["function"](case))
+        except Exception as e:
+            error = str(e)
+    row["error"] = error
+    return row
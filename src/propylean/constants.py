@@ -31,6 +31,15 @@ class ConversionFactors(object):
             'min': 60,
             'sec': 1
             }
+    # Temperature scales are affine. Stored as (size of degree in K/9,
+    # absolute zero, freezing point of water) in the unit, so that values
+    # are converted with exact offsets, for e.g. C to F as C * 9/5 + 32
+    # and F to R as F + 459.67.
+    TEMPERATURE = {'K': (9, 0, 273.15),
+                   'C': (9, -273.15, 0),
+                   'F': (5, -459.67, 32),
+                   'R': (5, 0, 491.67)
+                   }
     PRESSURE = {'atm': 101320,
                 'bar': 100000,
                 'psi': 6893,
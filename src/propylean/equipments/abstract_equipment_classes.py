@@ -1,17 +1,39 @@
-from propylean.properties import Power, Pressure, Temperature, MassFlowRate
+from propylean.properties import Power, Pressure, Temperature, MassFlowRate, PropertyArray
+from propylean.registry import _Registry
+from propylean.model import Model, _ModelMap
 from propylean import streams
 from propylean.validators import _Validators
 from propylean.series import Series
 from warnings import warn
+from contextlib import contextmanager
 
 global _material_stream_equipment_map
-_material_stream_equipment_map = dict()
+_material_stream_equipment_map = _ModelMap("_material_stream_equipment_map")
 global _energy_stream_equipment_map
-_energy_stream_equipment_map = dict()
+_energy_stream_equipment_map = _ModelMap("_energy_stream_equipment_map")
+
+@contextmanager
+def _refresh_suspended():
+    """
+    Internal context manager in which derived property getters do not refresh
+    dirty equipments. Used while properties are being matched or solved.
+    """
+    model = Model.current()
+    previous = model._refreshing
+    model._refreshing = True
+    try:
+        yield
+    finally:
+        model._refreshing = previous
 
 # Defining generic base class for all equipments with one inlet and outlet.
 class _EquipmentOneInletOutlet(object):
-    items = []
+    items = _Registry()
+    # Dirty flags. Inlet is dirty when a connected inlet stream or anything
+    # upstream changed. Outlet is dirty when outlet streams are to be updated
+    # from the equipment. Refreshed lazily by derived property getters.
+    _dirty_inlet = False
+    _dirty_outlet = False
     def __init__(self, **inputs) -> None:
         """ 
         DESCRIPTION:
@@ -102,6 +124,7 @@ class _EquipmentOneInletOutlet(object):
             msg = "Tag '{}' already assigned!".format(value)
             raise Exception(msg)
         else:
+            self.items.update_tag(self, getattr(self, "_tag", None), value)
             self._tag = value
 
     @property
@@ -110,12 +133,12 @@ class _EquipmentOneInletOutlet(object):
         return self._inlet_pressure
     @inlet_pressure.setter
     def inlet_pressure(self, value):
-        _Validators.validate_arg_prop_value_type("inlet_pressure", value, (Pressure, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("inlet_pressure", value, (Pressure, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, Pressure)
         if unit is None:
             unit = self._inlet_pressure.unit
-        self._inlet_pressure = Pressure(value, unit) if not isinstance(value, Series) else value
+        self._inlet_pressure = Pressure(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._outlet_pressure = self._inlet_pressure - self.pressure_drop
         self._update_equipment_object(self)
     
@@ -125,12 +148,12 @@ class _EquipmentOneInletOutlet(object):
         return self._outlet_pressure
     @outlet_pressure.setter
     def outlet_pressure(self, value):
-        _Validators.validate_arg_prop_value_type("outlet_pressure", value, (Pressure, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("outlet_pressure", value, (Pressure, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, Pressure)
         if unit is None:
             unit = self._outlet_pressure.unit
-        self._outlet_pressure = Pressure(value, unit) if not isinstance(value, Series) else value
+        self._outlet_pressure = Pressure(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._inlet_pressure = self._outlet_pressure + self.pressure_drop
         self._update_equipment_object(self)
     
@@ -140,12 +163,12 @@ class _EquipmentOneInletOutlet(object):
         return self._pressure_drop
     @pressure_drop.setter
     def pressure_drop(self, value):
-        _Validators.validate_arg_prop_value_type("pressure_drop", value, (Pressure, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("pressure_drop", value, (Pressure, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, Pressure)
         if unit is None:
             unit = self._pressure_drop.unit
-        self._pressure_drop = Pressure(value, unit) if not isinstance(value, Series) else value
+        self._pressure_drop = Pressure(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._outlet_pressure =  self._inlet_pressure - self._pressure_drop
         self._update_equipment_object(self)
     
@@ -169,12 +192,12 @@ class _EquipmentOneInletOutlet(object):
         return self._inlet_temperature
     @inlet_temperature.setter
     def inlet_temperature(self, value):
-        _Validators.validate_arg_prop_value_type("inlet_temperature", value, (Temperature, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("inlet_temperature", value, (Temperature, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, Temperature)
         if unit is None:
             unit = self._inlet_temperature.unit
-        self._inlet_temperature = Temperature(value, unit) if not isinstance(value, Series) else value
+        self._inlet_temperature = Temperature(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._outlet_temperature = self._inlet_temperature + self.temperature_increase
         self._update_equipment_object(self)
 
@@ -184,12 +207,12 @@ class _EquipmentOneInletOutlet(object):
         return self._outlet_temperature
     @outlet_temperature.setter
     def outlet_temperature(self,value):
-        _Validators.validate_arg_prop_value_type("outlet_temperature", value, (Temperature, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("outlet_temperature", value, (Temperature, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, Temperature)
         if unit is None:
             unit = self._outlet_temperature.unit
-        self._outlet_temperature = Temperature(value, unit) if not isinstance(value, Series) else value
+        self._outlet_temperature = Temperature(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._inlet_temperature = self._outlet_temperature - self.temperature_increase
         self._update_equipment_object(self)
 
@@ -199,12 +222,12 @@ class _EquipmentOneInletOutlet(object):
         return self._temperature_increase
     @temperature_increase.setter
     def temperature_increase(self, value):
-        _Validators.validate_arg_prop_value_type("temperature_increase", value, (Temperature, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("temperature_increase", value, (Temperature, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, Temperature)
         if unit is None:
             unit = self._temperature_increase.unit
-        self._temperature_increase = Temperature(value, unit) if not isinstance(value, Series) else value
+        self._temperature_increase = Temperature(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._outlet_temperature =  self._inlet_temperature + self._temperature_increase
         self._update_equipment_object(self)
     @property
@@ -321,15 +344,13 @@ class _EquipmentOneInletOutlet(object):
         self._update_equipment_object(self) 
     
     def _get_equipment_index(cls, tag):
-        for index, equipment in enumerate(cls.items):
-            if equipment.tag == tag:
-                return index
-        return None
+        equipment = cls.items.get_by_tag(tag)
+        return None if equipment is None else equipment.index
     
     @classmethod
     def _get_equipment_object(cls, obj):
         try:
-            return cls.items[obj.index]
+            return cls.items.resolve(obj, "Equipment")
         except IndexError:
             raise Exception("Equipment does not exist!")
         except AttributeError:
@@ -338,10 +359,9 @@ class _EquipmentOneInletOutlet(object):
     @classmethod
     def _update_equipment_object(cls, obj):
         _Validators.validate_arg_prop_value_type("obj", obj, cls)
-        try:
-            cls.items[obj.index] = obj
-        except:
-            pass
+        if obj not in cls.items:
+            return
+        obj._mark_dirty(inlet_changed=False)
     
     def __eq__(self, other):
         if isinstance(other, type(self)):
@@ -398,6 +418,43 @@ class _EquipmentOneInletOutlet(object):
         else:
             raise Exception('Incorrect direction specified! Provided \"'+direction+'\". Can only be ["in", "out", "inlet", "outlet"]')
 
+    def to_dict(self):
+        """
+        DESCRIPTION:
+            Returns dictionary of the equipment with its class, tag and all properties,
+            and tags of streams connected to it.
+            See propylean.interchange.to_dict for the format.
+
+        RETURN VALUE:
+            Type: dict
+
+        SAMPLE USE CASES:
+            >>> data = CentrifugalPump.items.get_by_tag("P-1").to_dict()
+        """
+        from propylean.interchange import to_dict
+        return to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        DESCRIPTION:
+            Creates equipment from dictionary returned by to_dict. Use
+            propylean.load_many to create many objects at once.
+
+        PARAMETERS:
+            data:
+                Required: Yes
+                Type: dict
+
+        RETURN VALUE:
+            Type: Object of the class.
+
+        SAMPLE USE CASES:
+            >>> pump = CentrifugalPump.from_dict(data)
+        """
+        from propylean.interchange import from_dict
+        return from_dict(data, cls=cls)
+
     def connect_stream(self,
                        stream_object=None,
                        direction=None, 
@@ -500,11 +557,24 @@ class _EquipmentOneInletOutlet(object):
                 self._outlet_energy_stream_tag = stream_tag
                 self._outlet_energy_stream_index = stream_index
         
-        if mapping_result and not self._is_disconnection:
-            self._stream_equipment_properties_matcher(stream_index, 
-                                                      stream_type,
-                                                      is_inlet,
-                                                      stream_governed)
+        if (mapping_result and not self._is_disconnection and
+            # Connections inside Flowsheet.deferred_propagation are matched
+            # by the flowsheet in one pass instead of on every connection.
+            not Model.current()._deferred_propagation):
+            # Equipment is matched with the stream here, so its own dirty
+            # state is kept. Equipments downstream are marked dirty.
+            dirty = self._dirty_inlet, self._dirty_outlet
+            with _refresh_suspended():
+                self._stream_equipment_properties_matcher(stream_index, 
+                                                          stream_type,
+                                                          is_inlet,
+                                                          stream_governed)
+            self._dirty_inlet, self._dirty_outlet = dirty
+            if any(upstream._dirty_outlet for upstream in self._connected_equipments(upstream=True)):
+                # Outlets of dirty equipment upstream are yet to change, so this
+                # equipment is refreshed with them when its derived values are read.
+                self._mark_dirty(inlet_changed=True)
+        self._is_disconnection = False
         return mapping_result
 
     def disconnect_stream(self, 
@@ -918,19 +988,10 @@ class _EquipmentOneInletOutlet(object):
             return stream_object.Pc
             
     def _create_equipment_tag(cls):
-        i = 1
-        class_name = type(cls).__name__
-        tag = class_name+ "_" + str(i)
-        while cls._check_tag_assigned(tag):
-            tag = class_name+ "_" + str(i)
-            i += 1
-        return tag
+        return cls.items.create_tag(type(cls).__name__)
     
     def _check_tag_assigned(cls, tag):
-        for equipment in cls.items:
-            if tag == equipment.tag:
-                return True
-        return False
+        return cls.items.has_tag(tag)
     
     def _tuple_property_value_unit_returner(self, value, property_type):
         """ 
@@ -965,7 +1026,7 @@ class _EquipmentOneInletOutlet(object):
             return value[0], value[1]
         elif isinstance(value, property_type):
             return value.value, value.unit
-        elif isinstance(value, Series):
+        elif isinstance(value, (Series, PropertyArray)):
             return value, value.unit
         elif any([isinstance(value, float), isinstance(value, int)]):
             return value, None
@@ -1002,6 +1063,98 @@ class _EquipmentOneInletOutlet(object):
             outlet_e_stream_object = streams.EnergyStream.list_objects()[self._outlet_energy_stream_index]
             outlet_e_stream_object.amount = inlet_e_stream_object.amount
 
+    def _connected_equipments(self, upstream):
+        """
+        Internal function to get equipments connected to inlet streams (upstream)
+        or outlet streams (downstream) of the equipment.
+        """
+        if upstream:
+            connections = [(self._inlet_material_stream_index, _material_stream_equipment_map),
+                           (self._inlet_energy_stream_index, _energy_stream_equipment_map)]
+            e_index, e_type = 0, 1
+        else:
+            connections = [(self._outlet_material_stream_index, _material_stream_equipment_map),
+                           (self._outlet_energy_stream_index, _energy_stream_equipment_map)]
+            e_index, e_type = 2, 3
+        equipments = []
+        for stream_index, stream_equipment_map in connections:
+            mapping = stream_equipment_map.get(stream_index)
+            if mapping is None or mapping[e_index] is None:
+                continue
+            try:
+                equipments.append(mapping[e_type].items[mapping[e_index]])
+            except IndexError:
+                pass
+        return equipments
+
+    def _mark_dirty(self, inlet_changed=True):
+        """
+        Internal function to mark the equipment and all equipments downstream
+        of it as dirty. Stops at equipments already dirty, so cost is of the
+        newly affected region only.
+        inlet_changed is True if inlet streams changed and False if only
+        properties of the equipment itself changed.
+        """
+        pending = [(self, inlet_changed)]
+        while pending:
+            equipment, inlet_changed = pending.pop()
+            if inlet_changed:
+                equipment._dirty_inlet = True
+            if equipment._dirty_outlet:
+                continue
+            equipment._dirty_outlet = True
+            pending.extend((downstream, True) for downstream in
+                           equipment._connected_equipments(upstream=False))
+
+    def _solve_connections(self, pull_inlets=True, push_outlets=True):
+        """
+        Internal function to match properties with connected streams.
+        Inlet streams govern inlet properties of the equipment and the equipment
+        governs properties of outlet streams. Clears dirty flags.
+        """
+        connections = []
+        if pull_inlets:
+            connections += [(self._inlet_material_stream_index, 'm', True),
+                            (self._inlet_energy_stream_index, 'e', True)]
+        if push_outlets:
+            connections += [(self._outlet_material_stream_index, 'm', False),
+                            (self._outlet_energy_stream_index, 'e', False)]
+        with _refresh_suspended():
+            for stream_index, stream_type, is_inlet in connections:
+                if stream_index is not None:
+                    self._stream_equipment_properties_matcher(stream_index,
+                                                              stream_type,
+                                                              is_inlet,
+                                                              stream_governed=is_inlet)
+        self._dirty_inlet = self._dirty_outlet = False
+
+    def _refresh_dirty_upstream(self):
+        """
+        Internal function called by derived property getters. Solves dirty
+        equipments upstream of and including this equipment, upstream first.
+        """
+        if (Model.current()._refreshing or
+            not (self._dirty_inlet or self._dirty_outlet)):
+            return
+        order = []
+        visited = set()
+        pending = [(self, False)]
+        while pending:
+            equipment, expanded = pending.pop()
+            if expanded:
+                order.append(equipment)
+                continue
+            if id(equipment) in visited:
+                continue
+            visited.add(id(equipment))
+            pending.append((equipment, True))
+            for upstream in equipment._connected_equipments(upstream=True):
+                if upstream._dirty_inlet or upstream._dirty_outlet:
+                    pending.append((upstream, False))
+        for equipment in order:
+            equipment._solve_connections(equipment._dirty_inlet,
+                                         equipment._dirty_outlet)
+
     def delete(self):
         """ 
         DESCRIPTION:
@@ -1,4 +1,5 @@
 from propylean.equipments.generic_equipment_classes import _Exchangers
+from propylean.registry import _Registry
 from propylean import streams
 from propylean.series import Series
 from propylean import properties as prop
@@ -6,11 +7,10 @@ from propylean.validators import _Validators
 
 # Start of final classes of heat exchangers
 class ShellnTubeExchanger(_Exchangers):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
-        self._index = len(ShellnTubeExchanger.items)
-        ShellnTubeExchanger.items.append(self)
+        self._index = ShellnTubeExchanger.items.add(self)
     
     def __repr__(self):
         return "Shell & Tube Exchanger with tag: " + self.tag   
@@ -22,13 +22,12 @@ class ShellnTubeExchanger(_Exchangers):
         return cls.items
 
 class AirCooler(_Exchangers):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
         self.fan_power = prop.Power() if "fan_power" not in inputs else inputs["fan_power"]
         del self.energy_out
-        self._index = len(AirCooler.items)
-        AirCooler.items.append(self)
+        self._index = AirCooler.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -113,13 +112,12 @@ class AirCooler(_Exchangers):
         return super().disconnect_stream(stream_object, direction, stream_tag, stream_type)
 
 class ElectricHeater(_Exchangers):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
         self.power = prop.Power() if "power" not in inputs else inputs["power"]
         del self.energy_out
-        self._index = len(ElectricHeater.items)
-        ElectricHeater.items.append(self)
+        self._index = ElectricHeater.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
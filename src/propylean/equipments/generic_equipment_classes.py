@@ -2,11 +2,12 @@ from propylean.equipments.abstract_equipment_classes import _EquipmentOneInletOu
 import propylean.properties as prop
 from propylean.constants import Constants
 from propylean.settings import Settings
-from propylean.series import Series
+from propylean.series import Series, _elementwise
+from propylean.properties import PropertyArray
 from pandas import DataFrame
 from propylean.validators import _Validators
-from math import pi, sqrt, acos
-import fluids.compressible as compressible_fluid
+from math import pi, sqrt
+import numpy as np
 from warnings import warn
 
 # Defining generic class for all types of pressure changers like Pumps, Compressors and Expanders.
@@ -37,8 +38,9 @@ class _PressureChangers(_EquipmentOneInletOutlet):
                     Type: pandas DataFrame
                     Acceptable values: Non-negative integer in dataframe with flow and head values.
                     Default value: pandas.DataFrame()    
-                    Description: Performance curve of the pump. 
-                                 E.g. pd.DataFrame([{'flow':[2, 10, 30, 67], 'head':[45, 20, 10, 2]}]) 
+                    Description: Performance curve of the pump. First column is volumetric
+                                 flow in m^3/h and second is head in m.
+                                 E.g. pd.DataFrame({'flow':[2, 10, 30, 67], 'head':[45, 20, 10, 2]}) 
 
             RETURN VALUE:
                 Type: _PressureChangers
@@ -75,7 +77,7 @@ class _PressureChangers(_EquipmentOneInletOutlet):
                  
         self._performance_curve = DataFrame()
         if 'performance_curve' in inputs:
-            self.performace_curve = inputs['performance_curve']
+            self.performance_curve = inputs['performance_curve']
         
         self.efficiency = 1 if 'efficiency' not in inputs else inputs['efficiency']
         
@@ -95,23 +97,28 @@ class _PressureChangers(_EquipmentOneInletOutlet):
     
     @property
     def differential_pressure(self):
-        return prop.Pressure(-1 * self.pressure_drop.value,
-                             self.pressure_drop.unit)
+        pressure_drop = self.pressure_drop
+        if isinstance(pressure_drop, (Series, PropertyArray)):
+            return -pressure_drop
+        return prop.Pressure(-1 * pressure_drop.value, pressure_drop.unit)
     @differential_pressure.setter
     def differential_pressure(self, value):
-        _Validators.validate_arg_prop_value_type("differential_pressure", value, (prop.Pressure, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("differential_pressure", value, (prop.Pressure, int, float, tuple, Series, PropertyArray))
         _Validators.validate_non_negative_value("differential_pressure", value)
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, prop.Pressure)
         if unit is None:
             unit = self.pressure_drop.unit
-        self.pressure_drop = prop.Pressure(-1 * value, unit) if not isinstance(value, Series) else value
+        if isinstance(value, (Series, PropertyArray)):
+            self.pressure_drop = -value
+        else:
+            self.pressure_drop = prop.Pressure(-1 * value, unit)
         self._update_equipment_object(self)   
     
     @property
     def performance_curve(self):
         self = self._get_equipment_object(self)
-        return self._perfomace_curve
+        return self._performance_curve
     @performance_curve.setter
     def performance_curve(self,value):
         _Validators.validate_arg_prop_value_type("performance_curve", value, DataFrame)
@@ -148,12 +155,12 @@ class _PressureChangers(_EquipmentOneInletOutlet):
         return self._power
     @power.setter
     def power(self, value):
-        _Validators.validate_arg_prop_value_type("power", value, (prop.Power, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("power", value, (prop.Power, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, prop.Power)
         if unit is None:
             unit = self._power.unit         
-        self._power = prop.Power(value, unit) if not isinstance(value, Series) else value
+        self._power = prop.Power(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._update_equipment_object(self)  
 
 # Defining generic class for Compressors and Expanders.
@@ -223,6 +230,7 @@ class _GasPressureChangers(_PressureChangers):
     @property
     def temperature_change(self):
         self = self._get_equipment_object(self)
+        import fluids.compressible as compressible_fluid
         k = self.polytropic_exponent
         if (self._inlet_material_stream_index is not None or
             self._outlet_material_stream_index is not None):
@@ -231,16 +239,15 @@ class _GasPressureChangers(_PressureChangers):
             if Settings.compression_process.lower() == "polytropic":
                 k = compressible_fluid.polytropic_exponent(k=k, eta_p=self.polytropic_efficiency)
 
-        T1 = self.inlet_temperature
-        P1 = self.inlet_pressure
-        P2 = self.outlet_pressure
-        T1.unit = "K"
-        P1.unit = P2.unit ="Pa"
+        T1 = self.inlet_temperature.to_unit("K")
+        P1 = self.inlet_pressure.to_unit("Pa")
+        P2 = self.outlet_pressure.to_unit("Pa")
         eta = self.efficiency.value
-        value = prop.Temperature(compressible_fluid.isentropic_T_rise_compression(T1.value, P1.value, P2.value, k, eta))
-        value = value - T1
-        value.unit = self.inlet_temperature.unit
-        return value
+        T2 = compressible_fluid.isentropic_T_rise_compression(T1.value, P1.value, P2.value, k, eta)
+        # Change in temperature scales without offset.
+        unit = self.inlet_temperature.unit
+        factor, _ = prop.Temperature._unit_conversion("K", unit)
+        return prop.Temperature((T2 - T1.value) * factor, unit)
 
     @property
     def efficiency(self):
@@ -286,6 +293,7 @@ class _GasPressureChangers(_PressureChangers):
     @property
     def polytropic_efficiency(self):
         self = self._get_equipment_object(self)
+        import fluids.compressible as compressible_fluid
         if (self._inlet_material_stream_index is not None or
             self._outlet_material_stream_index is not None):
             is_inlet = False if self._inlet_material_stream_index is None else True
@@ -302,6 +310,7 @@ class _GasPressureChangers(_PressureChangers):
         _Validators.validate_arg_prop_value_type("polytropic_efficiency", value, (int, float, prop.Efficiency))
         value, _ = self._tuple_property_value_unit_returner(value, prop.Efficiency)
         self = self._get_equipment_object(self)
+        import fluids.compressible as compressible_fluid
         is_inlet = False if self._intlet_material_stream_index is None else True
         isentropic_exponent = self._connected_stream_property_getter(is_inlet, "material", "isentropic_exponent")
         self.adiabatic_efficiency = compressible_fluid.isentropic_efficiency(P1 = self._inlet_pressure.value,
@@ -313,6 +322,7 @@ class _GasPressureChangers(_PressureChangers):
     @property
     def polytropic_exponent(self):
         self = self._get_equipment_object(self)
+        import fluids.compressible as compressible_fluid
         if (self._inlet_material_stream_index is None and
             self._outlet_material_stream_index is None):
             return self._polytropic_exponent
@@ -333,6 +343,7 @@ class _GasPressureChangers(_PressureChangers):
     @property
     def power(self):
         self = self._get_equipment_object(self)
+        import fluids.compressible as compressible_fluid
         is_inlet = False if self._inlet_material_stream_index is None else True
         isentropic_exponent = self._connected_stream_property_getter(is_inlet, "material", "isentropic_exponent")
         Z = self._connected_stream_property_getter(is_inlet, "material", "Z_g")
@@ -356,15 +367,12 @@ class _GasPressureChangers(_PressureChangers):
         else:
             ratio = (self.polytropic_exponent - 1)/self.polytropic_exponent
         
-        P1 = self.inlet_pressure
-        P2 = self.outlet_pressure
-        P1.unit = "Pa"
-        P2.unit = "Pa"
+        P1 = self.inlet_pressure.to_unit("Pa")
+        P2 = self.outlet_pressure.to_unit("Pa")
         Zi = self._connected_stream_property_getter(True, "material", "Z_g")
         Zo = self._connected_stream_property_getter(False, "material", "Z_g")
         Z = (Zi + Zo)/2
-        T1 = self.inlet_temperature
-        T1.unit = "K"
+        T1 = self.inlet_temperature.to_unit("K")
         MW = self._connected_stream_property_getter(True, "material", "molecular_weight")
         head = Z * Constants.R * T1.value * (pow((P2.value/P1.value), ratio) - 1)/(ratio * MW.value)
         head_max_value = Z * Constants.R * T1.max_val * (pow((P2.max_val/P1.min_val), ratio) - 1)/(ratio * MW.value)
@@ -766,16 +774,16 @@ class _Vessels(_EquipmentOneInletOutlet):
              self._outlet_energy_stream_index is not None) and 
              self.main_fluid == "liquid"):
             is_inlet = False if self._inlet_material_stream_index is None else True
-            density = self._connected_stream_property_getter(is_inlet, "material", "density")
-            density.unit = "kg/m^3"
-            pd = density.value * g * self.liquid_level.value
-            pd_min = density.min_value * g * self.liquid_level.min_val
-            pd_max = density.max_value * g * self.liquid_level.max_val
+            density = self._connected_stream_property_getter(is_inlet, "material", "density").to_unit("kg/m^3")
+            liquid_level = self.liquid_level.to_unit("m")
+            pd = density.value * g * liquid_level.value
+            pd_min = density.min_val * g * liquid_level.min_val
+            pd_max = density.max_val * g * liquid_level.max_val
             return prop.Pressure(value=pd, min_val=pd_min, max_val=pd_max)
         return self._pressure_drop
     @pressure_drop.setter
     def pressure_drop(self, value):
-        _Validators.validate_arg_prop_value_type("pressure_drop", value, (prop.Pressure, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("pressure_drop", value, (prop.Pressure, int, float, tuple, Series, PropertyArray))
         if ((self._inlet_energy_stream_index is not None or
              self._outlet_energy_stream_index is not None) and 
              self.main_fluid == "liquid"):
@@ -784,7 +792,7 @@ class _Vessels(_EquipmentOneInletOutlet):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Pressure)
         if unit is None:
             unit = self._pressure_drop.unit
-        self._pressure_drop = prop.Pressure(value, unit) if not isinstance(value, Series) else value
+        self._pressure_drop = prop.Pressure(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._outlet_pressure =  self._inlet_pressure - self._pressure_drop
         self._update_equipment_object(self)
                
@@ -793,7 +801,7 @@ class _Vessels(_EquipmentOneInletOutlet):
         return self.inlet_pressure
     @operating_pressure.setter
     def operating_pressure(self, value):
-        _Validators.validate_arg_prop_value_type("operating_pressure", value, (prop.Pressure, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("operating_pressure", value, (prop.Pressure, int, float, tuple, Series, PropertyArray))
         self.inlet_pressure = value
         if self.blanketing is not None:
             self.blanketing.inlet_pressure = value
@@ -803,7 +811,7 @@ class _Vessels(_EquipmentOneInletOutlet):
         return self.inlet_temperature
     @operating_temperature.setter
     def operating_temperature(self, value):
-        _Validators.validate_arg_prop_value_type("operating_temperature", value, (prop.Temperature, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("operating_temperature", value, (prop.Temperature, int, float, tuple, Series, PropertyArray))
         self.inlet_temperature = value
         if self.blanketing is not None:
             self.blanketing.inlet_temperature = value
@@ -836,35 +844,37 @@ class _Vessels(_EquipmentOneInletOutlet):
         return self._liquid_level
     @liquid_level.setter
     def liquid_level(self, value):
-        _Validators.validate_arg_prop_value_type("liquid_level", value, (prop.Length, int, float, tuple, Series))
+        _Validators.validate_arg_prop_value_type("liquid_level", value, (prop.Length, int, float, tuple, Series, PropertyArray))
         self = self._get_equipment_object(self)
         value, unit = self._tuple_property_value_unit_returner(value, prop.Length)
         if unit is None:
             unit = self._liquid_level.unit
-        self._liquid_level = prop.Length(value, unit) if not isinstance(value, Series) else value
+        self._liquid_level = prop.Length(value, unit) if not isinstance(value, (Series, PropertyArray)) else value
         self._update_equipment_object(self)
 
     def get_inventory(self, type="volume"):
         _Validators.validate_arg_prop_value_type("type", type, str)
         _Validators.validate_arg_prop_value_list("type", type, ["volume", "mass"])
         self = self._get_equipment_object(self)
+        # Volume is calculated from liquid level in unit of ID elementwise, so
+        # Series liquid levels are calculated as batches, in Spark if Spark-backed.
+        # _liquid_volume_function of every vessel type returns function using only
+        # dimensions of the vessel, so that it can be sent to Spark executors.
+        liquid_volume = self._liquid_volume_function()
         if self.main_fluid == "gas":
-            if type == "volume":
-                liquid_volume = self._get_liquid_volume()
-                gas_volume = self.vessel_volume - liquid_volume
-                return gas_volume 
-            else:
-                is_inlet = False if self._inlet_material_stream_index is None else True
-                density = self._connected_stream_property_getter(is_inlet, "material", "density_g")
-                return prop.Mass(self.inventory().value * density) 
+            vessel_volume = self.vessel_volume.to_unit("m^3").value
+            volume = lambda level: vessel_volume - liquid_volume(level)
         else:
-            if type == "volume":
-                return self._get_liquid_volume()
-            else:
-                is_inlet = False if self._inlet_material_stream_index is None else True
-                density = self._connected_stream_property_getter(is_inlet, "material", "density_l")
-                mass = self._get_liquid_volume().value * density.value
-    
+            volume = liquid_volume
+        level = self.liquid_level.to_unit(self.ID.unit)
+        if type == "volume":
+            return _elementwise(volume, [level], prop.Volume, "m^3")
+        is_inlet = False if self._inlet_material_stream_index is None else True
+        density = self._connected_stream_property_getter(is_inlet, "material",
+                                                         "density_g" if self.main_fluid == "gas" else "density_l")
+        return _elementwise(lambda level, density: volume(level) * density,
+                            [level, density.to_unit("kg/m^3")], prop.Mass, "kg")
+
 class _VerticalVessels(_Vessels):
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
@@ -885,20 +895,16 @@ class _VerticalVessels(_Vessels):
             head_volume = 0.9 * 4 * pi * Rc * Rc * z / 3
         return prop.Volume(head_volume) 
 
-    def _get_cylinder_volume(self):
-        volume = pi * self.ID.value**2 * self.liquid_level.value / 4
-        return prop.Volume(volume)
-    
-    def _get_liquid_volume(self):
-        head_volume = self._get_head_volume()
-        cylinder_volume = self._get_cylinder_volume()
-        return cylinder_volume + head_volume
+    def _liquid_volume_function(self):
+        area = pi * self.ID.value**2 / 4
+        head_volume = self._get_head_volume().value
+        return lambda H: area * H + head_volume
 
 class _HorizontalVessels(_Vessels):
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
     
-    def _get_head_volume(self):
+    def _get_head_coefficient(self):
         self = self._get_equipment_object(self)
         C = 0
         if self.head_type == "hemispherical":
@@ -909,33 +915,22 @@ class _HorizontalVessels(_Vessels):
             Rk = 3 * self.thickness.value
             t_by_Dext = self.thickness/self.OD
             C = 0.30939 + 1.7197 * (Rk - 0.06 * self.OD.value)/self.ID.value - 0.16116 * t_by_Dext + 0.98997 * t_by_Dext**2
-        head_volume = self._get_head_volume_by_type(C)
-        return prop.Volume(head_volume) 
-    
-    def _get_head_volume_by_type(self, C):
-        head_volume = (self.ID.value ** 3) * pi 
-        H_by_ID = self.liquid_level / self.ID
-        head_volume *= 3 * H_by_ID**2 - 2 * H_by_ID**3
-        head_volume /= 12
-        head_volume *= C
-        return head_volume
+        return C
 
-    def _get_cylinder_volume(self):
+    def _liquid_volume_function(self):
         self = self._get_equipment_object(self)
-        volume = 0
-        # alpha = cos-1(1-H/R)
-        R = self.ID.value / 2
-        H = self.liquid_level.value
+        C = self._get_head_coefficient()
+        D = self.ID.value
+        R = D / 2
         L = self.length.value
-        radians = 1 - H / R
-        alpha = acos(radians)
-        volume = L * ((R ** 2) * alpha - (R - H) * sqrt(2*R*H - H*H))
-        return prop.Volume(volume)
-    
-    def _get_liquid_volume(self):
-        head_volume = self._get_head_volume()
-        cylinder_volume = self._get_cylinder_volume()
-        return cylinder_volume + head_volume + head_volume
+        def liquid_volume(H):
+            # alpha = cos-1(1-H/R)
+            alpha = np.arccos(1 - H / R)
+            cylinder_volume = L * ((R ** 2) * alpha - (R - H) * np.sqrt(2*R*H - H*H))
+            H_by_ID = H / D
+            head_volume = C * (D ** 3) * pi * (3 * H_by_ID**2 - 2 * H_by_ID**3) / 12
+            return cylinder_volume + head_volume + head_volume
+        return liquid_volume
 
 class _SphericalVessels(_Vessels):
     def __init__(self, **inputs) -> None:
@@ -949,18 +944,17 @@ class _SphericalVessels(_Vessels):
         D = self.ID.value
         volume = 2 * self._get_hemisphere_volume(D, D/2)
         return prop.Volume(volume)
-    def _get_liquid_volume(self):
+
+    def _liquid_volume_function(self):
         self = self._get_equipment_object(self)
-        H = self.liquid_level.value
         D = self.ID.value
-        if H <= D/2:
-            volume = self._get_hemisphere_volume(D, H)
-        else:
-            volume = self._get_hemisphere_volume(D, D/2)
-            volume -=  self._get_hemisphere_volume(D, H)
-        return prop.Volume(volume)
+        hemisphere_volume = _SphericalVessels._get_hemisphere_volume
+        return lambda H: np.where(H <= D/2,
+                                  hemisphere_volume(D, H),
+                                  hemisphere_volume(D, D/2) - hemisphere_volume(D, H))
     
-    def _get_hemisphere_volume(self, D, H):
+    @staticmethod
+    def _get_hemisphere_volume(D, H):
         return pi * H**2 *(1.5 * D - H) / 3
 
 class _Blanketing(_EquipmentOneInletOutlet):
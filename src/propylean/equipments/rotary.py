@@ -1,15 +1,21 @@
 from propylean.equipments.generic_equipment_classes import _PressureChangers, _GasPressureChangers
+from propylean.equipments import abstract_equipment_classes as equipment_classes
+from propylean.equipments.static import PipeSegment
+from propylean.instruments.control import ControlValve
+from propylean.registry import _Registry
 from propylean import streams
 import propylean.properties as prop
 from propylean.constants import Constants
-from propylean.series import Series
+from propylean.series import Series, _elementwise
 
 from math import pow
+import numpy as np
+from pandas import DataFrame
 from propylean.validators import _Validators
 
 # Start of final classes of pumps.
 class CentrifugalPump(_PressureChangers):
-    items = []    
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         """ 
         DESCRIPTION:
@@ -74,8 +80,7 @@ class CentrifugalPump(_PressureChangers):
         if "NPSHr" in inputs:
             self.NPSHr = inputs['NPSHr']
         
-        self._index = len(CentrifugalPump.items)
-        CentrifugalPump.items.append(self)
+        self._index = CentrifugalPump.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -116,27 +121,23 @@ class CentrifugalPump(_PressureChangers):
         self = self._get_equipment_object(self)
         if self._inlet_material_stream_tag is None:
             raise Exception("Pump should be connected with MaterialStream at the inlet")
-        density = self._connected_stream_property_getter(True, "material", "density")
-        density.unit = "kg/m^3"
-        old_p_unit = self.inlet_pressure.unit
-        self.inlet_pressure.unit = 'Pa'
-        value = self.inlet_pressure.value/(Constants.g * density.value)
-        self.inlet_pressure.unit = old_p_unit
+        density = self._connected_stream_property_getter(True, "material", "density").to_unit("kg/m^3")
+        inlet_pressure = self.inlet_pressure.to_unit('Pa')
+        value = inlet_pressure.value/(Constants.g * density.value)
         return prop.Length(value, "m")
 
     @property
     def head(self):
         self = self._get_equipment_object(self)
+        self._refresh_dirty_upstream()
         if (self._outlet_material_stream_tag is None and
             self._inlet_material_stream_tag is None):
             raise Exception("Pump should be connected with MaterialStream either at inlet or outlet")
         is_inlet = False if self._inlet_material_stream_index is None else True
-        density = self._connected_stream_property_getter(is_inlet, "material", "density")
-        density.unit = "kg/m^3"
-        dp = self.differential_pressure
-        dp.unit = "Pa"
-        value = dp.value / (Constants.g * density.value)
-        return prop.Length(value, "m")
+        density = self._connected_stream_property_getter(is_inlet, "material", "density").to_unit("kg/m^3")
+        dp = self.differential_pressure.to_unit("Pa")
+        return _elementwise(lambda dp, density: dp / (Constants.g * density),
+                            [dp, density], prop.Length, "m")
     @property
     def hydraulic_power(self):
         self = self._get_equipment_object(self)
@@ -144,18 +145,16 @@ class CentrifugalPump(_PressureChangers):
             self._inlet_material_stream_tag is None):
             raise Exception("Centrifugal Pump should be connected with MaterialStream either at inlet or outlet")
         is_inlet = False if self._inlet_material_stream_index is None else True
-        vol_flowrate = self._connected_stream_property_getter(is_inlet, "material", "vol_flowrate")
-        vol_flowrate.unit = "m^3/h"
-        dp = self.differential_pressure
-        dp.unit = "Pa"
-        value = vol_flowrate.value * dp.value / (3.6e3)
-        return prop.Power(value, 'W')
+        vol_flowrate = self._connected_stream_property_getter(is_inlet, "material", "vol_flowrate").to_unit("m^3/h")
+        dp = self.differential_pressure.to_unit("Pa")
+        return _elementwise(lambda vol_flowrate, dp: vol_flowrate * dp / (3.6e3),
+                            [vol_flowrate, dp], prop.Power, "W")
     @property
     def power(self):
         self = self._get_equipment_object(self)
-        self.hydraulic_power.unit = "W"
-        value = self.hydraulic_power.value / self.efficiency.value
-        return prop.Power(value, "W")
+        hydraulic_power = self.hydraulic_power.to_unit("W")
+        return _elementwise(lambda hydraulic_power, efficiency: hydraulic_power / efficiency,
+                            [hydraulic_power, self.efficiency], prop.Power, "W")
     @power.setter
     def power(self, value):
         #TODO Proived setting feature for power
@@ -207,9 +206,163 @@ class CentrifugalPump(_PressureChangers):
             stream_type = "e"
         return super().disconnect_stream(stream_object, direction, stream_tag, stream_type)
 
+    def operating_point(self, valve_openings=1, speeds=1,
+                        source_pressure=None, destination_pressure=None):
+        """
+        DESCRIPTION:
+            Calculates operating point of the pump, that is intersection of the pump
+            curve interpolated from performance_curve and the system curve of the circuit.
+            Circuit is the chain of equipments connected with MaterialStreams upstream
+            and downstream of the pump. PipeSegments and ControlValves of the circuit
+            form the system curve. Pressure drops of other equipments are taken as constant.
+            Operating points for arrays of valve openings and speeds are calculated
+            together in one call.
+
+        PARAMETERS:
+            valve_openings:
+                Required: No
+                Type: int or float or array-like
+                Acceptable values: Positive values
+                Default value: 1
+                Description: Flow coefficient of ControlValves in the circuit relative to
+                             their present flow coefficient (Cv property).
+            
+            speeds:
+                Required: No
+                Type: int or float or array-like
+                Acceptable values: Positive values
+                Default value: 1
+                Description: Pump speed relative to speed of the performance_curve.
+                             Curve is scaled with affinity laws. Broadcasted with valve_openings.
+            
+            source_pressure:
+                Required: No
+                Type: int or float or tuple or Pressure
+                Default value: Pressure of the MaterialStream at start of the circuit.
+            
+            destination_pressure:
+                Required: No
+                Type: int or float or tuple or Pressure
+                Default value: Pressure of the MaterialStream at end of the circuit.
+
+        RETURN VALUE:
+            Type: pandas.DataFrame
+            Description: One row per case with columns 'valve_opening', 'speed', 'flow' (m^3/h),
+                         'head' (m), 'differential_pressure' (Pa) and 'hydraulic_power' (W).
+                         Flow and others are NaN where curves do not intersect.
+        
+        ERROR RAISED:
+            Type: Exception
+            Description: If performance_curve is not provided or pump is not connected
+                         with MaterialStream at inlet.
+
+        SAMPLE USE CASES:
+            >>> pump.performance_curve = pd.DataFrame({'flow': [0, 100, 200], 'head': [60, 55, 40]})
+            >>> pump.operating_point(valve_openings=np.linspace(0.2, 1, 9))
+        """
+        self = self._get_equipment_object(self)
+        curve = self.performance_curve
+        if curve.shape[0] < 2:
+            raise Exception("Provide performance_curve of the pump to calculate operating point.")
+        if self._inlet_material_stream_index is None:
+            raise Exception("Pump should be connected with MaterialStream at the inlet")
+        curve = curve.sort_values(curve.columns[0])
+        curve_flow = curve.iloc[:, 0].to_numpy(dtype=float) / 3600
+        curve_head = curve.iloc[:, 1].to_numpy(dtype=float)
+        openings, speeds = np.broadcast_arrays(np.asarray(valve_openings, dtype=float),
+                                               np.asarray(speeds, dtype=float))
+        openings, speeds = openings.ravel(), speeds.ravel()
+
+        density = self._connected_stream_property_getter(True, "material", "density").to_unit("kg/m^3").value
+        viscosity = self._connected_stream_property_getter(True, "material", "d_viscosity").to_unit("Pa-s").value
+        upstream, source_stream = self._circuit(upstream=True)
+        downstream, destination_stream = self._circuit(upstream=False)
+        if source_pressure is None:
+            source_pressure = source_stream.pressure
+        if destination_pressure is None:
+            if destination_stream is None:
+                raise Exception("Provide destination_pressure. Circuit has no MaterialStream at the end.")
+            destination_pressure = destination_stream.pressure
+        static_dp = (self._pressure_in_Pa(destination_pressure) -
+                     self._pressure_in_Pa(source_pressure))
+        pipes, valve_Kvs = [], []
+        for equipment in upstream + downstream:
+            if isinstance(equipment, PipeSegment):
+                pipes.append(equipment)
+            elif isinstance(equipment, ControlValve):
+                valve_Kvs.append(equipment.Cv)
+            else:
+                static_dp += equipment.pressure_drop.to_unit("Pa").value
+        
+        def system_dp(flow):
+            dp = static_dp + sum(pipe._pressure_drops(flow, density, viscosity) for pipe in pipes)
+            for Kv in valve_Kvs:
+                # Liquid valve equation, dp in bar = SG * (Q in m^3/h / Kv)^2
+                dp = dp + density / 1000 * (flow * 3600 / (openings * Kv))**2 * 1e5
+            return dp
+
+        def excess_dp(flow):
+            pump_dp = density * Constants.g * speeds**2 * np.interp(flow / speeds, curve_flow, curve_head)
+            return pump_dp - system_dp(flow)
+
+        low = np.zeros(len(openings))
+        high = speeds * curve_flow[-1]
+        has_intersection = (excess_dp(low) >= 0) & (excess_dp(high) <= 0)
+        for _ in range(60):
+            middle = (low + high) / 2
+            is_below = excess_dp(middle) > 0
+            low = np.where(is_below, middle, low)
+            high = np.where(is_below, high, middle)
+        flow = np.where(has_intersection, (low + high) / 2, np.nan)
+        head = speeds**2 * np.interp(flow / speeds, curve_flow, curve_head)
+        differential_pressure = density * Constants.g * head
+        return DataFrame({"valve_opening": openings,
+                          "speed": speeds,
+                          "flow": flow * 3600,
+                          "head": head,
+                          "differential_pressure": differential_pressure,
+                          "hydraulic_power": flow * differential_pressure})
+
+    def _circuit(self, upstream):
+        """
+        Internal function to get equipments connected in chain with MaterialStreams
+        upstream or downstream of the pump, excluding the pump, and the MaterialStream
+        at the end of the chain.
+        """
+        stream_map = equipment_classes._material_stream_equipment_map
+        equipments = []
+        visited = {id(self)}
+        equipment = self
+        while True:
+            if upstream:
+                stream_index = equipment._inlet_material_stream_index
+                e_index, e_type = 0, 1
+            else:
+                stream_index = equipment._outlet_material_stream_index
+                e_index, e_type = 2, 3
+            if stream_index is None:
+                return equipments, None
+            mapping = stream_map.get(stream_index)
+            if mapping is None or mapping[e_index] is None:
+                return equipments, streams.MaterialStream.items[stream_index]
+            equipment = mapping[e_type].items[mapping[e_index]]
+            if id(equipment) in visited:
+                raise Exception("Pump circuit has a recycle. Operating point calculation not possible.")
+            visited.add(id(equipment))
+            equipments.append(equipment)
+
+    @staticmethod
+    def _pressure_in_Pa(value):
+        _Validators.validate_arg_prop_value_type("pressure", value, (prop.Pressure, int, float, tuple))
+        if isinstance(value, tuple):
+            value = prop.Pressure(*value)
+        elif not isinstance(value, prop.Pressure):
+            value = prop.Pressure(value)
+        return value.to_unit("Pa").value
+
 
 class PositiveDisplacementPump(_PressureChangers):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         """ 
         DESCRIPTION:
@@ -269,8 +422,7 @@ class PositiveDisplacementPump(_PressureChangers):
             self.NPSHr = inputs['NPSHr']
         del self.energy_out
 
-        self._index = len(PositiveDisplacementPump.items)
-        PositiveDisplacementPump.items.append(self)
+        self._index = PositiveDisplacementPump.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -283,15 +435,10 @@ class PositiveDisplacementPump(_PressureChangers):
         self = self._get_equipment_object(self)
         if self._inlet_material_stream_tag is None:
             raise Exception("Pump should be connected with MaterialStream at the inlet")
-        density = self._connected_stream_property_getter(True, "material", "density")
-        density.unit = "kg/m^3"
-        old_p_unit = self.inlet_pressure.unit
-        old_acc_head_unit = self.accel_head.unit
-        self.inlet_pressure.unit = self.accel_head = 'Pa'
-        
-        value = (self.inlet_pressure.value - self.accel_head.value)/(Constants.g * density.value)
-        self.inlet_pressure.unit = old_p_unit
-        self.accel_head.unit = old_acc_head_unit
+        density = self._connected_stream_property_getter(True, "material", "density").to_unit("kg/m^3")
+        inlet_pressure = self.inlet_pressure.to_unit('Pa')
+        # Pressure head at inlet less acceleration head, both in m.
+        value = inlet_pressure.value/(Constants.g * density.value) - self.accel_head.to_unit('m').value
         return prop.Length(value, "m")
     @property
     def NPSHr(self):
@@ -310,22 +457,20 @@ class PositiveDisplacementPump(_PressureChangers):
     @property
     def head(self):
         self = self._get_equipment_object(self)
+        self._refresh_dirty_upstream()
         if (self._outlet_material_stream_tag is None and
             self._inlet_material_stream_tag is None):
             raise Exception("Pump should be connected with MaterialStream either at inlet or outlet")
         is_inlet = False if self._inlet_material_stream_index is None else True
-        density = self._connected_stream_property_getter(is_inlet, "material", "density")
-        density.unit = "kg/m^3"
-        dp = self.differential_pressure
-        dp.unit = "Pa"
-        value = dp.value / (Constants.g * density.value)
-        return prop.Length(value, "m")
+        density = self._connected_stream_property_getter(is_inlet, "material", "density").to_unit("kg/m^3")
+        dp = self.differential_pressure.to_unit("Pa")
+        return _elementwise(lambda dp, density: dp / (Constants.g * density),
+                            [dp, density], prop.Length, "m")
     
     @property
     def accel_head(self):
         L, V = self._get_suction_length_velocity()
-        density = self._connected_stream_property_getter(True, "material", "density")
-        density.unit = "kg/m^3"
+        density = self._connected_stream_property_getter(True, "material", "density").to_unit("kg/m^3")
         SG = density.value/1000
         k = 1
         head_loss = L.value * V.value * self.speed * SG / (k * Constants.g)
@@ -335,11 +480,9 @@ class PositiveDisplacementPump(_PressureChangers):
     def power(self):
         self = self._get_equipment_object(self)
         is_inlet = False if self._inlet_material_stream_index is None else True
-        vol_flow = self._connected_stream_property_getter(is_inlet, "material", "vol_flowrate")
-        vol_flow.unit = "gal/min"
-        old_dp_unit = self.differential_pressure.unit
-        self.differential_pressure.unit = 'psi'
-        value = vol_flow.value * self.differential_pressure.value /(1714 * self.efficiency.value)
+        vol_flow = self._connected_stream_property_getter(is_inlet, "material", "vol_flowrate").to_unit("gal/min")
+        differential_pressure = self.differential_pressure.to_unit('psi')
+        value = vol_flow.value * differential_pressure.value /(1714 * self.efficiency.value)
         return prop.Power(value, "hp")
     @power.setter
     def power(self, value):
@@ -394,7 +537,7 @@ class PositiveDisplacementPump(_PressureChangers):
 
 # Start of final classes of Compressors and TurboExpanders.
 class CentrifugalCompressor(_GasPressureChangers):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         """ 
         DESCRIPTION:
@@ -455,8 +598,7 @@ class CentrifugalCompressor(_GasPressureChangers):
         """
         super().__init__( **inputs)
         del self.energy_out
-        self._index = len(CentrifugalCompressor.items)
-        CentrifugalCompressor.items.append(self)
+        self._index = CentrifugalCompressor.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -518,12 +660,11 @@ class CentrifugalCompressor(_GasPressureChangers):
         return super().disconnect_stream(stream_object, direction, stream_tag, stream_type)
 
 class TurboExpander(_GasPressureChangers):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
         del self.energy_in
-        self._index = len(TurboExpander.items)
-        TurboExpander.items.append(self)
+        self._index = TurboExpander.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -1,14 +1,14 @@
 from propylean.equipments.generic_equipment_classes import _VerticalVessels, _HorizontalVessels
+from propylean.registry import _Registry
 from propylean.settings import Settings
 from propylean.constants import Constants
 from propylean import properties as prop
 
 class VerticalSeparator(_VerticalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
-        self._index = len(VerticalSeparator.items)
-        VerticalSeparator.items.append(self)
+        self._index = VerticalSeparator.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -21,11 +21,10 @@ class VerticalSeparator(_VerticalVessels):
         return cls.items
 
 class HorizontalSeparator(_HorizontalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
-        self._index = len(HorizontalSeparator.items)
-        HorizontalSeparator.items.append(self)
+        self._index = HorizontalSeparator.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -38,11 +37,10 @@ class HorizontalSeparator(_HorizontalVessels):
         return cls.items
 
 class Column(_VerticalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
-        self._index = len(Column.items)
-        Column.items.append(self)
+        self._index = Column.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -55,8 +53,7 @@ class Column(_VerticalVessels):
         return cls.items
 
 class FlareKOD(_HorizontalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
-        self._index = len(FlareKOD.items)
-        FlareKOD.items.append(self)
\ No newline at end of file
+        self._index = FlareKOD.items.add(self)
\ No newline at end of file
@@ -1,14 +1,19 @@
 from propylean.equipments.generic_equipment_classes import _EquipmentOneInletOutlet
+from propylean.friction import friction_factor
+from propylean.properties import PropertyArray
+from propylean.series import Series
+from propylean.registry import _Registry
 from propylean.settings import Settings
 from propylean.constants import Constants
 from propylean import properties as prop
-from math import pi
+from math import pi, isnan
+import numpy as np
 import pandas as pd
 from propylean.validators import _Validators
 from propylean.constants import Constants
 
 class PipeSegment(_EquipmentOneInletOutlet):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         """ 
         DESCRIPTION:
@@ -116,12 +121,9 @@ class PipeSegment(_EquipmentOneInletOutlet):
         self._elevation = prop.Length(0)
         self._segment_type = 1
         self._material = 1
-        from pandas import DataFrame
-        self._segment_frame = DataFrame()
-        self._segment_obj_list = None
+        self._segment_frame = None
         
         if 'segment_frame' not in inputs:
-            del self.segment_frame
             self.segment_type = 1 if 'segment_type' not in inputs else inputs['segment_type']
             if self.segment_type == 1:
                 if 'length' in inputs:
@@ -151,13 +153,11 @@ class PipeSegment(_EquipmentOneInletOutlet):
             
         else:
             self.segment_frame = inputs['segment_frame']   
-            self._segment_obj_list = []                                     
             del self.ID
             del self.OD
             del self.material
             del self.segment_type
-        self._index = len(PipeSegment.items)
-        PipeSegment.items.append(self)
+        self._index = PipeSegment.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -178,7 +178,7 @@ class PipeSegment(_EquipmentOneInletOutlet):
     @segment_frame.deleter
     def segment_frame(self):
         self = self._get_equipment_object(self)
-        del self._segment_frame
+        self._segment_frame = None
         self._update_equipment_object(self)
 
     @property
@@ -197,30 +197,41 @@ class PipeSegment(_EquipmentOneInletOutlet):
     @property
     def equivalent_length(self):
         self = self._get_equipment_object(self)
-        ID = self.ID
-        ID.unit = 'm'
-        if self.material==5:
-            Le_by_D = Constants.Le_BY_D["plastic"]
-            if self.segment_type in range(13, 15):
-                Le_by_D = Constants.REDUCER_Le_BY_D_PLASTIC
-            else:
-                Le_by_D = Constants.REDUCER_Le_BY_D_STEEL
-        else:
-            Le_by_D = Constants.Le_BY_D["steel"]
         if self.segment_type == 1:
-            equivalent_length = self.length
-        elif self.segment_type in range(2, 12):
-            equivalent_length = Le_by_D[self.segment_type-2] * ID.value
-            equivalent_length = prop.Length(equivalent_length)
-        elif self.segment_type in range(12, 14):
-            ratio = int(10*self._shape[1]/self._shape[0])
-            if ratio > 9:
-                ratio = 9
-            elif ratio < 4:
-                ratio = 4
-            equivalent_length = Le_by_D[ratio] * self._shape[0]
-            equivalent_length = prop.Length(equivalent_length)
-        return equivalent_length
+            return self.length
+        shape_ratio = 0
+        if self.segment_type in range(12, 14):
+            shape_ratio = self._shape[1]/self._shape[0]
+        equivalent_length = self._equivalent_lengths(np.array([self.segment_type]),
+                                                     np.array([self.ID.to_unit('m').value]),
+                                                     np.array([0.0]),
+                                                     np.array([self.material]),
+                                                     np.array([shape_ratio]))
+        return prop.Length(float(equivalent_length[0]))
+    
+    @staticmethod
+    def _equivalent_lengths(segment_type, ID, length, material, shape_ratio):
+        """
+        Internal function to get equivalent lengths (in m) of segments from arrays of
+        segment types, IDs (in m), lengths (in m), materials and shape ratios
+        (smaller diameter/larger diameter) of reducers and expanders.
+        Equivalent length of fittings is Le/D times ID. Straight tubes have their own length.
+        """
+        is_plastic = material == 5
+        fitting_Le_by_D = np.array([Constants.Le_BY_D["steel"], Constants.Le_BY_D["plastic"]], dtype=float)
+        ratios = sorted(Constants.REDUCER_Le_BY_D_STEEL)
+        reducer_Le_by_D = np.array([[Constants.REDUCER_Le_BY_D_STEEL[r] for r in ratios],
+                                    [Constants.REDUCER_Le_BY_D_PLASTIC[r] for r in ratios]], dtype=float)
+
+        is_fitting = (segment_type >= 2) & (segment_type <= 11)
+        is_reducer = (segment_type >= 12) & (segment_type <= 13)
+        Le_by_D = np.zeros(len(segment_type))
+        Le_by_D[is_fitting] = fitting_Le_by_D[is_plastic[is_fitting].astype(int),
+                                              segment_type[is_fitting].astype(int) - 2]
+        ratio = np.clip(np.floor(10 * shape_ratio[is_reducer]), ratios[0], ratios[-1]).astype(int)
+        Le_by_D[is_reducer] = reducer_Le_by_D[is_plastic[is_reducer].astype(int), ratio - ratios[0]]
+        return np.where(segment_type == 1, length, Le_by_D * ID)
+
     @property
     def elevation(self):
         self = self._get_equipment_object(self)
@@ -350,56 +361,19 @@ class PipeSegment(_EquipmentOneInletOutlet):
     @property
     def pressure_drop(self):
         self = self._get_equipment_object(self)
-        pressure_drop = prop.Pressure(0, self.inlet_pressure.unit)
+        self._refresh_dirty_upstream()
         if self.inlet_mass_flowrate.value == 0:
             return prop.Pressure(0, self._inlet_pressure.unit)
-        if (self._outlet_material_stream_tag is None and
-            self._inlet_material_stream_tag is None):
-            raise Exception("PipeSegment should be connected with MaterialStream either at inlet or outlet")
-       
-        is_inlet = False if self._inlet_material_stream_index is None else True
-        density = self._connected_stream_property_getter(is_inlet, "material", "density")
-        viscosity = self._connected_stream_property_getter(is_inlet, "material", "d_viscosity")
-        vol_flowrate = self._connected_stream_property_getter(is_inlet, "material", "vol_flowrate")
-        density.unit = "kg/m^3"
-        viscosity.unit = "Pa-s"
-        vol_flowrate.unit = "m^3/s"
-        if self._segment_obj_list is None:
-            ID = self.ID
-            ID.unit = 'm'
-            length = self.equivalent_length
-            length.unit = 'm'
+        if getattr(self, "_segment_frame", None) is None:
+            density, viscosity, vol_flowrate = self._connected_fluid_properties()
+            ID = self.ID.to_unit('m')
+            length = self.equivalent_length.to_unit('m')
             drop_friction = self.dp_friction(vol_flowrate, ID, length, density, viscosity)
             drop_hydrostatic = self.dp_hydrostatic(density)
-            pressure_drop = drop_friction + drop_hydrostatic
-        else:
-            for column in ['segment_type', 'ID', 'OD', 'thickness', 'length', 'material', 'elevation', 'shape']:
-                if column not in list(self.segment_frame.columns):
-                    self.segment_frame[column] = None
-            rows = zip(self.segment_frame['segment_type'],
-                        self.segment_frame['ID'],
-                        self.segment_frame['OD'],
-                        self.segment_frame['thickness'],
-                        self.segment_frame['length'],
-                        self.segment_frame['material'],
-                        self.segment_frame['elevation'],
-                        self.segment_frame['shape'])
-            for row in rows:
-                ps = PipeSegment(segment_type=row[0],
-                                 ID=row[1],
-                                 OD=row[2],
-                                 thickness=row[3],
-                                 length=row[4],
-                                 material=row[5],
-                                 elevation=row[6],
-                                 shape=row[7])
-                ID = ps.ID
-                ID.unit = 'm'
-                length = ps.equivalent_length
-                length.unit = 'm'
-                drop_friction = ps.dp_friction(vol_flowrate, ID, length, density, viscosity)
-                drop_hydrostatic = ps.dp_hydrostatic(density)
-                pressure_drop += drop_friction + drop_hydrostatic
+            return drop_friction + drop_hydrostatic
+        profile = self.pressure_drop_profile()
+        pressure_drop = prop.Pressure(float(profile["pressure_drop"].sum()), 'Pa')
+        pressure_drop.unit = self._inlet_pressure.unit
         return pressure_drop
         
     @pressure_drop.setter
@@ -409,48 +383,273 @@ class PipeSegment(_EquipmentOneInletOutlet):
     
     def dp_hydrostatic(self, density):
         self = self._get_equipment_object(self)
-        elevation_old_unit = self.elevation.unit
-        self.elevation.unit = "m"
-        hydro_drop = prop.Pressure(self.elevation.value * density.value * Constants.g)
-        hydro_drop.unit = self.inlet_pressure.unit
-        self.elevation.unit = elevation_old_unit
-        return hydro_drop
+        elevation = self.elevation.to_unit("m")
+        hydro_drop = prop.Pressure(elevation.value * density.value * Constants.g)
+        return hydro_drop.to_unit(self.inlet_pressure.unit)
 
     def dp_friction(self, vol_flowrate, ID, length, density, viscosity,
-                    method=Settings.pipe_dp_method, Darcy=Settings.Darcy):
+                    method=None, Darcy=None):
+        """
+        DESCRIPTION:
+            Frictional pressure drop of the flow through the pipe segment.
+            Flowrate can be a single value or many values, for e.g. a sweep
+            of flowrates, which are calculated together.
+        
+        PARAMETERS:
+            vol_flowrate:
+                Required: Yes
+                Type: property.VolumetricFlowRate or PropertyArray or Series or array-like
+                Description: Volumetric flowrate(s). Array-like values are in m^3/s.
+            
+            ID, length:
+                Required: Yes
+                Type: property.Length
+                Description: Internal diameter and (equivalent) length in m.
+            
+            density, viscosity:
+                Required: Yes
+                Type: property.Density, property.DViscosity
+                Description: Density in kg/m^3 and dynamic viscosity in Pa-s.
+            
+            method:
+                Required: No
+                Type: string
+                Default value: Settings.pipe_dp_method at the time of call.
+                Description: Friction factor method. See propylean.friction.
+            
+            Darcy:
+                Required: No
+                Type: bool
+                Default value: Settings.Darcy at the time of call.
+                Description: Kind of friction factor evaluated. Pressure drop is 
+                             same for both.
+        
+        RETURN VALUE:
+            Type: property.Pressure or PropertyArray or Series
+            Description: Pressure drop(s) in unit of inlet pressure. Same kind as vol_flowrate.
+        
+        SAMPLE USE CASES:
+            >>> ps.dp_friction(Series([0.1, 0.2], prop=prop.VolumetricFlowRate),
+                               prop.Length(0.3), prop.Length(10),
+                               prop.Density(1000), prop.DViscosity(0.001))
+        """
         self = self._get_equipment_object(self)
-        from fluids.friction import friction_factor
-        from fluids.core import Reynolds, K_from_f, dP_from_K
+        if isinstance(vol_flowrate, prop.VolumetricFlowRate):
+            Q = vol_flowrate.to_unit('m^3/s').value
+        elif isinstance(vol_flowrate, PropertyArray):
+            Q = vol_flowrate.to_unit('m^3/s').value
+        elif isinstance(vol_flowrate, Series):
+            Q = vol_flowrate.to_unit('m^3/s')._instance.to_numpy(dtype=float)
+        else:
+            Q = np.asarray(vol_flowrate, dtype=float)
 
-        V=(vol_flowrate.value)/(pi* ID.value**2)/4
-        Re = Reynolds(V=V,
-                    D=ID.value, 
-                    rho=density.value, 
-                    mu=viscosity.value)
+        V = Q/(pi * ID.value**2/4)
+        Re = density.value * np.abs(V) * ID.value / viscosity.value
         fd = friction_factor(Re=Re, 
-                            eD=Constants.ROUGHNESS[self.material-1]/ID.value,
-                            Method=method,
-                            Darcy=Darcy)
-        K = K_from_f(fd=fd, L=length.value, D=ID.value)        
-        drop = round(dP_from_K(K, rho=1000, V=V),3)
-        drop = prop.Pressure(drop, 'Pa')
-        drop.unit = self._inlet_pressure.unit
+                             eD=Constants.ROUGHNESS[self.material-1]/ID.value,
+                             method=method,
+                             Darcy=Darcy)
+        if Darcy is False or (Darcy is None and not Settings.Darcy):
+            fd = fd * 4
+        drop = fd * length.value / ID.value * density.value * V * np.abs(V) / 2
+        unit = self._inlet_pressure.unit
+        factor, _ = prop.Pressure._unit_conversion('Pa', unit)
+        if isinstance(vol_flowrate, Series):
+            return Series(drop * factor, prop=prop.Pressure, unit=unit,
+                          index=vol_flowrate._instance.index)
+        if np.ndim(drop) > 0:
+            return PropertyArray(drop * factor, prop.Pressure, unit)
+        drop = prop.Pressure(round(float(drop), 3), 'Pa')
+        drop.unit = unit
         return drop
+
+    def pressure_drop_profile(self):
+        """
+        DESCRIPTION:
+            Calculates pressure drop of every segment of the segment_frame together.
+            Reynolds number, relative roughness, friction factor, equivalent length
+            and hydrostatic head are calculated column-wise over the frame without
+            creating PipeSegment objects for rows. For a PipeSegment without
+            segment_frame, profile has a single row.
+        
+        RETURN VALUE:
+            Type: pandas.DataFrame
+            Description: One row per segment with columns 'Re', 'eD', 'friction_factor',
+                         'equivalent_length' (m), 'dp_friction', 'dp_hydrostatic', 'pressure_drop',
+                         'cumulative_pressure_drop' and 'outlet_pressure'. Pressures are in Pa.
+                         'outlet_pressure' is pressure at end of the segment starting from
+                         inlet pressure of the PipeSegment.
+        
+        ERROR RAISED:
+            Type: Exception
+            Description: If PipeSegment is not connected with MaterialStream or if a
+                         straight tube segment in segment_frame has no length.
+        
+        SAMPLE USE CASES:
+            >>> ps = PipeSegment(segment_frame=segment_frame)
+            >>> ps.connect_stream(inlet_stream, 'in', stream_governed=True)
+            >>> profile = ps.pressure_drop_profile()
+            >>> profile["cumulative_pressure_drop"].iloc[-1]
+        """
+        self = self._get_equipment_object(self)
+        density, viscosity, vol_flowrate = self._connected_fluid_properties()
+        segments = self._segment_arrays()
+        ID = segments["ID"]
+        equivalent_length = self._equivalent_lengths(segments["segment_type"], ID,
+                                                     segments["length"], segments["material"],
+                                                     segments["shape_ratio"])
+        V = vol_flowrate.value/(pi * ID**2/4)
+        Re = density.value * V * ID / viscosity.value
+        eD = np.array(Constants.ROUGHNESS)[segments["material"] - 1] / ID
+        fd = friction_factor(Re=Re, eD=eD, Darcy=True)
+        dp_friction = fd * equivalent_length / ID * density.value * V**2 / 2
+        dp_hydrostatic = segments["elevation"] * density.value * Constants.g
+        pressure_drop = dp_friction + dp_hydrostatic
+        cumulative_pressure_drop = np.cumsum(pressure_drop)
+        inlet_pressure = self.inlet_pressure.to_unit('Pa').value
+        return pd.DataFrame({"Re": Re,
+                             "eD": eD,
+                             "friction_factor": fd if Settings.Darcy else fd/4,
+                             "equivalent_length": equivalent_length,
+                             "dp_friction": dp_friction,
+                             "dp_hydrostatic": dp_hydrostatic,
+                             "pressure_drop": pressure_drop,
+                             "cumulative_pressure_drop": cumulative_pressure_drop,
+                             "outlet_pressure": inlet_pressure - cumulative_pressure_drop})
+
+    def _pressure_drops(self, vol_flowrates, density, viscosity):
+        """
+        Internal function to get total pressure drops (in Pa) of all segments
+        for array of volumetric flowrates (in m^3/s) with density (kg/m^3) and
+        viscosity (Pa-s) as floats. Used for system curves.
+        """
+        segments = self._segment_arrays()
+        ID = segments["ID"]
+        area = pi * ID**2/4
+        equivalent_length = self._equivalent_lengths(segments["segment_type"], ID,
+                                                     segments["length"], segments["material"],
+                                                     segments["shape_ratio"])
+        eD = np.array(Constants.ROUGHNESS)[segments["material"] - 1] / ID
+        V = np.asarray(vol_flowrates, dtype=float)[..., np.newaxis] / area
+        Re = density * np.abs(V) * ID / viscosity
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fd = friction_factor(Re=Re, eD=eD, Darcy=True)
+            dp_friction = np.where(V == 0, 0.0,
+                                   fd * equivalent_length / ID * density * V * np.abs(V) / 2)
+        return dp_friction.sum(axis=-1) + segments["elevation"].sum() * density * Constants.g
+
+    def _connected_fluid_properties(self):
+        """
+        Internal function to get density (kg/m^3), dynamic viscosity (Pa-s) and
+        volumetric flowrate (m^3/s) of the connected MaterialStream.
+        """
+        if (self._outlet_material_stream_tag is None and
+            self._inlet_material_stream_tag is None):
+            raise Exception("PipeSegment should be connected with MaterialStream either at inlet or outlet")
+        is_inlet = False if self._inlet_material_stream_index is None else True
+        density = self._connected_stream_property_getter(is_inlet, "material", "density")
+        viscosity = self._connected_stream_property_getter(is_inlet, "material", "d_viscosity")
+        vol_flowrate = self._connected_stream_property_getter(is_inlet, "material", "vol_flowrate")
+        return (density.to_unit("kg/m^3"), viscosity.to_unit("Pa-s"),
+                vol_flowrate.to_unit("m^3/s"))
+
+    def _segment_arrays(self):
+        """
+        Internal function to get segment_type, material, ID (m), length (m), elevation (m)
+        and shape_ratio of all segments as numpy arrays.
+        """
+        frame = getattr(self, "_segment_frame", None)
+        if frame is None:
+            shape_ratio = 0
+            if self.segment_type in range(12, 14):
+                shape_ratio = self._shape[1]/self._shape[0]
+            length = self.length.to_unit('m').value if self.segment_type == 1 else 0
+            return {"segment_type": np.array([self.segment_type]),
+                    "material": np.array([self.material]),
+                    "ID": np.array([self.ID.to_unit('m').value], dtype=float),
+                    "length": np.array([length], dtype=float),
+                    "elevation": np.array([self.elevation.to_unit('m').value], dtype=float),
+                    "shape_ratio": np.array([shape_ratio], dtype=float)}
+        
+        rows = len(frame)
+        segment_type = self._frame_column(frame, "segment_type", default=1).astype(int)
+        material = self._frame_column(frame, "material", default=1).astype(int)
+        for value in np.unique(segment_type):
+            _Validators.validate_arg_prop_value_range("segment_type", value, [1, 13])
+        for value in np.unique(material):
+            _Validators.validate_arg_prop_value_range("material", value, [1, 5])
+        ID = self._frame_column(frame, "ID", prop.Length, 'm')
+        missing_ID = np.isnan(ID)
+        if missing_ID.any():
+            OD = self._frame_column(frame, "OD", prop.Length, 'm')
+            thickness = self._frame_column(frame, "thickness", prop.Length, 'm')
+            ID = np.where(missing_ID, OD - thickness, ID)
+            if np.isnan(ID).any():
+                raise Exception('Define atleast ID or OD with thickness to define a pipe segment object')
+        length = self._frame_column(frame, "length", prop.Length, 'm')
+        if np.isnan(length[segment_type == 1]).any():
+            raise Exception('Straight Tube segment requires "length" value.')
+        elevation = self._frame_column(frame, "elevation", prop.Length, 'm', default=0)
+        shape_ratio = np.zeros(rows)
+        if "shape" in frame.columns:
+            for i, shape in enumerate(frame["shape"]):
+                if isinstance(shape, tuple):
+                    shape_ratio[i] = shape[1]/shape[0]
+        return {"segment_type": segment_type,
+                "material": material,
+                "ID": ID,
+                "length": np.nan_to_num(length),
+                "elevation": elevation,
+                "shape_ratio": shape_ratio}
+
+    @staticmethod
+    def _frame_column(frame, column, prop_type=None, unit=None, default=np.nan):
+        """
+        Internal function to convert a column of segment_frame to numpy array of floats.
+        Column can have numbers, tuples of (value, unit) or property objects of prop_type.
+        Values are converted to unit. Missing column or values are given default value.
+        """
+        if column not in frame.columns:
+            return np.full(len(frame), default, dtype=float)
+        values = frame[column]
+        if prop_type is None or pd.api.types.is_numeric_dtype(values):
+            result = values.to_numpy(dtype=float, na_value=np.nan)
+            if prop_type is not None:
+                factor, offset = prop_type._unit_conversion(prop_type().unit, unit)
+                result = result * factor + offset
+            return np.where(np.isnan(result), default, result)
+        
+        default_unit = prop_type().unit
+        conversions = {}
+        result = np.empty(len(values))
+        for i, item in enumerate(values):
+            if isinstance(item, prop_type):
+                value, item_unit = item.value, item.unit
+            elif isinstance(item, tuple):
+                value, item_unit = item
+            elif item is None or (isinstance(item, float) and isnan(item)):
+                result[i] = default
+                continue
+            else:
+                value, item_unit = item, default_unit
+            if item_unit not in conversions:
+                conversions[item_unit] = prop_type._unit_conversion(item_unit, unit)
+            factor, offset = conversions[item_unit]
+            result[i] = value * factor + offset
+        return result
             
     @classmethod
     def list_objects(cls):
         return cls.items
 
 class Strainers(_EquipmentOneInletOutlet):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
-        self._index = len(Strainers.items)
-        Strainers.items.append(self)
+        self._index = Strainers.items.add(self)
         
 class Filters(_EquipmentOneInletOutlet):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
-        self._index = len(Filters.items)
-        Filters.items.append(self)
\ No newline at end of file
+        self._index = Filters.items.add(self)
\ No newline at end of file
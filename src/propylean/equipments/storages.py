@@ -1,42 +1,40 @@
 from propylean.equipments.generic_equipment_classes import _VerticalVessels, _HorizontalVessels,\
     _SphericalVessels, _Blanketing
+from propylean.registry import _Registry
 from propylean.settings import Settings
 from propylean.constants import Constants
 from propylean import properties as prop
 
 class VerticalStorage(_VerticalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs) 
-        self._index = len(VerticalStorage.items)                   
-        VerticalStorage.items.append(self)
+        self._index = VerticalStorage.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
         return "Vertical Storage with tag: " + self.tag
 
 class Bullet(_HorizontalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
         if "is_blanketed" in inputs and inputs["is_blanketed"]:
             self.blanketing = _Blanketing(tag=self.tag)  
-        self._index = len(Bullet.items)
-        Bullet.items.append(self)
+        self._index = Bullet.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
         return "Bullet with tag: " + self.tag
 
 class Tank(_VerticalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
         inputs["head_type"] = "Flat"
         if "is_blanketed" in inputs and inputs["is_blanketed"]:
             self.blanketing = _Blanketing(tag=self.tag)
-        self._index = len(Tank.items)
-        Tank.items.append(self)
+        self._index = Tank.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -57,13 +55,12 @@ class Tank(_VerticalVessels):
         return cls.items
 
 class Sphere(_SphericalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs) 
         if "is_blanketed" in inputs and inputs["is_blanketed"]:
             self.blanketing = _Blanketing(tag=self.tag)
-        self._index = len(Sphere.items)
-        Sphere.items.append(self)
+        self._index = Sphere.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -73,12 +70,11 @@ class Sphere(_SphericalVessels):
 
 # Specialized storage equipments.
 class AirReciever(_VerticalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
         self._main_fluid = "gas"
-        self._index = len(AirReciever.items)
-        AirReciever.items.append(self)
+        self._index = AirReciever.items.add(self)
     
     def __repr__(self):
         return "AirReciever with tag: " + self.tag
@@ -93,8 +89,7 @@ class AirReciever(_VerticalVessels):
         raise Exception("Setting property 'main_fluid' is not allowed for AirReciever.")
 
 class HotOilExpansionVessel(_HorizontalVessels):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__(**inputs)
-        self._index = len(HotOilExpansionVessel.items)
-        HotOilExpansionVessel.items.append(self)
+        self._index = HotOilExpansionVessel.items.add(self)
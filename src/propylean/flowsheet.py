@@ -0,0 +1,423 @@
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+from warnings import warn
+import numpy as np
+import pandas as pd
+from propylean import streams
+from propylean.equipments import abstract_equipment_classes as equipment_classes
+from propylean.equipments.abstract_equipment_classes import _EquipmentOneInletOutlet
+from propylean.validators import _Validators
+from propylean.model import Model
+
+class Flowsheet(object):
+    def __init__(self, equipments=None):
+        """
+        DESCRIPTION:
+            Class to represent connected equipments and streams as a directed graph.
+            Equipments are nodes and streams are edges from the equipment they come
+            from to the equipment they go to. Graph is built from the stream-equipment
+            maps maintained by connect_stream and disconnect_stream.
+            Properties are propagated once in topological order of equipments, that is,
+            every equipment is solved after all equipments upstream of it.
+
+        PARAMETERS:
+            equipments:
+                Required: No
+                Type: list
+                Acceptable values: List of equipment objects.
+                Default value: None
+                Description: Equipments to be included in the flowsheet. If not provided,
+                             all equipments connected to any stream are included.
+
+        RETURN VALUE:
+            Type: Flowsheet
+            Description: Object of type Flowsheet
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If equipments are not equipment objects.
+
+        SAMPLE USE CASES:
+            >>> from propylean import Flowsheet
+            >>> flowsheet = Flowsheet()
+            >>> with flowsheet.deferred_propagation():
+            >>>     pump.connect_stream(s1, direction="in")
+            >>>     pump.connect_stream(s2, direction="out")
+            >>>     pipe.connect_stream(s2, direction="in")
+            >>> flowsheet.topological_order()
+            [Centrifugal Pump with tag: CentrifugalPump_1, ...]
+        """
+        if equipments is not None:
+            _Validators.validate_arg_prop_value_type("equipments", equipments, list)
+            for equipment in equipments:
+                _Validators.validate_arg_prop_value_type("equipments", equipment,
+                                                         _EquipmentOneInletOutlet)
+        self._equipments = equipments
+        self._nodes = {}
+        self._downstream = {}
+        self._upstream = {}
+        self.build()
+
+    @staticmethod
+    def _node_key(equipment):
+        return (type(equipment), equipment.index)
+
+    def build(self):
+        """
+        DESCRIPTION:
+            Builds adjacency lists of the flowsheet from the stream-equipment maps.
+            Called on creation. Call again after connections are changed outside
+            of deferred_propagation.
+
+        RETURN VALUE:
+            Type: Flowsheet
+            Description: The flowsheet itself.
+        """
+        self._nodes = {}
+        if self._equipments is not None:
+            for equipment in self._equipments:
+                self._nodes[self._node_key(equipment)] = equipment
+        self._downstream = {key: [] for key in self._nodes}
+        self._upstream = {key: [] for key in self._nodes}
+
+        for stream_class, stream_map in [(streams.MaterialStream,
+                                          equipment_classes._material_stream_equipment_map),
+                                         (streams.EnergyStream,
+                                          equipment_classes._energy_stream_equipment_map)]:
+            for stream_index, (from_index, from_type, to_index, to_type) in stream_map.items():
+                from_key = self._add_node(from_index, from_type)
+                to_key = self._add_node(to_index, to_type)
+                if from_key is None or to_key is None:
+                    continue
+                stream = stream_class.items[stream_index]
+                self._downstream[from_key].append((stream, to_key))
+                self._upstream[to_key].append((stream, from_key))
+        return self
+
+    def _add_node(self, index, equipment_type):
+        if index is None or equipment_type is None:
+            return None
+        key = (equipment_type, index)
+        if key in self._nodes:
+            return key
+        if self._equipments is not None:
+            return None
+        try:
+            self._nodes[key] = equipment_type.items[index]
+        except IndexError:
+            return None
+        self._downstream[key] = []
+        self._upstream[key] = []
+        return key
+
+    @property
+    def equipments(self):
+        return list(self._nodes.values())
+
+    def downstream(self, equipment):
+        """
+        Returns list of equipments directly downstream of the equipment.
+        """
+        return [self._nodes[key] for _, key in self._downstream[self._node_key(equipment)]]
+
+    def upstream(self, equipment):
+        """
+        Returns list of equipments directly upstream of the equipment.
+        """
+        return [self._nodes[key] for _, key in self._upstream[self._node_key(equipment)]]
+
+    def topological_order(self):
+        """
+        DESCRIPTION:
+            Returns equipments ordered such that every equipment comes after all
+            equipments upstream of it (Kahn's algorithm, linear in number of
+            equipments and streams).
+
+        RETURN VALUE:
+            Type: list
+            Description: List of equipment objects.
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If flowsheet has a cycle (recycle) which cannot be ordered.
+        """
+        return self._order(torn=set())
+
+    def _order(self, torn):
+        """
+        Internal function for topological order ignoring streams whose id is in torn.
+        """
+        in_degree = {key: sum(1 for stream, _ in edges if id(stream) not in torn)
+                     for key, edges in self._upstream.items()}
+        ready = deque(key for key in self._nodes if in_degree[key] == 0)
+        order = []
+        while ready:
+            key = ready.popleft()
+            order.append(key)
+            for stream, downstream_key in self._downstream[key]:
+                if id(stream) in torn:
+                    continue
+                in_degree[downstream_key] -= 1
+                if in_degree[downstream_key] == 0:
+                    ready.append(downstream_key)
+        if len(order) != len(self._nodes):
+            cycle_tags = [self._nodes[key].tag for key in self._nodes if in_degree[key] > 0]
+            raise Exception("Flowsheet has a cycle between equipments {}. Topological order not possible.".format(cycle_tags))
+        return [self._nodes[key] for key in order]
+
+    def tear_streams(self):
+        """
+        DESCRIPTION:
+            Selects streams to tear so that flowsheet has no cycles. Streams
+            closing a cycle in a depth first search of the flowsheet are
+            selected, which takes time linear in number of equipments and streams.
+
+        RETURN VALUE:
+            Type: list
+            Description: List of stream objects. Empty if flowsheet has no recycle.
+        """
+        tears = []
+        state = {}
+        ON_STACK, DONE = 1, 2
+        for root in self._nodes:
+            if root in state:
+                continue
+            state[root] = ON_STACK
+            pending = [(root, iter(self._downstream[root]))]
+            while pending:
+                key, edges = pending[-1]
+                for stream, downstream_key in edges:
+                    if state.get(downstream_key) == ON_STACK:
+                        tears.append(stream)
+                    elif downstream_key not in state:
+                        state[downstream_key] = ON_STACK
+                        pending.append((downstream_key, iter(self._downstream[downstream_key])))
+                        break
+                else:
+                    state[key] = DONE
+                    pending.pop()
+        return tears
+
+    def solve(self):
+        """
+        DESCRIPTION:
+            Propagates properties through the flowsheet in one pass in topological
+            order. For every equipment, inlet streams govern its inlet properties and
+            the equipment governs properties of its outlet streams.
+
+        RETURN VALUE:
+            Type: list
+            Description: Equipments in the order they were solved.
+        """
+        order = self.topological_order()
+        for equipment in order:
+            equipment._solve_connections()
+        return order
+
+    def solve_recycles(self, tear_streams=None, method="Wegstein", tolerances=None,
+                       max_iterations=100):
+        """
+        DESCRIPTION:
+            Solves flowsheet with recycles sequentially. Tear streams break the
+            recycles and equipments are solved in topological order of the remaining
+            flowsheet. Every pass gives new values of the tear streams from their
+            guessed values, and guesses are updated with the acceleration method
+            until change in mass_flowrate, pressure and temperature of the tear
+            streams is within tolerances.
+
+        PARAMETERS:
+            tear_streams:
+                Required: No
+                Type: list
+                Acceptable values: List of MaterialStream or EnergyStream objects.
+                Default value: Streams selected by tear_streams method.
+                Description: Streams to be torn. Present values are the first guesses.
+
+            method:
+                Required: No
+                Type: string
+                Acceptable values: 'Wegstein', 'Broyden' or 'direct'
+                Default value: 'Wegstein'
+                Description: Method to update guesses of tear streams. 'direct' is
+                             direct substitution.
+
+            tolerances:
+                Required: No
+                Type: dict
+                Acceptable values: Keys 'mass_flowrate', 'pressure', 'temperature' and 'amount'
+                                   (of EnergyStream) with relative tolerance values.
+                Default value: 1e-6 for all.
+                Description: Iterations stop when change of every tear variable relative
+                             to its value (or 1 if the value is smaller) is within tolerance.
+
+            max_iterations:
+                Required: No
+                Type: int
+                Default value: 100
+
+        RETURN VALUE:
+            Type: pandas.DataFrame
+            Description: Report with one row per iteration, maximum relative residual
+                         of every tear variable and 'time' of the iteration in seconds.
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If method is not supported or if tear streams do not break all recycles.
+
+        SAMPLE USE CASES:
+            >>> flowsheet = Flowsheet()
+            >>> report = flowsheet.solve_recycles(method="Wegstein", tolerances={"pressure": 1e-8})
+            >>> report.tail()
+        """
+        if method not in _ACCELERATORS:
+            raise Exception("Method '{}' not supported. Should be one of {}.".format(
+                            method, list(_ACCELERATORS)))
+        if tear_streams is None:
+            tear_streams = self.tear_streams()
+        _Validators.validate_arg_prop_value_type("tear_streams", tear_streams, list)
+        tolerance = dict(_TOLERANCES)
+        if tolerances is not None:
+            _Validators.validate_arg_prop_value_type("tolerances", tolerances, dict)
+            tolerance.update(tolerances)
+        order = self._order(torn={id(stream) for stream in tear_streams})
+
+        variables = []
+        for stream in tear_streams:
+            _Validators.validate_arg_prop_value_type("tear_streams", stream,
+                                                     (streams.MaterialStream, streams.EnergyStream))
+            for name, unit in _TEAR_VARIABLES[type(stream)]:
+                variables.append((stream, name, unit))
+        names = np.array([name for _, name, _ in variables])
+        categories = list(dict.fromkeys(names))
+        accelerator = _ACCELERATORS[method]()
+        x = self._tear_values(variables)
+        report = []
+        converged = False
+        for iteration in range(1, max_iterations + 1):
+            start = perf_counter()
+            self._set_tear_values(variables, x)
+            for equipment in order:
+                equipment._solve_connections()
+            gx = self._tear_values(variables)
+            residual = np.abs(gx - x) / np.maximum(np.abs(x), 1)
+            row = {"iteration": iteration}
+            for category in categories:
+                row[category] = residual[names == category].max()
+            converged = all(row[category] <= tolerance[category] for category in categories)
+            if not converged:
+                x = accelerator.step(x, gx)
+            row["time"] = perf_counter() - start
+            report.append(row)
+            if converged:
+                break
+        if not converged:
+            warn("Recycles not converged in {} iterations.".format(max_iterations))
+        return pd.DataFrame(report, columns=["iteration"] + categories + ["time"])
+
+    @staticmethod
+    def _tear_values(variables):
+        return np.array([getattr(stream, name).to_unit(unit).value
+                         for stream, name, unit in variables], dtype=float)
+
+    @staticmethod
+    def _set_tear_values(variables, values):
+        for (stream, name, unit), value in zip(variables, values):
+            old = getattr(stream, name)
+            new = type(old)(float(value), unit)
+            new.unit = old.unit
+            setattr(stream, name, new)
+
+    @contextmanager
+    def deferred_propagation(self):
+        """
+        DESCRIPTION:
+            Context manager in which connect_stream only maps streams and equipments
+            without matching their properties. On exit, flowsheet is rebuilt and
+            solved once. Flowsheets with recycles are solved with solve_recycles.
+
+        SAMPLE USE CASES:
+            >>> with flowsheet.deferred_propagation():
+            >>>     pump.connect_stream(s1, direction="in")
+        """
+        model = Model.current()
+        model._deferred_propagation += 1
+        try:
+            yield self
+        finally:
+            model._deferred_propagation -= 1
+        self.build()
+        if self.tear_streams():
+            self.solve_recycles()
+        else:
+            self.solve()
+
+
+_TEAR_VARIABLES = {streams.MaterialStream: [("mass_flowrate", "kg/s"),
+                                            ("pressure", "Pa"),
+                                            ("temperature", "K")],
+                   streams.EnergyStream: [("amount", "W")]}
+_TOLERANCES = {"mass_flowrate": 1e-6, "pressure": 1e-6, "temperature": 1e-6, "amount": 1e-6}
+
+class _DirectSubstitution(object):
+    """
+    Next guess of tear variables is their value from the last pass.
+    """
+    def step(self, x, gx):
+        return gx
+
+class _Wegstein(object):
+    """
+    Wegstein acceleration of every tear variable separately. q is bounded
+    to [q_min, q_max] for stability. First step is direct substitution.
+    """
+    q_min = -5
+    q_max = 0
+
+    def __init__(self):
+        self._x = None
+        self._gx = None
+
+    def step(self, x, gx):
+        if self._x is None:
+            x_new = gx
+        else:
+            dx = x - self._x
+            with np.errstate(divide="ignore", invalid="ignore"):
+                s = np.where(dx != 0, (gx - self._gx) / dx, 0)
+                q = np.where(s != 1, s / (s - 1), self.q_min)
+            q = np.clip(q, self.q_min, self.q_max)
+            x_new = q * x + (1 - q) * gx
+        self._x, self._gx = x, gx
+        return x_new
+
+class _Broyden(object):
+    """
+    Broyden's method for root of gx - x with inverse Jacobian updates.
+    Variables are scaled with their first values. First step is direct substitution.
+    """
+    def __init__(self):
+        self._scale = None
+        self._H = None
+        self._z = None
+        self._F = None
+
+    def step(self, x, gx):
+        if self._scale is None:
+            self._scale = np.maximum(np.abs(x), 1)
+            self._H = -np.eye(len(x))
+        z = x / self._scale
+        F = (gx - x) / self._scale
+        if self._z is not None:
+            dz = z - self._z
+            dF = F - self._F
+            H_dF = self._H @ dF
+            denominator = dz @ H_dF
+            if denominator != 0:
+                self._H += np.outer(dz - H_dF, dz @ self._H) / denominator
+        self._z, self._F = z, F
+        return (z - self._H @ F) * self._scale
+
+_ACCELERATORS = {"Wegstein": _Wegstein,
+                 "Broyden": _Broyden,
+                 "direct": _DirectSubstitution}
@@ -0,0 +1,139 @@
+import numpy as np
+from propylean.settings import Settings
+
+LAMINAR_TRANSITION_PIPE = 2040.0
+
+def laminar(Re, eD=None):
+    """
+    DESCRIPTION:
+        Darcy friction factor for laminar flow in pipes (Hagen-Poiseuille).
+        eD is accepted only for same signature as other methods and is not used.
+    """
+    return 64.0/np.asarray(Re, dtype=float)
+
+def Clamond(Re, eD):
+    """
+    DESCRIPTION:
+        Darcy friction factor from the Colebrook equation solved with
+        Clamond's explicit method (accurate to machine precision).
+        Same formulation as fluids.friction.Clamond with fast=False.
+    """
+    Re = np.asarray(Re, dtype=float)
+    eD = np.asarray(eD, dtype=float)
+    X1 = eD*Re*0.1239681863354175460160858261654858382699
+    X2 = np.log(Re) - 0.7793974884556819406441139701653776731705
+    F = X2 - 0.2
+    X1F = X1 + F
+    X1F1 = 1. + X1F
+    E = (np.log(X1F) - 0.2)/X1F1
+    F = F - (X1F1 + 0.5*E)*E*X1F/(X1F1 + E*(1. + (1.0/3.0)*E))
+
+    X1F = X1 + F
+    X1F1 = 1. + X1F
+    E = (np.log(X1F) + F - X2)/X1F1
+    b = X1F1 + E*(1. + (1.0/3.0)*E)
+    F = b/(b*F - (X1F1 + 0.5*E)*E*X1F)
+    return 1.325474527619599502640416597148504422899*(F*F)
+
+def Colebrook(Re, eD, tol=1e-12, max_iterations=50):
+    """
+    DESCRIPTION:
+        Darcy friction factor from the implicit Colebrook equation,
+        1/sqrt(f) = -2*log10(eD/3.7 + 2.51/(Re*sqrt(f))).
+        Solved with Newton iterations on 1/sqrt(f) for all values together,
+        starting from Clamond's solution.
+    """
+    Re = np.asarray(Re, dtype=float)
+    eD = np.asarray(eD, dtype=float)
+    x = 1.0/np.sqrt(Clamond(Re, eD))
+    a = eD/3.7
+    b = 2.51/Re
+    for _ in range(max_iterations):
+        inner = a + b*x
+        residual = x + 2.0*np.log10(inner)
+        derivative = 1.0 + 2.0*b/(inner*np.log(10))
+        step = residual/derivative
+        x = x - step
+        if np.all(np.abs(step) <= tol*np.abs(x)):
+            break
+    return 1.0/(x*x)
+
+def Haaland(Re, eD):
+    """
+    DESCRIPTION:
+        Darcy friction factor from explicit Haaland (1983) equation.
+    """
+    Re = np.asarray(Re, dtype=float)
+    eD = np.asarray(eD, dtype=float)
+    term = -3.6*np.log10(6.9/Re + (eD*(1.0/3.7))**1.11)
+    return 4.0/(term*term)
+
+METHODS = {"Clamond": Clamond,
+           "Colebrook": Colebrook,
+           "Haaland": Haaland,
+           "laminar": laminar}
+
+def friction_factor(Re, eD=0, method=None, Darcy=None):
+    """
+    DESCRIPTION:
+        Friction factor of flow in pipes for scalar or array-like Reynolds
+        numbers and relative roughnesses. Laminar friction factor is used
+        below Reynolds number of 2040 irrespective of method.
+
+    PARAMETERS:
+        Re:
+            Required: Yes
+            Type: int or float or array-like
+            Acceptable values: Positive values
+            Description: Reynolds number(s) of the flow.
+
+        eD:
+            Required: No
+            Type: int or float or array-like
+            Acceptable values: Non-negative values
+            Default value: 0
+            Description: Relative roughness(es), roughness/diameter.
+
+        method:
+            Required: No
+            Type: string
+            Acceptable values: 'Clamond', 'Colebrook', 'Haaland' or 'laminar'
+            Default value: Settings.pipe_dp_method at the time of call.
+            Description: Method used to calculate friction factor.
+
+        Darcy:
+            Required: No
+            Type: bool
+            Default value: Settings.Darcy at the time of call.
+            Description: True for Darcy friction factor. False for Fanning friction factor.
+
+    RETURN VALUE:
+        Type: float or numpy.ndarray
+        Description: Friction factor(s). Float if Re and eD are scalars.
+
+    ERROR RAISED:
+        Type: Exception
+        Description: If method is not supported.
+
+    SAMPLE USE CASES:
+        >>> from propylean.friction import friction_factor
+        >>> friction_factor(Re=[1E3, 1E5], eD=1E-4, method="Colebrook")
+        array([0.064     , 0.01851387])
+    """
+    if method is None:
+        method = Settings.pipe_dp_method
+    if Darcy is None:
+        Darcy = Settings.Darcy
+    if method not in METHODS:
+        raise Exception("Friction factor method '{}' not supported. Should be one of {}.".format(
+                        method, list(METHODS)))
+    Re, eD = np.broadcast_arrays(np.asarray(Re, dtype=float), np.asarray(eD, dtype=float))
+    fd = np.empty(Re.shape)
+    is_laminar = Re < LAMINAR_TRANSITION_PIPE
+    fd[is_laminar] = laminar(Re[is_laminar])
+    is_turbulent = ~is_laminar
+    if is_turbulent.any():
+        fd[is_turbulent] = METHODS[method](Re[is_turbulent], eD[is_turbulent])
+    if not Darcy:
+        fd = fd*0.25
+    return float(fd) if fd.ndim == 0 else fd
@@ -0,0 +1,149 @@
+import os
+import pandas as pd
+from propylean.series import Series
+from propylean.validators import _Validators
+
+def read_historian(path, columns, chunksize=100000, sep=",", index_col=None,
+                   file_format=None, **read_options):
+    """
+    DESCRIPTION:
+        Reads historian export (CSV or Parquet) in chunks of rows and yields
+        Series of every column with property and unit assigned. Only one chunk
+        is held in memory at a time, so files larger than memory can be processed.
+
+    PARAMETERS:
+        path:
+            Required: Yes
+            Type: str
+            Description: Path of the CSV or Parquet file.
+
+        columns:
+            Required: Yes
+            Type: dict
+            Acceptable values: {<name>: (<column in file>, <property class>, <unit>)}
+            Description: Columns to read. Every chunk has Series of each column
+                         under its name with property and unit as provided.
+
+        chunksize:
+            Required: No
+            Type: int
+            Default value: 100000
+            Description: Number of rows in every chunk.
+
+        sep:
+            Required: No
+            Type: str
+            Default value: ','
+            Description: Separator of CSV file.
+
+        index_col:
+            Required: No
+            Type: str
+            Default value: None
+            Description: Column used as index of the Series, for e.g. time stamps.
+
+        file_format:
+            Required: No
+            Type: str
+            Acceptable values: 'csv' or 'parquet'
+            Default value: 'parquet' for files with extension .parquet or .pq, else 'csv'.
+
+        read_options:
+            Required: No
+            Description: Other arguments to pandas.read_csv, for e.g. parse_dates.
+
+    RETURN VALUE:
+        Type: generator
+        Description: Yields dict of name to Series for every chunk.
+
+    ERROR RAISED:
+        Type: Exception
+        Description: If arguments are of incorrect type, or Parquet file is read without pyarrow.
+
+    SAMPLE USE CASES:
+        >>> from propylean.historian import read_historian
+        >>> from propylean.properties import Length, Pressure
+        >>> chunks = read_historian("LPG_bullet_data.csv", sep=";", chunksize=1000,
+                                    columns={"liquid_level": ("liquid_level(cm)", Length, "cm"),
+                                             "operating_pressure": ("operating_press(bar)", Pressure, "bar")})
+        >>> for chunk in chunks:
+        >>>     print(chunk["liquid_level"])
+    """
+    _Validators.validate_arg_prop_value_type("columns", columns, dict)
+    _Validators.validate_arg_prop_value_type("chunksize", chunksize, int)
+    if chunksize <= 0:
+        raise Exception("chunksize should be a positive integer.")
+    if file_format is None:
+        file_format = "parquet" if os.path.splitext(path)[1].lower() in [".parquet", ".pq"] else "csv"
+    _Validators.validate_arg_prop_value_list("file_format", file_format, ["csv", "parquet"])
+    file_columns = [column for column, _, _ in columns.values()]
+    if index_col is not None:
+        file_columns.append(index_col)
+    if file_format == "csv":
+        frames = pd.read_csv(path, sep=sep, usecols=file_columns,
+                             chunksize=chunksize, **read_options)
+    else:
+        frames = _read_parquet(path, file_columns, chunksize)
+    for frame in frames:
+        if index_col is not None:
+            frame = frame.set_index(index_col)
+        yield {name: Series(frame[column], prop=prop, unit=unit)
+               for name, (column, prop, unit) in columns.items()}
+
+def _read_parquet(path, columns, chunksize):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise Exception("pyarrow is required to read Parquet files. Install it with 'pip install pyarrow'.")
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas()
+
+def calculate_chunks(equipment, chunks, calculation):
+    """
+    DESCRIPTION:
+        Sets Series of every chunk to properties of the equipment and yields
+        result of the calculation on the chunk. Properties are set back to their
+        earlier values when generator is exhausted or closed.
+
+    PARAMETERS:
+        equipment:
+            Required: Yes
+            Type: Equipment
+            Description: Equipment whose properties are set from chunks.
+
+        chunks:
+            Required: Yes
+            Type: iterable of dict
+            Description: Dicts of property name to Series, for e.g. from read_historian.
+
+        calculation:
+            Required: Yes
+            Type: str or function
+            Description: Name of method of equipment called without arguments,
+                         or function called with the equipment.
+
+    RETURN VALUE:
+        Type: generator
+        Description: Yields result of calculation for every chunk.
+
+    SAMPLE USE CASES:
+        >>> from propylean.historian import read_historian, calculate_chunks
+        >>> chunks = read_historian("LPG_bullet_data.csv", sep=";", chunksize=1000,
+                                    columns={"liquid_level": ("liquid_level(cm)", Length, "cm")})
+        >>> for inventory in calculate_chunks(bullet, chunks, "get_inventory"):
+        >>>     print(inventory.to_unit("m^3").max())
+    """
+    if isinstance(calculation, str):
+        method = calculation
+        calculation = lambda obj: getattr(obj, method)()
+    original_values = {}
+    try:
+        for chunk in chunks:
+            for name, value in chunk.items():
+                if name not in original_values:
+                    original_values[name] = getattr(equipment, name)
+                setattr(equipment, name, value)
+            yield calculation(equipment)
+    finally:
+        for name, value in original_values.items():
+            setattr(equipment, name, value)
@@ -1,12 +1,14 @@
 from propylean import streams
+from propylean.registry import _Registry
 import propylean.properties as prop
 from propylean.equipments.generic_equipment_classes import _EquipmentOneInletOutlet
 from propylean.settings import Settings
 from propylean.constants import Constants
-from fluids import control_valve as cv_calculations
+from propylean.series import _elementwise
+import numpy as np
 
 class ControlValve(_EquipmentOneInletOutlet):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         """ 
         DESCRIPTION:
@@ -32,8 +34,7 @@ class ControlValve(_EquipmentOneInletOutlet):
         super().__init__( **inputs)
         del self.energy_in
         del self.energy_out
-        self._index = len(ControlValve.items)
-        ControlValve.items.append(self)
+        self._index = ControlValve.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -44,12 +45,13 @@ class ControlValve(_EquipmentOneInletOutlet):
     @property
     def Cv(self):
         self = self._get_equipment_object(self)
+        from fluids import control_valve as cv_calculations
+        self._refresh_dirty_upstream()
         if (self._outlet_material_stream_tag is None and
             self._inlet_material_stream_tag is None):
             raise Exception("PipeSegment should be connected with MaterialStream either at inlet or outlet")
-        P1 = self.inlet_pressure
-        P2 = self.outlet_pressure
-        P1.unit = P2.unit = "Pa"
+        P1 = self.inlet_pressure.to_unit("Pa")
+        P2 = self.outlet_pressure.to_unit("Pa")
         is_inlet = True if self._outlet_material_stream_tag is None else False
         density = self._connected_stream_property_getter(is_inlet, "material", "density")
         phase = self._connected_stream_property_getter(is_inlet, "material", "phase")
@@ -58,22 +60,26 @@ class ControlValve(_EquipmentOneInletOutlet):
         MW = self._connected_stream_property_getter(is_inlet, "material", "molecular_weight")
         Psat = self._connected_stream_property_getter(is_inlet, "material", "Psat")
         Pc = self._connected_stream_property_getter(is_inlet, "material", "Pc")
-        if phase == 'l':
-            return cv_calculations.size_control_valve_l(density.value, Psat.value, Pc.value, d_viscosity.value,
-                                                        P1.value, P2.value, 
-                                                        self.inlet_mass_flowrate.value/density.value)
-        elif phase == 'g' or phase == 'l/g':
-            Z_g = self._connected_stream_property_getter(is_inlet, "material", "Z_g")
-            return cv_calculations.size_control_valve_g(T = self.inlet_temperature.value, 
-                                                        MW = MW.value,
-                                                        mu= d_viscosity.value,
-                                                        gamma = isentropic_exponent, 
-                                                        Z = Z_g,
-                                                        P1 = P1.value, 
-                                                        P2 = P2.value, 
-                                                        Q = self.inlet_mass_flowrate.value/density.value)
-        else:
+        flowrate = self.inlet_mass_flowrate
+        # Phase is str, or pandas Series of str for streams with Series temperature
+        # or pressure. Sizing is selected for every row as per its phase.
+        phases = np.asarray(phase, dtype=object)
+        if not np.isin(phases, ['l', 'g', 'l/g']).all():
             raise Exception('Possibility of fluid solification inside the control valve')
+        is_liquid = phases == 'l'
+        if is_liquid.all() or not is_liquid.any():
+            is_liquid = bool(is_liquid.all())
+        Z_g = None if is_liquid is True else self._connected_stream_property_getter(is_inlet, "material", "Z_g")
+
+        def size(is_liquid, T, MW, density, Psat, Pc, d_viscosity, gamma, Z, P1, P2, flowrate):
+            if is_liquid:
+                return cv_calculations.size_control_valve_l(density, Psat, Pc, d_viscosity,
+                                                            P1, P2, flowrate/density)
+            return cv_calculations.size_control_valve_g(T=T, MW=MW, mu=d_viscosity, gamma=gamma, Z=Z,
+                                                        P1=P1, P2=P2, Q=flowrate/density)
+        return _elementwise(np.vectorize(size, otypes=[float]),
+                            [is_liquid, self.inlet_temperature, MW, density, Psat, Pc,
+                             d_viscosity, isentropic_exponent, Z_g, P1, P2, flowrate])
 
     def connect_stream(self, 
                        stream_object=None, 
@@ -1,4 +1,5 @@
 from propylean.equipments.generic_equipment_classes import _EquipmentOneInletOutlet
+from propylean.registry import _Registry
 from propylean.validators import _Validators
 from propylean.properties import _Property, Pressure, Temperature, VolumetricFlowRate
 from propylean.series import Series
@@ -6,7 +7,7 @@ from propylean.series import Series
 # Base class for all instruments that measures (makes observations).
 # Classes derived from this act as data store.
 class _MeasuringInstruments(object):
-    items = []
+    items = _Registry()
     def __init__(self, measured_property, measured_unit, **inputs) -> None:
         """ 
             DESCRIPTION:
@@ -78,15 +79,13 @@ class _MeasuringInstruments(object):
         self.tag = inputs.pop("tag", self._create_instrument_tag())
         
     def _get_instrument_index(cls, tag):
-        for index, instrument in enumerate(cls.items):
-            if instrument.tag == tag:
-                return index
-        return None
+        instrument = cls.items.get_by_tag(tag)
+        return None if instrument is None else instrument.index
     
     @classmethod
     def _get_instrument_object(cls, obj):
         try:
-            return cls.items[obj.index]
+            return cls.items.resolve(obj, "Instrument")
         except IndexError:
             raise Exception("Instrument does not exist!")
         except AttributeError:
@@ -94,11 +93,8 @@ class _MeasuringInstruments(object):
     
     @classmethod
     def _update_instrument_object(cls, obj):
+        # Registered objects are changed in place, so only type is checked.
         _Validators.validate_arg_prop_value_type("obj", obj, cls)
-        try:
-            cls.items[obj.index] = obj
-        except:
-            pass
     
     @property
     def index(self):
@@ -114,21 +110,49 @@ class _MeasuringInstruments(object):
             msg = "Tag '{}' already assigned!".format(value)
             raise Exception(msg)
         else:
+            self.items.update_tag(self, getattr(self, "_tag", None), value)
             self._tag = value
     
+    def to_dict(self):
+        """
+        DESCRIPTION:
+            Returns dictionary of the instrument with its class, tag and all properties.
+            See propylean.interchange.to_dict for the format.
+
+        RETURN VALUE:
+            Type: dict
+
+        SAMPLE USE CASES:
+            >>> data = PressureGuage.items.get_by_tag("PG-1").to_dict()
+        """
+        from propylean.interchange import to_dict
+        return to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        DESCRIPTION:
+            Creates instrument from dictionary returned by to_dict. Use
+            propylean.load_many to create many objects at once.
+
+        PARAMETERS:
+            data:
+                Required: Yes
+                Type: dict
+
+        RETURN VALUE:
+            Type: Object of the class.
+
+        SAMPLE USE CASES:
+            >>> guage = PressureGuage.from_dict(data)
+        """
+        from propylean.interchange import from_dict
+        return from_dict(data, cls=cls)
+
     def _create_instrument_tag(cls):
-        i = 1
-        class_name = type(cls).__name__
-        tag = class_name+ "_" + str(i)
-        while cls._check_tag_assigned(tag):
-            tag = class_name+ "_" + str(i)
-            i += 1
-        return tag
+        return cls.items.create_tag(type(cls).__name__)
     def _check_tag_assigned(cls, tag):
-        for instru in cls.items:
-            if tag == instru.tag:
-                return True
-        return False
+        return cls.items.has_tag(tag)
     
     @property
     def measured_property(self):
@@ -202,11 +226,10 @@ class _MeasuringInstruments(object):
     
     
 class PressureGuage(_MeasuringInstruments):
-    items = []
+    items = _Registry()
     def __init__(self, measured_unit="Pa", **inputs) -> None:
         super().__init__(measured_property=Pressure, measured_unit=measured_unit, **inputs)
-        self._index = len(PressureGuage.items)
-        PressureGuage.items.append(self)
+        self._index = PressureGuage.items.add(self)
 
     def __repr__(self):
         self = self._get_instrument_object(self)
@@ -224,11 +247,10 @@ class PressureGuage(_MeasuringInstruments):
 
 
 class TemperatureGuage(_MeasuringInstruments):
-    items = []
+    items = _Registry()
     def __init__(self, measured_unit="C", **inputs) -> None:
         super().__init__(measured_property=Temperature, measured_unit=measured_unit, **inputs)
-        self._index = len(TemperatureGuage.items)
-        TemperatureGuage.items.append(self)
+        self._index = TemperatureGuage.items.add(self)
 
     def __repr__(self):
         self = self._get_instrument_object(self)
@@ -250,13 +272,12 @@ class FlowMeter(_EquipmentOneInletOutlet):
       inline equipment as it shares properties and is connected to equipments(pipes)
       on both inlet and outlet.
     """ 
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:
         super().__init__( **inputs)
         del self.energy_out
         del self.energy_in
-        self._index = len(FlowMeter.items)
-        FlowMeter.items.append(self)
+        self._index = FlowMeter.items.add(self)
 
     def __repr__(self):
         self = self._get_equipment_object(self) 
@@ -1,11 +1,11 @@
 from propylean.equipments.generic_equipment_classes import _EquipmentOneInletOutlet
+from propylean.registry import _Registry
 
 class PressureSafetyValve(_EquipmentOneInletOutlet):
-    items = []
+    items = _Registry()
     def __init__(self, **inputs) -> None:      
         super().__init__( **inputs)
-        self._index = len(PressureSafetyValve.items) 
-        PressureSafetyValve.items.append(self)
+        self._index = PressureSafetyValve.items.add(self)
     
     def __repr__(self):
         self = self._get_equipment_object(self)
@@ -0,0 +1,322 @@
+from functools import lru_cache
+import pandas as pd
+from propylean import properties as prop
+from propylean.properties import _Property, PropertyArray, Components
+from propylean.series import Series
+from propylean.model import Model
+from propylean.validators import _Validators
+
+# Attributes which are not exported. Connections are exported by stream
+# tags and restored by connecting streams, which sets these again.
+_CONNECTION_ATTRIBUTES = {"_inlet_material_stream_tag": ("in", "m"),
+                          "_outlet_material_stream_tag": ("out", "m"),
+                          "_inlet_energy_stream_tag": ("in", "e"),
+                          "_outlet_energy_stream_tag": ("out", "e")}
+_INTERNAL_ATTRIBUTES = {"_index", "_is_disconnection", "_dirty_inlet", "_dirty_outlet",
+                        "_inlet_material_stream_index", "_outlet_material_stream_index",
+                        "_inlet_energy_stream_index", "_outlet_energy_stream_index",
+                        "_to_equipment_tag", "_from_equipment_tag"}
+_CONNECTION_KEYS = {"_inlet_material_stream_tag": "inlet_material_stream",
+                    "_outlet_material_stream_tag": "outlet_material_stream",
+                    "_inlet_energy_stream_tag": "inlet_energy_stream",
+                    "_outlet_energy_stream_tag": "outlet_energy_stream"}
+
+def to_dict(obj):
+    """
+    DESCRIPTION:
+        Returns dictionary of a stream, equipment or instrument with its class,
+        tag, all properties and tags of streams connected to it. Values are
+        numbers, strings, lists and dictionaries only, so dictionary can be
+        written as JSON.
+        Physical properties are {'property': <class name>, 'value': <value>,
+        'unit': <unit>} with 'min_val' and 'max_val' if set. Data frames (for e.g.
+        segment_frame or performance_curve) are {'frame': <frame in 'split' orient>}.
+        Components are {'components': <fractions>, 'type': <type>}.
+
+    PARAMETERS:
+        obj:
+            Required: Yes
+            Type: Stream, equipment or instrument.
+
+    RETURN VALUE:
+        Type: dict
+
+    SAMPLE USE CASES:
+        >>> from propylean.interchange import to_dict
+        >>> to_dict(pump)
+        {'class': 'CentrifugalPump', 'tag': 'P-1', 'inlet_pressure': {'property': 'Pressure', ...}, ...}
+    """
+    data = {"class": type(obj).__name__, "tag": obj.tag}
+    connections = {}
+    for name, value in vars(obj).items():
+        if name in _INTERNAL_ATTRIBUTES or name == "_tag":
+            continue
+        if name in _CONNECTION_KEYS:
+            if value is not None:
+                connections[_CONNECTION_KEYS[name]] = value
+            continue
+        data[name[1:] if name.startswith("_") else name] = _encode(value)
+    if connections:
+        data["connections"] = connections
+    return data
+
+def from_dict(data, cls=None):
+    """
+    DESCRIPTION:
+        Creates stream, equipment or instrument from dictionary returned by
+        to_dict in the active model. Properties are set as in the dictionary
+        without being recalculated. Streams in 'connections' are connected if
+        they exist, without matching their properties.
+
+    PARAMETERS:
+        data:
+            Required: Yes
+            Type: dict
+            Description: Dictionary as returned by to_dict.
+
+        cls:
+            Required: No
+            Type: class
+            Default value: Class named by 'class' of data.
+            Description: Class of the object. Should be same as 'class' of data if provided.
+
+    RETURN VALUE:
+        Type: Stream, equipment or instrument.
+
+    ERROR RAISED:
+        Type: Exception
+        Description: If class is not supported, tag is missing or already assigned,
+                     or property value or unit is incorrect.
+
+    SAMPLE USE CASES:
+        >>> from propylean import CentrifugalPump
+        >>> pump = CentrifugalPump.from_dict(data)
+    """
+    return load_many([data], cls=cls)[0]
+
+def load_many(records, cls=None):
+    """
+    DESCRIPTION:
+        Creates many streams, equipments and instruments from dictionaries
+        returned by to_dict in the active model, and connects them in one pass.
+        Tags are checked against registries in constant time and connections
+        only map streams and equipments, so properties are not matched or
+        recalculated for every connection. Connected streams are looked up
+        among created objects first and then in the model.
+
+    PARAMETERS:
+        records:
+            Required: Yes
+            Type: list of dict
+            Description: Dictionaries as returned by to_dict, in any order.
+
+        cls:
+            Required: No
+            Type: class
+            Default value: Class named by 'class' of every dictionary.
+            Description: Class of all objects, if all are of one class.
+
+    RETURN VALUE:
+        Type: list
+        Description: Created objects in order of records.
+
+    ERROR RAISED:
+        Type: Exception
+        Description: If class is not supported, tag is missing or already assigned,
+                     or connected stream does not exist.
+
+    SAMPLE USE CASES:
+        >>> from propylean import load_many
+        >>> objects = load_many(json.load(open("plant.json")))
+    """
+    classes = _supported_classes()
+    objects = []
+    created_tags = {}
+    for data in records:
+        obj_cls = _record_class(data, cls, classes)
+        obj = _create(obj_cls, data, created_tags)
+        objects.append(obj)
+    model = Model.current()
+    model._deferred_propagation += 1
+    try:
+        from propylean.streams import MaterialStream, EnergyStream
+        stream_classes = {"m": MaterialStream, "e": EnergyStream}
+        for obj, data in zip(objects, records):
+            for key, stream_tag in data.get("connections", {}).items():
+                attribute = "_" + key + "_tag"
+                if attribute not in _CONNECTION_ATTRIBUTES:
+                    raise Exception("Connection '{}' not supported. Should be one of {}.".format(
+                                    key, list(_CONNECTION_KEYS.values())))
+                direction, stream_type = _CONNECTION_ATTRIBUTES[attribute]
+                stream = created_tags.get((stream_classes[stream_type], stream_tag))
+                if stream is None:
+                    stream = stream_classes[stream_type].items.get_by_tag(stream_tag)
+                if stream is None:
+                    raise Exception("Stream '{}' connected to '{}' not found.".format(stream_tag, obj.tag))
+                obj.connect_stream(stream, direction=direction, stream_type=stream_type)
+    finally:
+        model._deferred_propagation -= 1
+    return objects
+
+def _supported_classes():
+    """
+    Internal function to get final classes of streams, equipments and instruments by name.
+    """
+    from propylean.streams import Stream
+    from propylean.equipments.abstract_equipment_classes import _EquipmentOneInletOutlet
+    from propylean.instruments.measurement import _MeasuringInstruments
+    # Import all modules so that all classes are defined.
+    from propylean.equipments import static, exchangers, separators, rotary, storages
+    from propylean.instruments import control, safety
+    classes = {}
+    pending = [Stream, _EquipmentOneInletOutlet, _MeasuringInstruments]
+    while pending:
+        cls = pending.pop()
+        if not cls.__name__.startswith("_") and hasattr(cls, "items"):
+            classes[cls.__name__] = cls
+        pending.extend(cls.__subclasses__())
+    return classes
+
+def _record_class(data, cls, classes):
+    name = data.get("class")
+    if cls is not None:
+        if name is not None and name != cls.__name__:
+            raise Exception("Dictionary of class '{}' cannot be loaded as '{}'.".format(name, cls.__name__))
+        return cls
+    if name not in classes:
+        raise Exception("Class '{}' not supported. Should be one of {}.".format(name, sorted(classes)))
+    return classes[name]
+
+def _create(cls, data, created_tags):
+    tag = data.get("tag")
+    if not isinstance(tag, str):
+        raise Exception("Dictionary should have 'tag' of type str.")
+    if cls.items.has_tag(tag):
+        raise Exception("Tag already assinged!")
+    obj = cls.__new__(cls)
+    state = _initial_state(cls)
+    state["_tag"] = tag
+    for key, value in data.items():
+        if key in ("class", "tag", "connections"):
+            continue
+        # Attributes behind a property are stored with leading underscore.
+        name = "_" + key if isinstance(getattr(cls, key, None), property) else key
+        state[name] = _decode(value)
+    obj.__dict__.update(state)
+    obj._index = cls.items.add(obj)
+    created_tags[(_stream_class(cls), tag)] = obj
+    return obj
+
+def _initial_state(cls):
+    """
+    Internal function to get state of an unconnected object, which is not exported.
+    """
+    from propylean.streams import Stream
+    from propylean.equipments.abstract_equipment_classes import _EquipmentOneInletOutlet
+    if issubclass(cls, Stream):
+        return {"_to_equipment_tag": None, "_from_equipment_tag": None}
+    if issubclass(cls, _EquipmentOneInletOutlet):
+        state = dict.fromkeys(_CONNECTION_ATTRIBUTES)
+        state.update(dict.fromkeys(name for name in _INTERNAL_ATTRIBUTES
+                                   if name.endswith("_stream_index")))
+        state["_is_disconnection"] = False
+        return state
+    return {}
+
+def _stream_class(cls):
+    """
+    Internal function to get key of created objects. Streams are keyed by
+    MaterialStream or EnergyStream, other objects by their own class.
+    """
+    from propylean.streams import MaterialStream, EnergyStream
+    for stream_cls in (MaterialStream, EnergyStream):
+        if issubclass(cls, stream_cls):
+            return stream_cls
+    return cls
+
+def _encode(value):
+    if isinstance(value, _Property):
+        data = {"property": type(value).__name__, "value": value.value, "unit": value.unit}
+        if value._min_val is not None:
+            data["min_val"] = value._min_val
+        if value._max_val is not None:
+            data["max_val"] = value._max_val
+        if isinstance(value, prop.Dimensionless) and value._name is not None:
+            data["name"] = value._name
+        return data
+    if isinstance(value, Series):
+        series = value._instance
+        if not isinstance(series, pd.Series):
+            series = series.to_pandas()
+        return {"property": value.prop.__name__, "unit": value.unit,
+                "series": _encode_frame(series.to_frame())}
+    if isinstance(value, PropertyArray):
+        return {"property": value._prop.__name__, "unit": value.unit, "values": value.value.tolist()}
+    if isinstance(value, pd.DataFrame):
+        return {"frame": _encode_frame(value)}
+    if isinstance(value, Components):
+        return {"components": value.fractions, "type": value.type}
+    if isinstance(value, type) and issubclass(value, _Property):
+        return {"property_class": value.__name__}
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+def _encode_frame(frame):
+    data = frame.to_dict(orient="split")
+    if isinstance(frame.index, pd.DatetimeIndex):
+        data["index"] = [timestamp.isoformat() for timestamp in frame.index]
+        data["datetime_index"] = True
+    data["data"] = [[list(cell) if isinstance(cell, tuple) else cell for cell in row]
+                    for row in data["data"]]
+    return data
+
+def _decode_frame(data):
+    index = pd.to_datetime(data["index"]) if data.get("datetime_index") else data["index"]
+    # Lists in cells are (value, unit) tuples turned into lists by JSON.
+    rows = [[tuple(cell) if isinstance(cell, list) else cell for cell in row]
+            for row in data["data"]]
+    return pd.DataFrame(rows, index=index, columns=data["columns"])
+
+@lru_cache(maxsize=None)
+def _property_class(name):
+    prop_cls = getattr(prop, name, None)
+    if not (isinstance(prop_cls, type) and issubclass(prop_cls, _Property)):
+        raise Exception("Property '{}' not supported.".format(name))
+    return prop_cls
+
+@lru_cache(maxsize=None)
+def _validate_unit(prop_cls, unit):
+    """
+    Internal function to validate unit of a property once for every unit.
+    """
+    prop_cls(0, unit)
+
+def _decode(value):
+    if not isinstance(value, dict):
+        return value
+    if "property_class" in value:
+        return _property_class(value["property_class"])
+    if "components" in value:
+        return Components(value["components"], value["type"])
+    if "frame" in value:
+        return _decode_frame(value["frame"])
+    if "property" not in value:
+        return value
+    prop_cls = _property_class(value["property"])
+    if "series" in value:
+        series = _decode_frame(value["series"]).iloc[:, 0]
+        return Series(series.to_numpy(), prop=prop_cls, unit=value["unit"], index=series.index)
+    if "values" in value:
+        return PropertyArray(value["values"], prop_cls, value["unit"])
+    if value["unit"] is None:
+        decoded = prop_cls._from_trusted(value["value"], None)
+        if "name" in value:
+            decoded._name = value["name"]
+    else:
+        _Validators.validate_arg_prop_value_type("value", value["value"], (int, float))
+        _validate_unit(prop_cls, value["unit"])
+        decoded = prop_cls._from_trusted(value["value"], value["unit"])
+    decoded._min_val = value.get("min_val")
+    decoded._max_val = value.get("max_val")
+    return decoded
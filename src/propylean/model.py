@@ -0,0 +1,233 @@
+import pickle
+from collections.abc import MutableMapping
+from contextvars import ContextVar
+
+class Model(object):
+    def __init__(self):
+        """
+        DESCRIPTION:
+            Class to hold a model, i.e. registries of all streams, equipments and
+            instruments and the maps of stream-equipment connections.
+            Objects created and accessed inside 'with model:' belong to that model.
+            Objects created outside of any model belong to the default model.
+            Object used while other model is active raises Exception, as handles
+            of objects start from 0 in every model.
+            Models are independent of each other, so many of them can be held
+            in memory and evaluated concurrently, one per thread or task,
+            without any locking. Model is active only in the thread or
+            asyncio task which entered it.
+            Settings and cache of stream properties are shared by all models.
+
+            Threading contract:
+                - Property getters do not change stored properties. Units are
+                  converted on copies, so any number of threads can read
+                  properties of a model which is not being changed.
+                - Getters of derived properties (for e.g. head, Cv, pressure_drop)
+                  first solve equipments made dirty by earlier changes, which
+                  is a change of the model. Solve the model (for e.g. with
+                  Flowsheet.solve) before sharing it among readers.
+                - Setting properties, connecting streams and solving need
+                  exclusive access to the model. To change models concurrently,
+                  give each thread its own model or clone.
+                - Cache of stream properties is guarded by a lock.
+
+        RETURN VALUE:
+            Type: Model
+            Description: Object of type Model
+
+        SAMPLE USE CASES:
+            >>> from propylean import Model, MaterialStream
+            >>> model = Model()
+            >>> with model:
+            >>>     s1 = MaterialStream(tag="S1", pressure=(10, 'bar'))
+            >>> scenario = model.clone()
+            >>> with scenario:
+            >>>     MaterialStream.items.get_by_tag("S1").pressure = (20, 'bar')
+        """
+        # Registry of every class keyed by the class defining 'items'.
+        self._registries = {}
+        self._material_stream_equipment_map = {}
+        self._energy_stream_equipment_map = {}
+        # Greater than zero while connections are made inside
+        # Flowsheet.deferred_propagation.
+        self._deferred_propagation = 0
+        # True while derived property getters should not refresh dirty equipments.
+        self._refreshing = False
+        self._tokens = []
+
+    @staticmethod
+    def current():
+        """
+        DESCRIPTION:
+            Returns model active in present thread or task.
+
+        RETURN VALUE:
+            Type: Model
+        """
+        return _current_model.get()
+
+    @staticmethod
+    def default():
+        """
+        DESCRIPTION:
+            Returns default model which holds objects created outside of any model.
+
+        RETURN VALUE:
+            Type: Model
+        """
+        return _default_model
+
+    def __enter__(self):
+        self._tokens.append(_current_model.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_model.reset(self._tokens.pop())
+
+    def registry(self, cls):
+        """
+        DESCRIPTION:
+            Returns registry of objects of class cls in this model.
+
+        PARAMETERS:
+            cls:
+                Required: Yes
+                Type: class
+                Description: Class of stream, equipment or instrument.
+
+        RETURN VALUE:
+            Type: _Registry
+        """
+        with self:
+            return cls.items
+
+    def clone(self):
+        """
+        DESCRIPTION:
+            Returns independent copy of the model with copies of all its objects
+            and connections. Changes in one do not affect the other.
+
+        RETURN VALUE:
+            Type: Model
+
+        SAMPLE USE CASES:
+            >>> case = Model.current().clone()
+        """
+        return Model._from_state(pickle.loads(self._dumps()))
+
+    def clear(self):
+        """
+        DESCRIPTION:
+            Removes all objects and connections from the model.
+        """
+        for registry in self._registries.values():
+            registry.clear()
+        self._material_stream_equipment_map.clear()
+        self._energy_stream_equipment_map.clear()
+
+    def save(self, path):
+        """
+        DESCRIPTION:
+            Saves all objects and connections of the model to a binary
+            snapshot file. See propylean.snapshot for the format.
+
+        PARAMETERS:
+            path:
+                Required: Yes
+                Type: str
+                Description: Path of the snapshot file.
+
+        SAMPLE USE CASES:
+            >>> Model.current().save("plant.prs")
+        """
+        from propylean import snapshot
+        snapshot.save(self, path)
+
+    @staticmethod
+    def load(path):
+        """
+        DESCRIPTION:
+            Returns new model loaded from binary snapshot file saved by save.
+            File is memory-mapped while loading.
+
+        PARAMETERS:
+            path:
+                Required: Yes
+                Type: str
+                Description: Path of the snapshot file.
+
+        RETURN VALUE:
+            Type: Model
+
+        SAMPLE USE CASES:
+            >>> model = Model.load("plant.prs")
+            >>> with model:
+            >>>     pump = CentrifugalPump.items.get_by_tag("P-101")
+        """
+        from propylean import snapshot
+        return snapshot.load(path)
+
+    def _dumps(self):
+        """
+        Internal function to serialize registries and stream-equipment maps.
+        """
+        state = {"registries": {owner: registry for owner, registry in self._registries.items()
+                                if len(registry) > 0},
+                 "material_map": self._material_stream_equipment_map,
+                 "energy_map": self._energy_stream_equipment_map}
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _from_state(state):
+        model = Model()
+        model._registries.update(state["registries"])
+        model._material_stream_equipment_map.update(state["material_map"])
+        model._energy_stream_equipment_map.update(state["energy_map"])
+        return model
+
+    @staticmethod
+    def _loads(data):
+        """
+        Internal function to create model from data of _dumps.
+        """
+        return Model._from_state(pickle.loads(data))
+
+_default_model = Model()
+_current_model = ContextVar("propylean_model", default=_default_model)
+
+class _ModelMap(MutableMapping):
+    def __init__(self, name):
+        """
+        DESCRIPTION:
+            Internal dictionary which forwards to stream-equipment map
+            attribute 'name' of the model active in present thread or task.
+        """
+        self._name = name
+
+    def _map(self):
+        return getattr(_current_model.get(), self._name)
+
+    def __getitem__(self, key):
+        return self._map()[key]
+
+    def __setitem__(self, key, value):
+        self._map()[key] = value
+
+    def __delitem__(self, key):
+        del self._map()[key]
+
+    def __contains__(self, key):
+        return key in self._map()
+
+    def __iter__(self):
+        return iter(self._map())
+
+    def __len__(self):
+        return len(self._map())
+
+    def __repr__(self):
+        return repr(self._map())
+
+    def __reduce__(self):
+        # Serialized as plain dictionary of the active model.
+        return (dict, (dict(self._map()),))
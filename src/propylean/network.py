@@ -0,0 +1,305 @@
+from math import pi
+import numpy as np
+from propylean import properties as prop
+from propylean.constants import Constants
+from propylean.friction import friction_factor, laminar, LAMINAR_TRANSITION_PIPE
+from propylean.equipments.static import PipeSegment
+from propylean.streams import MaterialStream
+from propylean.validators import _Validators
+
+class PipeNetwork(object):
+    def __init__(self, connections, pressures, demands=None, fluid=None):
+        """
+        DESCRIPTION:
+            Class to represent looped or branched network of PipeSegments.
+            PipeSegments are edges of the network and nodes are junctions
+            between them. Flows in PipeSegments and pressures at junctions
+            are solved together with Newton-Raphson iterations of the global
+            gradient algorithm, which needs one sparse linear solve of size
+            equal to number of junctions per iteration.
+
+        PARAMETERS:
+            connections:
+                Required: Yes
+                Type: list
+                Acceptable values: PipeSegment objects or tuples (PipeSegment, from_node, to_node).
+                Description: Edges of the network. Nodes can be any hashable object, for e.g.
+                             junction names or MaterialStream objects. If only PipeSegment is
+                             provided, MaterialStreams connected at its inlet and outlet are
+                             its from and to nodes. Positive flow is from from_node to to_node.
+
+            pressures:
+                Required: Yes
+                Type: dict
+                Acceptable values: node: int or float or tuple or property.Pressure
+                Description: Nodes with known pressure, for e.g. supply headers and open ends.
+                             Every part of the network needs atleast one such node.
+
+            demands:
+                Required: No
+                Type: dict
+                Acceptable values: node: int or float or tuple or property.MassFlowRate
+                Default value: None
+                Description: Flow withdrawn from the network at nodes. Negative value is flow
+                             supplied to the network. Demands at known pressure nodes are ignored.
+
+            fluid:
+                Required: No
+                Type: MaterialStream
+                Default value: First MaterialStream connected to a PipeSegment of the network.
+                Description: Stream whose density and viscosity are used for the whole network.
+
+        RETURN VALUE:
+            Type: PipeNetwork
+            Description: Object of type PipeNetwork
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If connections, pressures or demands are incorrect.
+
+        SAMPLE USE CASES:
+            >>> from propylean import PipeNetwork
+            >>> network = PipeNetwork(connections=[(pipe_1, "header", "A"),
+                                                   (pipe_2, "A", "B"),
+                                                   (pipe_3, "header", "B")],
+                                      pressures={"header": (8, "bar")},
+                                      demands={"B": (50, "kg/s")},
+                                      fluid=water)
+            >>> network.solve()
+            >>> network.node_pressures["B"]
+        """
+        _Validators.validate_arg_prop_value_type("connections", connections, list)
+        _Validators.validate_arg_prop_value_type("pressures", pressures, dict)
+        if demands is None:
+            demands = {}
+        _Validators.validate_arg_prop_value_type("demands", demands, dict)
+        self._edges = [self._edge(connection) for connection in connections]
+        self._nodes = []
+        node_indices = {}
+        for _, from_node, to_node in self._edges:
+            for node in (from_node, to_node):
+                if node not in node_indices:
+                    node_indices[node] = len(self._nodes)
+                    self._nodes.append(node)
+        for name, nodes in [("pressures", pressures), ("demands", demands)]:
+            for node in nodes:
+                if node not in node_indices:
+                    raise Exception("Node '{}' provided to '{}' is not connected to any PipeSegment.".format(node, name))
+        if len(pressures) == 0:
+            raise Exception("Provide atleast one node with known pressure to 'pressures'.")
+        self._node_indices = node_indices
+        self._pressures = {node: self._to_value(value, prop.Pressure, "Pa")
+                           for node, value in pressures.items()}
+        self._demands = {node: self._to_value(value, prop.MassFlowRate, "kg/s")
+                         for node, value in demands.items()}
+        self._fluid = fluid if fluid is not None else self._connected_fluid()
+        _Validators.validate_arg_prop_value_type("fluid", self._fluid, MaterialStream)
+        self.node_pressures = {}
+        self.edge_flows = {}
+        self.iterations = 0
+
+    @staticmethod
+    def _edge(connection):
+        if isinstance(connection, tuple):
+            if len(connection) != 3:
+                raise Exception("Provide connection as (PipeSegment, from_node, to_node).")
+            pipe, from_node, to_node = connection
+        else:
+            pipe = connection
+            _Validators.validate_arg_prop_value_type("connections", pipe, PipeSegment)
+            if (pipe._inlet_material_stream_index is None or
+                pipe._outlet_material_stream_index is None):
+                raise Exception("PipeSegment {} should be connected with MaterialStream at inlet and outlet or provided with nodes.".format(pipe.tag))
+            from_node = MaterialStream.items[pipe._inlet_material_stream_index]
+            to_node = MaterialStream.items[pipe._outlet_material_stream_index]
+        _Validators.validate_arg_prop_value_type("connections", pipe, PipeSegment)
+        if from_node == to_node:
+            raise Exception("PipeSegment {} cannot start and end at same node.".format(pipe.tag))
+        return pipe, from_node, to_node
+
+    @staticmethod
+    def _to_value(value, prop_type, unit):
+        _Validators.validate_arg_prop_value_type(prop_type.__name__, value, (prop_type, int, float, tuple))
+        if isinstance(value, tuple):
+            value = prop_type(*value)
+        elif not isinstance(value, prop_type):
+            value = prop_type(value)
+        return value.to_unit(unit).value
+
+    def _connected_fluid(self):
+        for pipe, from_node, to_node in self._edges:
+            for node in (from_node, to_node):
+                if isinstance(node, MaterialStream):
+                    return node
+            for index in (pipe._inlet_material_stream_index, pipe._outlet_material_stream_index):
+                if index is not None:
+                    return MaterialStream.items[index]
+        raise Exception("No MaterialStream connected to the network. Provide 'fluid'.")
+
+    @property
+    def nodes(self):
+        return list(self._nodes)
+
+    @property
+    def pipes(self):
+        return [pipe for pipe, _, _ in self._edges]
+
+    def _build(self):
+        """
+        Internal function to gather segments of all PipeSegments as arrays with
+        index of their edge, and sparse incidence matrices of the network.
+        """
+        from scipy import sparse
+        density = self._fluid.density.to_unit("kg/m^3").value
+        viscosity = self._fluid.d_viscosity.to_unit("Pa-s").value
+        if density <= 0 or viscosity <= 0:
+            raise Exception("Fluid should have positive density and viscosity. Set components of the fluid MaterialStream.")
+
+        edge_of_segment = []
+        segment_arrays = {}
+        for edge, (pipe, _, _) in enumerate(self._edges):
+            arrays = pipe._segment_arrays()
+            for key, values in arrays.items():
+                segment_arrays.setdefault(key, []).append(values)
+            edge_of_segment.append(np.full(len(arrays["ID"]), edge))
+        segments = {key: np.concatenate(values) for key, values in segment_arrays.items()}
+        ID = segments["ID"]
+        self._density = density
+        self._viscosity = viscosity
+        self._segment_edge = np.concatenate(edge_of_segment)
+        self._segment_ID = ID
+        self._segment_area = pi/4 * ID**2
+        self._segment_eD = np.array(Constants.ROUGHNESS)[segments["material"] - 1] / ID
+        self._segment_L = PipeSegment._equivalent_lengths(segments["segment_type"], ID,
+                                                          segments["length"], segments["material"],
+                                                          segments["shape_ratio"])
+        self._hydrostatic = np.bincount(self._segment_edge,
+                                        weights=segments["elevation"] * density * Constants.g,
+                                        minlength=len(self._edges))
+
+        is_fixed = np.array([node in self._pressures for node in self._nodes])
+        self._unknown = np.flatnonzero(~is_fixed)
+        self._fixed = np.flatnonzero(is_fixed)
+        column = np.full(len(self._nodes), -1)
+        column[self._unknown] = np.arange(len(self._unknown))
+        column[self._fixed] = np.arange(len(self._fixed))
+        edges = np.arange(len(self._edges))
+        from_nodes = np.array([self._node_indices[from_node] for _, from_node, _ in self._edges])
+        to_nodes = np.array([self._node_indices[to_node] for _, _, to_node in self._edges])
+        incidence = {}
+        for name, node_set, fixed in [("unknown", self._unknown, False), ("fixed", self._fixed, True)]:
+            rows, cols, values = [], [], []
+            for nodes, sign in [(from_nodes, 1.0), (to_nodes, -1.0)]:
+                selected = is_fixed[nodes] == fixed
+                rows.append(edges[selected])
+                cols.append(column[nodes[selected]])
+                values.append(np.full(selected.sum(), sign))
+            incidence[name] = sparse.csr_matrix((np.concatenate(values),
+                                                 (np.concatenate(rows), np.concatenate(cols))),
+                                                shape=(len(self._edges), len(node_set)))
+        self._A = incidence["unknown"]
+        self._A0 = incidence["fixed"]
+        self._fixed_pressures = np.array([self._pressures[self._nodes[i]] for i in self._fixed])
+        supply = np.zeros(len(self._nodes))
+        for node, demand in self._demands.items():
+            supply[self._node_indices[node]] -= demand / density
+        self._supply = supply[self._unknown]
+
+    def _resistance(self, flow):
+        """
+        Internal function to get K of every edge such that frictional
+        pressure drop (Pa) is K*Q*|Q| for volumetric flow Q (m^3/s).
+        """
+        V = flow[self._segment_edge] / self._segment_area
+        Re = self._density * V * self._segment_ID / self._viscosity
+        # Larger of laminar and turbulent friction factors keeps pressure drop
+        # continuous across laminar transition, else Newton iterations can
+        # cycle around edges with nearly zero flow.
+        fd = np.maximum(friction_factor(Re=np.maximum(Re, LAMINAR_TRANSITION_PIPE),
+                                        eD=self._segment_eD, Darcy=True),
+                        laminar(Re))
+        K = fd * self._segment_L / self._segment_ID * self._density / (2 * self._segment_area**2)
+        return np.bincount(self._segment_edge, weights=K, minlength=len(self._edges))
+
+    def solve(self, tol=1e-8, max_iterations=100):
+        """
+        DESCRIPTION:
+            Solves flows in all PipeSegments and pressures at all nodes.
+            Results are set as pressure of MaterialStream nodes and mass
+            flowrate of MaterialStreams connected to PipeSegments.
+
+        PARAMETERS:
+            tol:
+                Required: No
+                Type: float
+                Default value: 1e-8
+                Description: Relative change of flows at which iterations stop.
+
+            max_iterations:
+                Required: No
+                Type: int
+                Default value: 100
+
+        RETURN VALUE:
+            Type: PipeNetwork
+            Description: The network itself with node_pressures (dict of node and
+                         property.Pressure) and edge_flows (dict of PipeSegment and
+                         property.MassFlowRate).
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If iterations do not converge.
+        """
+        from scipy import sparse
+        from scipy.sparse.linalg import spsolve
+        self._build()
+        A, A0, AT = self._A, self._A0, self._A.T.tocsr()
+        fixed_drop = A0 @ self._fixed_pressures
+        # Start with 1 m/s in every edge.
+        first_segment = np.unique(self._segment_edge, return_index=True)[1]
+        flow = self._segment_area[first_segment].copy()
+        pressure = np.full(len(self._unknown),
+                           self._fixed_pressures.mean() if len(self._fixed_pressures) else 0.0)
+        minimum_flow = 1e-12 * max(np.abs(flow).max(), 1e-12)
+        for iteration in range(1, max_iterations + 1):
+            magnitude = np.maximum(np.abs(flow), minimum_flow)
+            K = self._resistance(magnitude)
+            # Exponent of Q in pressure drop: 2 for fully rough, 1 for laminar flow.
+            exponent = 2 + np.log(self._resistance(magnitude * 1.0001) / K) / np.log(1.0001)
+            D = np.maximum(exponent * K * magnitude, 1e-300)
+            edge_residual = K * flow * magnitude + self._hydrostatic - (A @ pressure + fixed_drop)
+            node_residual = AT @ flow - self._supply
+            if len(self._unknown):
+                M = (AT @ sparse.diags(1 / D) @ A).tocsc()
+                dP = spsolve(M, AT @ (edge_residual / D) - node_residual)
+                dP = np.atleast_1d(dP)
+            else:
+                dP = np.zeros(0)
+            dQ = (A @ dP - edge_residual) / D
+            flow = flow + dQ
+            pressure = pressure + dP
+            if np.all(np.isfinite(flow)) and np.abs(dQ).max() <= tol * max(np.abs(flow).max(), minimum_flow):
+                break
+        else:
+            raise Exception("PipeNetwork did not converge in {} iterations.".format(max_iterations))
+        self.iterations = iteration
+
+        node_pressure = np.empty(len(self._nodes))
+        node_pressure[self._unknown] = pressure
+        node_pressure[self._fixed] = self._fixed_pressures
+        self.node_pressures = {node: prop.Pressure(node_pressure[i], "Pa")
+                               for i, node in enumerate(self._nodes)}
+        self.edge_flows = {pipe: prop.MassFlowRate(flow[edge] * self._density, "kg/s")
+                           for edge, (pipe, _, _) in enumerate(self._edges)}
+        self._set_stream_results()
+        return self
+
+    def _set_stream_results(self):
+        for node, pressure in self.node_pressures.items():
+            if isinstance(node, MaterialStream):
+                node.pressure = pressure.to_unit(node.pressure.unit)
+        for pipe, flow in self.edge_flows.items():
+            for index in (pipe._inlet_material_stream_index, pipe._outlet_material_stream_index):
+                if index is not None:
+                    stream = MaterialStream.items[index]
+                    stream.mass_flowrate = flow.to_unit(stream.mass_flowrate.unit)
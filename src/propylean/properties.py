@@ -1,8 +1,15 @@
 from propylean.validators import _Validators
 from propylean.constants import ConversionFactors
 from warnings import warn
+import numpy as np
 
 class _Property(object):
+    __slots__ = ("_value", "_unit", "_min_val", "_max_val")
+    # Conversion table from ConversionFactors and whether factors are to be
+    # inverted. Set once per class so that unit changes do not look them up.
+    _conversion_factors = None
+    _invert_factor = False
+
     def __init__(self, value=None, unit=None, min_val=None, max_val=None):
         _Validators.validate_arg_prop_value_type("value", value, (int, float))
         _Validators.validate_arg_prop_value_type("unit", unit, str)
@@ -10,6 +17,19 @@ class _Property(object):
         self._min_val = min_val
         self._max_val = max_val
         self._unit = unit
+
+    @classmethod
+    def _from_trusted(cls, value, unit, min_val=None, max_val=None):
+        """
+        Internal constructor for already validated values in supported unit.
+        Skips validation and unit conversion. Not to be used for user inputs.
+        """
+        obj = cls.__new__(cls)
+        obj._value = value
+        obj._unit = unit
+        obj._min_val = min_val
+        obj._max_val = max_val
+        return obj
     
     def __eq__(self, other):
         if (isinstance(other, _Property) and
@@ -52,42 +72,113 @@ class _Property(object):
 
     def __repr__(self) -> str:
         return str(self.value) + ' ' + self.unit
+
+    def to_unit(self, unit):
+        """
+        DESCRIPTION:
+            Returns copy of the property converted to another unit.
+            The property itself is not changed.
+
+        PARAMETERS:
+            unit:
+                Required: Yes
+                Type: str
+                Acceptable values: All units associated with the property.
+                Description: Unit to which values are to be converted.
+
+        RETURN VALUE:
+            Type: Same as the property.
+
+        SAMPLE USE CASES:
+            >>> Temperature(25, "C").to_unit("K")
+        """
+        converted = self._from_trusted(self._value, self._unit,
+                                       self._min_val, self._max_val)
+        converted.unit = unit
+        return converted
+
+    def _other_in_unit(self, other):
+        """
+        Internal function returning (value, min_val, max_val) of other in unit
+        of self without changing other.
+        """
+        if self._unit == other._unit:
+            return other.value, other.min_val, other.max_val
+        if self._conversion_factors is None:
+            other = other._from_trusted(other._value, other._unit,
+                                        other._min_val, other._max_val)
+            other.unit = self._unit
+            return other.value, other.min_val, other.max_val
+        factor, offset = self._unit_conversion(other._unit, self._unit)
+        return (other.value * factor + offset,
+                other.min_val * factor + offset,
+                other.max_val * factor + offset)
     
     def __add__(self, other):
-        if self.unit != other.unit:
-            other.unit = self.unit
-        return type(self)(value=self.value + other.value, 
-                          unit=self.unit,
-                          min_val=self.max_val + other.min_val,
-                          max_val=self.max_val + other.max_val)
+        if not isinstance(other, _Property):
+            return NotImplemented
+        value, min_val, max_val = self._other_in_unit(other)
+        return self._from_trusted(value=self.value + value, 
+                                  unit=self.unit,
+                                  min_val=self.max_val + min_val,
+                                  max_val=self.max_val + max_val)
     
     def __sub__(self, other):
-        if self.unit != other.unit:
-            other.unit = self.unit
-        return type(self)(value=self.value - other.value,
-                          unit=self.unit,
-                          min_val=self.min_val - other.min_val, 
-                          max_val=self.max_val - other.min_val)
+        if not isinstance(other, _Property):
+            return NotImplemented
+        value, min_val, max_val = self._other_in_unit(other)
+        return self._from_trusted(value=self.value - value,
+                                  unit=self.unit,
+                                  min_val=self.min_val - min_val, 
+                                  max_val=self.max_val - min_val)
     
     def __truediv__(self, other):
-        if self.unit != other.unit:
-            other.unit = self.unit
-        return self.value / other.value
+        if not isinstance(other, _Property):
+            return NotImplemented
+        value, _, _ = self._other_in_unit(other)
+        return self.value / value
 
     def __eq__(self, other):
         if isinstance(other, type(self)):
-            if self.unit != other.unit:
-                other.unit = self.unit
-            return self.value == other.value
+            value, _, _ = self._other_in_unit(other)
+            return self.value == value
         else:
             return False
     
-    def _convert_values_for_unit_change(self, unit, invert_factor=False):
+    @classmethod
+    def _unit_conversion(cls, from_unit, to_unit):
+        """
+        Internal function to get the linear relation between two units of the property.
+        Returns (factor, offset) such that value in to_unit = value in from_unit * factor + offset.
+        Used for converting array-like values (for e.g. Series) without creating one property per value.
+        """
+        if from_unit == to_unit:
+            return 1, 0
+        factors = cls._conversion_factors
+        if factors is not None and from_unit in factors and to_unit in factors:
+            # Same arithmetic as _convert_values_for_unit_change so that
+            # converted values match unit changes of a property exactly.
+            factor = factors[to_unit] / factors[from_unit]
+            return (1 / factor if cls._invert_factor else factor), 0
+        zero = cls(0, from_unit)
+        zero.unit = to_unit
+        one = cls(1, from_unit)
+        one.unit = to_unit
+        return one.value - zero.value, zero.value
+
+    def _convert_values_for_unit_change(self, unit, invert_factor=None):
         """
         Internal function to convert all values (min, norm and max values) for any unit change.
         """
-        conversion_factor = getattr(ConversionFactors, self.__class__.__name__.upper())
+        conversion_factor = self._conversion_factors
+        if conversion_factor is None:
+            conversion_factor = getattr(ConversionFactors, self.__class__.__name__.upper())
+        if invert_factor is None:
+            invert_factor = self._invert_factor
         conversion_factor = conversion_factor[unit] / conversion_factor[self._unit]
+        if conversion_factor == 1:
+            self._unit = unit
+            return
         if invert_factor:
             conversion_factor = 1 / conversion_factor
         if self._value is not None:
@@ -99,6 +190,9 @@ class _Property(object):
         self._unit = unit
 
 class Length(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.LENGTH
+    _invert_factor = True
     def __init__(self, value=0, unit='m', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -107,7 +201,7 @@ class Length(_Property):
     def unit(self, unit):
         _Validators.validate_arg_prop_value_type("unit", unit, (str))
         try:
-            self._convert_values_for_unit_change(unit, True)
+            self._convert_values_for_unit_change(unit)
         except KeyError:
             raise Exception('''Selected unit is not supported or a correct unit of Length.
                                Supported units are:
@@ -125,6 +219,9 @@ class Length(_Property):
             raise
 
 class Time(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.TIME
+    _invert_factor = True
     def __init__(self, value=0, unit='sec', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -133,7 +230,7 @@ class Time(_Property):
     def unit(self, unit):
         _Validators.validate_arg_prop_value_type("unit", unit, (str))
         try:
-            self._convert_values_for_unit_change(unit, True)
+            self._convert_values_for_unit_change(unit)
         except KeyError:
             raise Exception('''Selected unit is not supported or a correct unit of Time.
                                Supported units are:
@@ -150,6 +247,9 @@ class Time(_Property):
             raise
     
 class Pressure(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.PRESSURE
+    _invert_factor = True
     def __init__(self, value=101325, unit='Pa', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -158,7 +258,7 @@ class Pressure(_Property):
     def unit(self, unit):
         _Validators.validate_arg_prop_value_type("unit", unit, (str))
         try:
-            self._convert_values_for_unit_change(unit, True)
+            self._convert_values_for_unit_change(unit)
         except KeyError:
             raise Exception('''Selected unit is not supported or a correct unit of Length.
                                Supported units are:
@@ -180,6 +280,11 @@ class Pressure(_Property):
             raise
 
 class Temperature(_Property):
+    # Values before the first of a chain of unit conversions and values after
+    # the last one. See unit setter.
+    __slots__ = ("_origin",)
+    _scales = ConversionFactors.TEMPERATURE
+
     def __init__(self, value=298, unit='K', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -187,29 +292,23 @@ class Temperature(_Property):
     @_Property.unit.setter
     def unit(self, unit):
         _Validators.validate_arg_prop_value_type("unit", unit, (str))
-        if unit in ['K', 'C', 'F', 'R']:
-            while unit != self._unit:
-                if self._unit == 'K':
-                    self._value -= 273.15
-                    self._unit = 'C'
-                    if unit == self._unit:
-                        break
-                if self._unit == 'C':
-                    self._value = self._value * 9/5 + 32
-                    self._unit = 'F'
-                    if unit == self._unit:
-                        break
-                if self._unit == 'F':
-                    self._value = self._value  + 459.67
-                    self._unit = 'R'
-                    if unit == self._unit:
-                        break
-                if self._unit == 'R':
-                    self._value = self._value  * 5 / 9
-                    self._unit = 'K'
-                    if unit == self._unit:
-                        break
-            self._value = round(self.value,5)
+        if unit in self._scales:
+            if unit != self._unit:
+                # Values are converted from values before the first conversion,
+                # unless changed since the last one. So repeated conversions do
+                # not accumulate floating point errors and converting back to
+                # the original unit gives the original values exactly.
+                state = (self._unit, self._value, self._min_val, self._max_val)
+                origin = getattr(self, "_origin", None)
+                if origin is None or origin[1] != state:
+                    origin = (state, None)
+                origin_unit, *values = origin[0]
+                if unit != origin_unit:
+                    values = [None if value is None else self._convert(value, origin_unit, unit)
+                              for value in values]
+                self._value, self._min_val, self._max_val = values
+                self._unit = unit
+                self._origin = (origin[0], (unit, *values))
         else:
             raise Exception('''Selected unit is not supported or a correct unit of Temperature.
                                Supported units are:
@@ -220,25 +319,63 @@ class Temperature(_Property):
                                You selected '{}'.
                                '''.format(unit))
 
+    def __repr__(self) -> str:
+        # Rounded for display only. Values are not rounded on conversion.
+        value = round(self.value, 5) if isinstance(self.value, float) else self.value
+        return str(value) + ' ' + self.unit
+
+    def to_unit(self, unit):
+        converted = self._from_trusted(self._value, self._unit,
+                                       self._min_val, self._max_val)
+        converted._origin = getattr(self, "_origin", None)
+        converted.unit = unit
+        return converted
+
+    @classmethod
+    def _unit_conversion(cls, from_unit, to_unit):
+        """
+        Internal function to get the affine relation between two temperature units.
+        Returns (factor, offset) such that value in to_unit = value in from_unit * factor + offset.
+        """
+        if from_unit == to_unit:
+            return 1, 0
+        return cls._scales[from_unit][0] / cls._scales[to_unit][0], cls._convert(0, from_unit, to_unit)
+
+    @classmethod
+    def _convert(cls, value, from_unit, to_unit):
+        """
+        Internal function to convert value between temperature units. Scales with
+        same size of degree differ by offset only, K and R by factor only, and
+        others are converted relative to freezing point of water, so that
+        for e.g. 100 C is 212 F and 32 F is 0 C exactly.
+        """
+        from_degree, from_zero, from_freezing = cls._scales[from_unit]
+        to_degree, to_zero, to_freezing = cls._scales[to_unit]
+        if from_degree == to_degree:
+            return value + (to_zero - from_zero)
+        if from_zero == 0 and to_zero == 0:
+            return value * from_degree / to_degree
+        return (value - from_freezing) * from_degree / to_degree + to_freezing
+
     def __add__(self, other):
-        old_unit = self.unit
-        self.unit = other.unit
-        addition = self.value + other.value
-        addition = Temperature(addition, other.unit)
-        self.unit = old_unit
-        addition.unit = old_unit
+        if not isinstance(other, _Property):
+            return NotImplemented
+        value, _, _ = other._other_in_unit(self)
+        addition = Temperature._from_trusted(value + other.value, other.unit)
+        addition.unit = self.unit
         return addition
     
     def __sub__(self, other):
-        old_unit = self.unit
-        self.unit = other.unit
-        subtraction = self.value - other.value
-        subtraction = Temperature(subtraction, other.unit)
-        self.unit = old_unit
-        subtraction.unit = old_unit
+        if not isinstance(other, _Property):
+            return NotImplemented
+        value, _, _ = other._other_in_unit(self)
+        subtraction = Temperature._from_trusted(value - other.value, other.unit)
+        subtraction.unit = self.unit
         return subtraction
         
 class MassFlowRate(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.MASSFLOWRATE
     def __init__(self, value=0, unit='kg/s', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -271,6 +408,8 @@ class MassFlowRate(_Property):
         return super().__add__(other)
 
 class Mass(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.MASS
     def __init__(self, value=0, unit='kg', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -296,6 +435,8 @@ class Mass(_Property):
         return super().__add__(other)
 
 class MolecularWeigth(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.MOLECULARWEIGTH
     def __init__(self, value=0, unit='g/mol', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -315,6 +456,8 @@ class MolecularWeigth(_Property):
             raise
 
 class MolarFlowRate(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.MOLARFLOWRATE
     def __init__(self, value=1, unit='mol/s', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -342,6 +485,8 @@ class MolarFlowRate(_Property):
             raise
 
 class VolumetricFlowRate(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.VOLUMETRICFLOWRATE
     def __init__(self, value = 1, unit='m^3/s', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -376,6 +521,8 @@ class VolumetricFlowRate(_Property):
             raise
 
 class Volume(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.VOLUME
     def __init__(self, value = 0, unit= 'm^3', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -398,6 +545,8 @@ class Volume(_Property):
             raise
 
 class Density(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.DENSITY
     def __init__(self, value = 0, unit= 'kg/m^3', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -418,6 +567,8 @@ class Density(_Property):
             raise
 
 class DViscosity(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.DVISCOSITY
     def __init__(self, value = 0, unit= 'Pa-s', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -438,6 +589,9 @@ class DViscosity(_Property):
             raise
 
 class Power(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.POWER
+    _invert_factor = True
     def __init__(self, value = 0, unit= 'W', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -446,7 +600,7 @@ class Power(_Property):
     def unit(self, unit):
         _Validators.validate_arg_prop_value_type("unit", unit, (str))
         try:
-            self._convert_values_for_unit_change(unit, True)
+            self._convert_values_for_unit_change(unit)
         except KeyError:
             raise Exception('''Selected unit is not supported or a correct unit of Power. 
                                Following units are supported:
@@ -477,6 +631,8 @@ class Power(_Property):
             raise
 
 class Frequency(_Property):
+    __slots__ = ()
+    _conversion_factors = ConversionFactors.FREQUENCY
     def __init__(self, value=0, unit='Hz', min_val=None, max_val=None):
         super().__init__(value, unit, max_val=max_val, min_val=min_val)
         self.unit = unit
@@ -509,9 +665,16 @@ class Components(object):
         return False
 
 class Dimensionless(_Property):
+    __slots__ = ("_name",)
     def __init__(self, value=None, name=None, min_val=None, max_val=None):
         super().__init__(value=value, unit=None, max_val=max_val, min_val=min_val)
         self._name = name
+
+    @classmethod
+    def _from_trusted(cls, value, unit=None, min_val=None, max_val=None):
+        obj = super()._from_trusted(value, None, min_val, max_val)
+        obj._name = None
+        return obj
     
     @property
     def name(self):
@@ -531,6 +694,7 @@ class Dimensionless(_Property):
         return "{} with value {}".format(self.name, self.value)
 
 class Efficiency(Dimensionless):
+    __slots__ = ()
     def __init__(self, value=1, min_val=0, max_val=1):
         super().__init__(value=value, name="Efficiency", max_val=max_val, min_val=min_val)
         if value < 0 or min_val < 0 or max_val < 0:
@@ -544,4 +708,234 @@ class Efficiency(Dimensionless):
                 warn("Efficiency max_val set to {} considering value provided in percent.".format(max_val/100))
             if min_val > 1:
                 self.min_val = min_val/100
-                warn("Efficiency min_val set to {} considering value provided in percent.".format(min_val/100))
\ No newline at end of file
+                warn("Efficiency min_val set to {} considering value provided in percent.".format(min_val/100))
+
+class PropertyArray(object):
+    __slots__ = ("_prop", "_unit", "_value", "_min_val", "_max_val")
+    def __init__(self, value, prop, unit=None, min_val=None, max_val=None):
+        """
+        DESCRIPTION:
+            Class to hold a batch of values of the same property with one unit
+            in NumPy arrays. Unlike a list of properties, no Python object is
+            created per value. Unit change and arithmetic are vectorized.
+
+        PARAMETERS:
+            value:
+                Required: Yes
+                Type: array-like
+                Acceptable values: Float or int values
+                Description: Values of the property.
+
+            prop:
+                Required: Yes
+                Type: propylean.property
+                Acceptable values: All property classes from propylean.properties.
+                Description: Property class of the values.
+
+            unit:
+                Required: No
+                Type: str
+                Acceptable values: All units associated with property specified in 'prop'.
+                Default value: Default unit of the property.
+                Description: Unit of the values.
+
+            min_val:
+                Required: No
+                Type: array-like
+                Default value: None
+                Description: Minimum values. Same as values if not provided.
+
+            max_val:
+                Required: No
+                Type: array-like
+                Default value: None
+                Description: Maximum values. Same as values if not provided.
+
+        RETURN VALUE:
+            Type: PropertyArray
+            Description: Object of type PropertyArray
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If prop is not a property class, unit is not a unit of
+                         prop or min_val and max_val are not of length of value.
+
+        SAMPLE USE CASES:
+            >>> from propylean.properties import PropertyArray, Pressure
+            >>> inlet_pressures = PropertyArray([1, 2, 3], Pressure, "bar")
+            >>> inlet_pressures.unit = "Pa"
+            >>> pump.inlet_pressure = inlet_pressures
+        """
+        _Validators.validate_child_class("prop", prop, _Property,
+                                         "physical or dimensionless property from propylean.properties")
+        self._prop = prop
+        if issubclass(prop, Dimensionless):
+            self._unit = None
+        elif unit is None:
+            self._unit = prop().unit
+        else:
+            _Validators.validate_arg_prop_value_type("unit", unit, str)
+            _Validators.validate_property_unit(prop, unit)
+            self._unit = unit
+        self._value = np.asarray(value, dtype=float)
+        self._min_val = self._bound_array("min_val", min_val)
+        self._max_val = self._bound_array("max_val", max_val)
+
+    def _bound_array(self, name, values):
+        if values is None:
+            return None
+        values = np.asarray(values, dtype=float)
+        if values.shape != self._value.shape:
+            raise Exception("Length of '{}' should be same as that of values.".format(name))
+        return values
+
+    @classmethod
+    def _from_trusted(cls, value, prop, unit, min_val=None, max_val=None):
+        """
+        Internal constructor for already validated arrays in supported unit.
+        """
+        obj = cls.__new__(cls)
+        obj._prop = prop
+        obj._unit = unit
+        obj._value = value
+        obj._min_val = min_val
+        obj._max_val = max_val
+        return obj
+
+    @property
+    def prop(self):
+        return self._prop
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def min_val(self):
+        return self._min_val if self._min_val is not None else self._value
+
+    @property
+    def max_val(self):
+        return self._max_val if self._max_val is not None else self._value
+
+    @property
+    def unit(self):
+        return self._unit
+    @unit.setter
+    def unit(self, unit):
+        converted = self.to_unit(unit)
+        self._value = converted._value
+        self._min_val = converted._min_val
+        self._max_val = converted._max_val
+        self._unit = unit
+
+    def to_unit(self, unit):
+        """
+        DESCRIPTION:
+            Returns new PropertyArray with all values converted to another unit
+            of the same property. Original PropertyArray is not changed.
+
+        PARAMETERS:
+            unit:
+                Required: Yes
+                Type: str
+                Acceptable values: All units associated with property of the array.
+                Description: Unit to which values are to be converted.
+
+        RETURN VALUE:
+            Type: PropertyArray
+
+        SAMPLE USE CASES:
+            >>> PropertyArray([1, 2], Pressure, "bar").to_unit("Pa")
+        """
+        if issubclass(self._prop, Dimensionless):
+            raise Exception("{} does not have unit.".format(self._prop.__name__))
+        _Validators.validate_arg_prop_value_type("unit", unit, str)
+        _Validators.validate_property_unit(self._prop, unit)
+        factor, offset = self._prop._unit_conversion(self._unit, unit)
+        convert = lambda values: None if values is None else values * factor + offset
+        return self._from_trusted(convert(self._value), self._prop, unit,
+                                  convert(self._min_val), convert(self._max_val))
+
+    def __len__(self):
+        return len(self._value)
+
+    def __getitem__(self, key):
+        min_val = None if self._min_val is None else self._min_val[key]
+        max_val = None if self._max_val is None else self._max_val[key]
+        if isinstance(key, (int, np.integer)):
+            to_float = lambda value: None if value is None else float(value)
+            return self._prop._from_trusted(float(self._value[key]), self._unit,
+                                            to_float(min_val), to_float(max_val))
+        return self._from_trusted(self._value[key], self._prop, self._unit,
+                                  min_val, max_val)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return "PropertyArray of {} with {} values in unit {}: {}".format(
+            self._prop.__name__, len(self), self._unit, self._value)
+
+    def _check_other(self, other):
+        if isinstance(other, PropertyArray):
+            if other._prop is not self._prop:
+                raise Exception("Cannot operate {} with {}.".format(self._prop.__name__,
+                                                                    other._prop.__name__))
+        elif not isinstance(other, self._prop):
+            raise Exception("Cannot operate {} with {}.".format(self._prop.__name__,
+                                                                type(other).__name__))
+
+    def _other_in_unit(self, other, unit):
+        """
+        Internal function returning (value, min_val, max_val) of other in unit
+        without changing other.
+        """
+        factor, offset = self._prop._unit_conversion(other.unit, unit)
+        return (np.asarray(other.value) * factor + offset,
+                np.asarray(other.min_val) * factor + offset,
+                np.asarray(other.max_val) * factor + offset)
+
+    def _operate(self, other, operation, reverse=False):
+        self._check_other(other)
+        first, second = (other, self) if reverse else (self, other)
+        # Same as _Property: operate in unit of first operand. Temperature
+        # operates in unit of second operand and converts the result back.
+        unit = second.unit if issubclass(self._prop, Temperature) else first.unit
+        first_values = self._other_in_unit(first, unit)
+        second_values = self._other_in_unit(second, unit)
+        value = operation(first_values[0], second_values[0])
+        min_val = operation(first_values[1], second_values[1])
+        max_val = operation(first_values[2], second_values[2])
+        result = self._from_trusted(value, self._prop, unit, min_val, max_val)
+        if result.unit != first.unit:
+            result.unit = first.unit
+        return result
+
+    def __neg__(self):
+        negate = lambda values: None if values is None else -values
+        return self._from_trusted(-self._value, self._prop, self._unit,
+                                  negate(self._max_val), negate(self._min_val))
+
+    def __add__(self, other):
+        return self._operate(other, np.add)
+
+    def __radd__(self, other):
+        return self._operate(other, np.add, reverse=True)
+
+    def __sub__(self, other):
+        return self._operate(other, np.subtract)
+
+    def __rsub__(self, other):
+        return self._operate(other, np.subtract, reverse=True)
+
+    def __truediv__(self, other):
+        self._check_other(other)
+        value, _, _ = self._other_in_unit(other, self._unit)
+        return self._value / value
+
+    def __rtruediv__(self, other):
+        self._check_other(other)
+        value, _, _ = self._other_in_unit(self, other.unit)
+        return other.value / value
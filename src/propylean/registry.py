@@ -0,0 +1,150 @@
+from propylean.model import _current_model, _default_model
+
+class _Registry(object):
+    def __init__(self):
+        """
+        DESCRIPTION:
+            Internal registry of all objects of a class. Every registered
+            object gets a stable integer handle which is used as its index.
+            Handles are never reused or shifted, so deleting an object does
+            not invalidate handles of other objects or maps keyed by them.
+            Additionally keeps a dictionary of tag to object so that tag
+            lookup, tag check and tag creation are constant time.
+            Dictionaries are kept consistent through registration,
+            replacement, deletion and change of tags.
+            Declared as class attribute 'items', it acts as registry of the
+            default model and returns registry of the class in the active
+            propylean.model.Model when accessed.
+
+        RETURN VALUE:
+            Type: _Registry
+            Description: Object of type _Registry
+
+        SAMPLE USE CASES:
+            >>> class NewEquipment(object):
+                    items = _Registry()
+                    def __init__(self):
+                        self._index = NewEquipment.items.add(self)
+        """
+        self._objects = {}
+        self._tags = {}
+        self._tag_numbers = {}
+        self._next_handle = 0
+
+    def __set_name__(self, owner, name):
+        _default_model._registries[owner] = self
+        self._owner = owner
+
+    def __get__(self, obj, owner):
+        registries = _current_model.get()._registries
+        registry = registries.get(self._owner)
+        if registry is None:
+            registry = registries[self._owner] = _Registry()
+        return registry
+
+    def add(self, obj):
+        """
+        Registers obj and returns its handle.
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._objects[handle] = obj
+        self._tags[obj.tag] = obj
+        return handle
+
+    def __getitem__(self, handle):
+        try:
+            return self._objects[handle]
+        except (KeyError, TypeError):
+            raise IndexError("No object registered with handle {}.".format(handle))
+
+    def resolve(self, obj, kind):
+        """
+        Returns obj if it is registered in this registry. Raises IndexError
+        if no object is registered with its handle, and Exception if other
+        object is, i.e. obj belongs to other model than the active one.
+        Handles start from 0 in every model, so obj is not looked up by
+        handle alone.
+        """
+        if self[obj.index] is not obj:
+            raise Exception("{} belongs to another model. Use it inside 'with model:' of its model."\
+                            .format(kind))
+        return obj
+
+    def __setitem__(self, handle, obj):
+        old_obj = self[handle]
+        if old_obj is not obj:
+            self._remove_tag(old_obj.tag, old_obj)
+            self._tags[obj.tag] = obj
+        self._objects[handle] = obj
+
+    def __delitem__(self, handle):
+        obj = self[handle]
+        self._remove_tag(obj.tag, obj)
+        del self._objects[handle]
+
+    def __iter__(self):
+        return iter(list(self._objects.values()))
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, obj):
+        # Objects are stored under their index, so lookup is by handle.
+        return self._objects.get(getattr(obj, "_index", None)) is obj
+
+    def __repr__(self):
+        return repr(list(self._objects.values()))
+
+    def handles(self):
+        """
+        Returns list of handles of registered objects.
+        """
+        return list(self._objects.keys())
+
+    def clear(self):
+        self._objects.clear()
+        self._tags.clear()
+        self._tag_numbers.clear()
+
+    def has_tag(self, tag):
+        """
+        Returns True if tag is assigned to any registered object.
+        """
+        return tag in self._tags
+
+    def get_by_tag(self, tag):
+        """
+        Returns registered object with the tag. None if not found.
+        """
+        return self._tags.get(tag)
+
+    def update_tag(self, obj, old_tag, new_tag):
+        """
+        Updates tag of registered object obj from old_tag to new_tag.
+        Does nothing if obj is not yet registered.
+        """
+        if old_tag is None or self._tags.get(old_tag) is not obj:
+            return
+        self._remove_tag(old_tag, obj)
+        self._tags[new_tag] = obj
+
+    def create_tag(self, prefix):
+        """
+        Returns lowest unassigned tag of form '<prefix>_<number>'.
+        """
+        i = self._tag_numbers.get(prefix, 1)
+        while self.has_tag(prefix + "_" + str(i)):
+            i += 1
+        self._tag_numbers[prefix] = i
+        return prefix + "_" + str(i)
+
+    def _remove_tag(self, tag, obj):
+        if self._tags.get(tag) is not obj:
+            return
+        del self._tags[tag]
+        # Allow lower auto-generated numbers to be reused.
+        prefix, _, number = str(tag).rpartition("_")
+        if number.isdigit() and prefix in self._tag_numbers:
+            self._tag_numbers[prefix] = min(self._tag_numbers[prefix],
+                                            int(number))
@@ -1,7 +1,9 @@
 from pandas import Series as PdSeries
-from pyspark.pandas import Series as SpkSeries
+import sys
+import operator
+import numpy as np
 from propylean.validators import _Validators
-from propylean.properties import _Property
+from propylean.properties import _Property, Dimensionless, PropertyArray, Temperature
 from tabulate import tabulate
 
 class Series():
@@ -72,16 +74,172 @@ class Series():
         self.unit = unit if unit is not None else prop().unit
         if isinstance(data, PdSeries):
             self._instance = data
-        elif isinstance(data, SpkSeries):
+        elif _is_spark_series(data):
             self._instance = data
             self._is_spark = True
         elif is_spark:
+            from pyspark.pandas import Series as SpkSeries
             self._instance = SpkSeries(data=data,index=index,dtype=dtype,
                                       name=name, copy=copy)
         else:
             self._instance = PdSeries(data=data,index=index,dtype=dtype,
                                       name=name, copy=copy)
     
+    @classmethod
+    def from_numpy(cls, array, prop, unit=None, index=None, name=None):
+        """
+        DESCRIPTION:
+            Creates pandas-backed Series which shares memory with one dimensional
+            numpy array or any object supporting the array interface. Values are
+            not copied, so changes to the array are seen in the Series.
+
+        PARAMETERS:
+            array:
+                Required: Yes
+                Type: numpy.ndarray or array-like
+                Description: One dimensional array of values.
+
+            prop:
+                Required: Yes
+                Type: propylean.property
+                Description: Property class for the series data.
+
+            unit:
+                Required: No
+                Type: string
+                Description: Unit of the values. Default unit of the property if not provided.
+
+            index:
+                Required: No
+                Description: Index of the series. Refer pandas.Series documentation.
+
+            name:
+                Required: No
+                Description: Name of the series. Refer pandas.Series documentation.
+
+        RETURN VALUE:
+            Type: Series
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If array is not one dimensional.
+
+        SAMPLE USE CASES:
+            >>> from propylean.properties import Pressure
+            >>> values = np.memmap("pressure.bin", dtype=float, mode="r")
+            >>> ser = Series.from_numpy(values, prop=Pressure, unit="bar")
+        """
+        array = np.asarray(array)
+        if array.ndim != 1:
+            raise Exception("Array should be one dimensional. Provided array has {} dimensions.".format(array.ndim))
+        return cls(PdSeries(array, index=index, name=name, copy=False), prop=prop, unit=unit)
+
+    @classmethod
+    def from_buffer(cls, buffer, prop, unit=None, dtype=float, index=None, name=None):
+        """
+        DESCRIPTION:
+            Creates pandas-backed Series which shares memory with a buffer, for
+            e.g. memoryview, bytearray or mmap, without copying values.
+            Series from read-only buffers, like bytes, are read-only.
+
+        PARAMETERS:
+            buffer:
+                Required: Yes
+                Type: Object supporting buffer protocol.
+                Description: Buffer with values of type dtype.
+
+            prop:
+                Required: Yes
+                Type: propylean.property
+                Description: Property class for the series data.
+
+            unit:
+                Required: No
+                Type: string
+                Description: Unit of the values. Default unit of the property if not provided.
+
+            dtype:
+                Required: No
+                Type: numpy dtype
+                Default value: float
+                Description: Type of values in the buffer.
+
+            index:
+                Required: No
+                Description: Index of the series. Refer pandas.Series documentation.
+
+            name:
+                Required: No
+                Description: Name of the series. Refer pandas.Series documentation.
+
+        RETURN VALUE:
+            Type: Series
+
+        SAMPLE USE CASES:
+            >>> from propylean.properties import Temperature
+            >>> ser = Series.from_buffer(memoryview(data), prop=Temperature, unit="C")
+        """
+        return cls.from_numpy(np.frombuffer(buffer, dtype=dtype), prop=prop,
+                              unit=unit, index=index, name=name)
+
+    @classmethod
+    def from_arrow(cls, array, prop, unit=None, index=None, name=None):
+        """
+        DESCRIPTION:
+            Creates pandas-backed Series which shares memory with numeric Arrow
+            array, for e.g. column of a Parquet file read with pyarrow, without
+            copying values. Chunked arrays should have one chunk.
+
+        PARAMETERS:
+            array:
+                Required: Yes
+                Type: pyarrow.Array or pyarrow.ChunkedArray
+                Description: Numeric array without nulls.
+
+            prop:
+                Required: Yes
+                Type: propylean.property
+                Description: Property class for the series data.
+
+            unit:
+                Required: No
+                Type: string
+                Description: Unit of the values. Default unit of the property if not provided.
+
+            index:
+                Required: No
+                Description: Index of the series. Refer pandas.Series documentation.
+
+            name:
+                Required: No
+                Description: Name of the series. Refer pandas.Series documentation.
+
+        RETURN VALUE:
+            Type: Series
+
+        ERROR RAISED:
+            Type: Exception
+            Description: If array has more than one chunk, has nulls or is not
+                         numeric, as values would have to be copied.
+
+        SAMPLE USE CASES:
+            >>> import pyarrow.parquet as pq
+            >>> from propylean.properties import Length
+            >>> table = pq.read_table("LPG_bullet_data.parquet")
+            >>> ser = Series.from_arrow(table["liquid_level(cm)"], prop=Length, unit="cm")
+        """
+        import pyarrow as pa
+        if isinstance(array, pa.ChunkedArray):
+            if array.num_chunks != 1:
+                raise Exception("Chunked array should have one chunk to be used without copying. Provided array has {} chunks.".format(array.num_chunks))
+            array = array.chunk(0)
+        try:
+            values = array.to_numpy(zero_copy_only=True)
+        except pa.ArrowInvalid:
+            raise Exception("Arrow array of type '{}' with {} nulls cannot be used without copying. Provide numeric array without nulls.".format(
+                            array.type, array.null_count))
+        return cls.from_numpy(values, prop=prop, unit=unit, index=index, name=name)
+
     @property
     def prop(self):
         return self._prop
@@ -94,55 +252,397 @@ class Series():
         return self._unit
     @unit.setter
     def unit(self, value):
-        _Validators.validate_property_unit(self._prop, value)
+        if not issubclass(self._prop, Dimensionless):
+            _Validators.validate_property_unit(self._prop, value)
         self._unit = value
 
+    def to_unit(self, unit):
+        """
+        DESCRIPTION:
+            Converts all values of the series to another unit of the same property.
+            Conversion is done in a single vectorized operation on the wrapped series.
+
+        PARAMETERS:
+            unit:
+                Required: Yes
+                Type: string
+                Acceptable values: All units associated with property of the series.
+                Description: Unit to which values are to be converted.
+
+        RETURN VALUE:
+            Type: Series
+            Description: New Series with converted values and unit. Original Series is not changed.
+
+        SAMPLE USE CASES:
+            >>> from propylean.properties import Pressure
+            >>> ser = Series([1, 2], prop=Pressure, unit="bar")
+            >>> ser.to_unit("Pa")
+        """
+        _Validators.validate_property_unit(self._prop, unit)
+        factor, offset = self._prop._unit_conversion(self._unit, unit)
+        return type(self)(data=_scaled(self._instance, factor, offset), prop=self._prop,
+                          unit=unit, is_spark=self._is_spark)
+
     def __repr__(self) -> str:
-        values_to_tabulate = []
-        for val in self._instance.head().to_numpy().tolist():
-            values_to_tabulate.append([val])
-        if len(self._instance.to_numpy().tolist()) > 5:
+        values, has_more = self._preview(5)
+        values_to_tabulate = [[val] for val in values]
+        if has_more:
             values_to_tabulate.append([":"])
             values_to_tabulate.append([":"])
             
         return "Property: {}\nunit: {}\n".format(self._prop.__name__, self._unit) + tabulate(values_to_tabulate)
+
+    def __len__(self):
+        # Spark-backed series are counted in Spark without collecting values.
+        return len(self._instance)
+
+    def _preview(self, n):
+        """
+        Internal function returning list of first n values and whether the
+        series has more values. Only first n + 1 values are read, so cost
+        does not depend on length of the series, even if Spark-backed.
+        """
+        if _is_spark_series(self._instance):
+            values = self._instance.head(n + 1).to_numpy().tolist()
+            return values[:n], len(values) > n
+        return self._instance.iloc[:n].tolist(), len(self._instance) > n
     
     def __getattr__(self, name):
+        # Called only for attributes not found on Series. Private and special
+        # names are not delegated, so that copying and pickling of Series, which
+        # look them up before _instance is set, do not recurse.
+        if name.startswith("_"):
+            raise AttributeError(name)
         return self._instance.__getattribute__(name)
     
     def __add__(self, other):
-        return self._arithmetic_operation(other, "+")        
-            
+        return self._arithmetic_operation(other, operator.add)
+
+    def __radd__(self, other):
+        return self._arithmetic_operation(other, operator.add, reverse=True)
+
     def __sub__(self, other):
-        return self._arithmetic_operation(other, "-")
+        return self._arithmetic_operation(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._arithmetic_operation(other, operator.sub, reverse=True)
+
+    def __mul__(self, other):
+        return self._scaling_operation(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._scaling_operation(other, operator.mul)
 
     def __truediv__(self, other):
-        return self._arithmetic_operation(other, "/")
-
-    def _arithmetic_operation(self, other, arithmetic_operater):
-        if isinstance(other, Series) and other._prop != self._prop:
-            raise Exception("Physical property of both Series operands must be same. You provided {} {} {}".format(self._prop, arithmetic_operater, other.prop))
-        if isinstance(other, _Property) and self.unit != other.unit:
-            other.unit = self.unit                    
-        elif self.unit != other.unit:
-            raise Exception("Operand unit of measurment do not match.")
-        
-        if isinstance(other, Series):
-            if arithmetic_operater == "+":
-                data = self._instance.add(other._instance)
-            elif arithmetic_operater == "-":
-                data = self._instance.sub(other._instance)
-            elif arithmetic_operater == "/":
-                data = self._instance.truediv(other._instance)
+        if (isinstance(other, (Series, _Property)) and
+            not issubclass(_prop_of(other), Dimensionless)):
+            # Ratio of values of same property is dimensionless.
+            self._check_same_prop(other, "/")
+            data = _converted_operation(operator.truediv, self, other, self._unit)
+            return self._new(data, Dimensionless, None)
+        return self._scaling_operation(other, operator.truediv)
+
+    def __neg__(self):
+        return self._new(-self._instance, self._prop, self._unit)
+
+    def __eq__(self, other):
+        return self._comparison(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._comparison(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._comparison(other, operator.lt)
+
+    def __le__(self, other):
+        return self._comparison(other, operator.le)
+
+    def __gt__(self, other):
+        return self._comparison(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._comparison(other, operator.ge)
+
+    # Hashed by identity, as comparisons are elementwise.
+    __hash__ = object.__hash__
+
+    def sum(self):
+        return self._reduce("sum")
+
+    def mean(self):
+        return self._reduce("mean")
+
+    def median(self):
+        return self._reduce("median")
+
+    def min(self):
+        return self._reduce("min")
+
+    def max(self):
+        return self._reduce("max")
+
+    def std(self):
+        """
+        DESCRIPTION:
+            Returns standard deviation of values of the series.
+
+        RETURN VALUE:
+            Type: property of the series, or Dimensionless for Temperature
+            Description: Standard deviation in unit of the series. For Temperature
+                         it is a temperature difference, to which offset of
+                         temperature units does not apply, so it is returned as
+                         Dimensionless named 'Temperature difference (<unit>)'.
+
+        SAMPLE USE CASES:
+            >>> from propylean.properties import Temperature
+            >>> ser = Series([20, 30, 40], prop=Temperature, unit="C")
+            >>> ser.std()
+        """
+        if issubclass(self._prop, Temperature):
+            return Dimensionless(float(self._instance.std()),
+                                 name="Temperature difference ({})".format(self._unit))
+        return self._reduce("std")
+
+    def _new(self, data, prop, unit):
+        return type(self)(data=data, prop=prop, unit=unit, is_spark=self._is_spark)
+
+    def _check_same_prop(self, other, arithmetic_operater):
+        if _prop_of(other) is not self._prop:
+            raise Exception("Physical property of both Series operands must be same. You provided {} {} {}".format(
+                            self._prop.__name__, arithmetic_operater, _prop_of(other).__name__))
+
+    def _arithmetic_operation(self, other, operation, reverse=False):
+        """
+        Internal function to add or subtract Series or property of same
+        physical property. Other operand is converted to unit of this one with
+        one vectorized multiply, without changing it. Same as properties,
+        Temperature operates in unit of second operand and converts back.
+        """
+        if not isinstance(other, (Series, _Property)):
+            return NotImplemented
+        self._check_same_prop(other, "+" if operation is operator.add else "-")
+        first, second = (other, self) if reverse else (self, other)
+        unit = second.unit if issubclass(self._prop, Temperature) else first.unit
+        data = _converted_operation(operation, first, second, unit, first.unit)
+        return self._new(data, self._prop, first.unit)
+
+    def _scaling_operation(self, other, operation):
+        """
+        Internal function to multiply or divide by numbers, arrays or
+        dimensionless Series or properties.
+        """
+        if isinstance(other, (Series, _Property)):
+            if not issubclass(_prop_of(other), Dimensionless):
+                raise Exception("Series of {} can be multiplied or divided only by numbers or dimensionless values. You provided {}.".format(
+                                self._prop.__name__, _prop_of(other).__name__))
+            other = _values_in_unit(other, other.unit)
+        elif not isinstance(other, (int, float, np.number, np.ndarray)):
+            return NotImplemented
+        return self._new(_combine(operation, self._instance, other), self._prop, self._unit)
+
+    def _comparison(self, other, operation):
+        """
+        Internal function to compare elementwise with Series or property of same
+        physical property, converted to unit of this one, or with numbers in
+        unit of this one. Returns boolean pandas or Spark series.
+        """
+        if isinstance(other, (Series, _Property)):
+            self._check_same_prop(other, "compared with")
+            other = _values_in_unit(other, self._unit)
+        elif not isinstance(other, (int, float, np.number, np.ndarray)):
+            return NotImplemented
+        return _combine(operation, self._instance, other)
+
+    def _reduce(self, name):
+        value = float(getattr(self._instance, name)())
+        if issubclass(self._prop, Dimensionless):
+            return self._prop(value)
+        return self._prop(value, self._unit)
+
+def _prop_of(operand):
+    return operand._prop if isinstance(operand, Series) else type(operand)
+
+def _values_in_unit(operand, unit):
+    """
+    Internal function to get values of Series or property in unit with one
+    vectorized multiply and add. Operand is not changed.
+    """
+    factor, offset = _prop_of(operand)._unit_conversion(operand.unit, unit)
+    return _scaled(_data_of(operand), factor, offset)
+
+def _data_of(operand):
+    return operand._instance if isinstance(operand, Series) else operand.value
+
+def _scaled(data, factor, offset):
+    """
+    Internal function returning data * factor + offset, or data itself if
+    there is nothing to convert. Numeric pandas series are converted into
+    one new array instead of one for multiply and one for add.
+    """
+    if factor == 1 and offset == 0:
+        return data
+    if isinstance(data, PdSeries) and data.dtype.kind in "biuf":
+        values = np.multiply(data.to_numpy(), factor, dtype=float)
+        if offset != 0:
+            np.add(values, offset, out=values)
+        return PdSeries(values, index=data.index, name=data.name, copy=False)
+    if factor != 1:
+        data = data * factor
+    if offset != 0:
+        data = data + offset
+    return data
+
+_UFUNCS = {operator.add: np.add, operator.sub: np.subtract,
+           operator.truediv: np.true_divide}
+
+def _converted_operation(operation, first, second, unit, result_unit=None):
+    """
+    Internal function to operate on values of first and second, Series or
+    properties of same physical property, in unit and to convert result to
+    result_unit. Operands are not changed.
+    """
+    operands = [(_data_of(operand),) + _prop_of(operand)._unit_conversion(operand.unit, unit)
+                for operand in (first, second)]
+    result_conversion = (1, 0)
+    if result_unit is not None:
+        result_conversion = _prop_of(first)._unit_conversion(unit, result_unit)
+    data = _numpy_operation(operation, operands, result_conversion)
+    if data is None:
+        data = _combine(operation, *[_scaled(*operand) for operand in operands])
+        data = _scaled(data, *result_conversion)
+    return data
+
+def _numpy_operation(operation, operands, result_conversion):
+    """
+    Internal function to operate on numeric pandas series with same index
+    and numbers, given as (data, factor, offset), as numpy arrays. Unit
+    conversions are written into the result array, so that only one array
+    is allocated for the result. Returns None if operands need pandas or
+    Spark operations, for e.g. to align different indexes, or if nothing
+    is converted, as pandas then allocates only the result too.
+    """
+    ufunc = _UFUNCS.get(operation)
+    series = [data for data, _, _ in operands if isinstance(data, PdSeries)]
+    conversions = [conversion for _, *conversion in operands] + [list(result_conversion)]
+    if (ufunc is None or not series or
+        all(conversion == [1, 0] for conversion in conversions)):
+        return None
+    index = series[0].index
+    for data, _, _ in operands:
+        if isinstance(data, PdSeries):
+            if data.dtype.kind not in "biuf" or not data.index.equals(index):
+                return None
+        elif not isinstance(data, (int, float, np.number)):
+            return None
+    result = np.empty(len(index))
+    values = []
+    for data, factor, offset in operands:
+        if not isinstance(data, PdSeries):
+            values.append(data * factor + offset)
+        elif (factor, offset) == (1, 0):
+            values.append(data.to_numpy())
+        elif not any(value is result for value in values):
+            np.multiply(data.to_numpy(), factor, out=result)
+            if offset != 0:
+                np.add(result, offset, out=result)
+            values.append(result)
+        else:
+            values.append(data.to_numpy() * factor + offset)
+    ufunc(values[0], values[1], out=result)
+    factor, offset = result_conversion
+    if factor != 1:
+        np.multiply(result, factor, out=result)
+    if offset != 0:
+        np.add(result, offset, out=result)
+    names = {data.name for data in series}
+    return PdSeries(result, index=index, name=names.pop() if len(names) == 1 else None,
+                    copy=False)
+
+def _combine(operation, first, second):
+    # Spark series of different frames are combined only with this option.
+    if _is_spark_series(first) and _is_spark_series(second):
+        import pyspark.pandas as ps
+        with ps.option_context("compute.ops_on_diff_frames", True):
+            return operation(first, second)
+    return operation(first, second)
+
+def _is_spark_series(data):
+    """
+    Internal function to check if data is pyspark.pandas Series without
+    importing pyspark. If pyspark.pandas is not imported yet, data cannot
+    be its Series.
+    """
+    spark_pandas = sys.modules.get("pyspark.pandas")
+    return spark_pandas is not None and isinstance(data, spark_pandas.Series)
+
+def _elementwise(func, operands, prop_type=None, unit=None):
+    """
+    Internal function to calculate func on values of operands elementwise.
+    Operands are properties, PropertyArrays, Series or numbers, in units
+    expected by func. func is written with numpy for floats and arrays.
+    If any operand is Spark-backed Series, func runs on batches of rows in
+    Spark executors as pandas UDF and result is Spark-backed Series, so
+    values are not collected to the driver.
+    Returns Series if any operand is Series, PropertyArray if any is
+    PropertyArray, else property of prop_type in unit, or float if
+    prop_type is None.
+    """
+    values = [_operand_values(operand) for operand in operands]
+    spark_positions = [i for i, value in enumerate(values) if _is_spark_series(value)]
+    if prop_type is None:
+        prop_type, unit = Dimensionless, None
+    if spark_positions:
+        return Series(_spark_elementwise(func, values, spark_positions),
+                      prop=prop_type, unit=unit)
+    result = func(*values)
+    for operand in operands:
+        if isinstance(operand, Series):
+            index = operand._instance.index
+            return Series(np.broadcast_to(result, len(index)).astype(float),
+                          prop=prop_type, unit=unit, index=index)
+    if any(isinstance(operand, PropertyArray) for operand in operands):
+        return PropertyArray(result, prop_type, unit)
+    result = float(result)
+    return result if prop_type is Dimensionless and unit is None else prop_type(result, unit)
+
+def _operand_values(operand):
+    if isinstance(operand, Series):
+        if _is_spark_series(operand._instance):
+            return operand._instance
+        return operand._instance.to_numpy(dtype=float)
+    if isinstance(operand, (_Property, PropertyArray)):
+        return operand.value
+    return operand
+
+def _spark_elementwise(func, values, spark_positions):
+    """
+    Internal function to run func on Spark-backed operands with
+    pandas_on_spark.transform_batch. Other operands should be scalars,
+    which are shipped to executors with func.
+    """
+    import pandas as pd
+    import pyspark.pandas as ps
+    constants = []
+    for i, value in enumerate(values):
+        if i in spark_positions:
+            constants.append(None)
+        elif isinstance(value, np.ndarray) and value.ndim > 0:
+            raise Exception("Spark Series cannot be calculated with pandas Series or PropertyArray. Convert them to Spark Series.")
         else:
-            if arithmetic_operater == "+":     
-                data = self._instance + other.value
-            elif arithmetic_operater == "-":
-                data = self._instance - other.value
-            elif arithmetic_operater == "/":
-                data = self._instance / other.value
-
-        return type(self)(data=data, prop=self.prop,
-                        unit=self.unit, index=self._instance.index, 
-                        is_spark=self._is_spark, dtype=self._instance.dtype, 
-                        name=self._instance.name, copy=self._instance.copy)
+            constants.append(value)
+    columns = ["operand_{}".format(i) for i in spark_positions]
+    if len(spark_positions) == 1:
+        frame = values[spark_positions[0]].rename(columns[0]).to_frame()
+    else:
+        with ps.option_context("compute.ops_on_diff_frames", True):
+            frame = ps.concat([values[i].rename(column)
+                               for i, column in zip(spark_positions, columns)], axis=1)
+
+    # Return type is given so that Spark does not run func on a sample to infer it.
+    def calculate_batch(batch) -> ps.Series[float]:
+        args = list(constants)
+        for i, column in zip(spark_positions, columns):
+            args[i] = batch[column].to_numpy(dtype=float)
+        return pd.Series(np.broadcast_to(func(*args), len(batch)).astype(float),
+                         index=batch.index)
+    return frame.pandas_on_spark.transform_batch(calculate_batch)
@@ -2,4 +2,6 @@ class Settings(object):
     unit_system = "SI"
     pipe_dp_method = "Clamond"
     Darcy = True
-    compression_process = "Adiabatic" # Polytropic or Adiabatic/Isentropic
\ No newline at end of file
+    compression_process = "Adiabatic" # Polytropic or Adiabatic/Isentropic
+    property_cache_size = 1024 # Max. flashed states kept by MaterialStream. 0 disables caching.
+    property_cache_tolerance = 1e-6 # Temperature (K) and pressure (Pa) rounding for cache lookup.
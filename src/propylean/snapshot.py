@@ -0,0 +1,454 @@
+import gc
+import json
+import mmap
+import pickle
+import struct
+from importlib import import_module
+import numpy as np
+from propylean.properties import _Property, Dimensionless
+from propylean.registry import _Registry
+
+MAGIC = b"PRPLSNAP"
+VERSION = 1
+# Magic, version, length of header.
+_PREAMBLE = struct.Struct("<8sIQ")
+_ALIGNMENT = 64
+
+# Type codes of 'number' columns.
+_NONE, _INT, _FLOAT, _BOOL = 0, 1, 2, 3
+
+def save(model, path):
+    """
+    DESCRIPTION:
+        Saves all objects and stream-equipment connections of a model to a
+        binary snapshot file. Attributes are stored column-wise per class:
+        physical properties as arrays of values, minimum, maximum and unit
+        codes (and name codes for Dimensionless), numbers and flags as arrays, strings in a shared string table,
+        and remaining values (for e.g. segment_frame, performance_curve,
+        components) as pickled blobs.
+
+    PARAMETERS:
+        model:
+            Required: Yes
+            Type: propylean.model.Model
+
+        path:
+            Required: Yes
+            Type: str
+            Description: Path of the snapshot file.
+
+    SAMPLE USE CASES:
+        >>> from propylean import Model
+        >>> Model.current().save("plant.prs")
+    """
+    writer = _BlockWriter()
+    strings = _StringTable()
+    classes = []
+    for owner, registry in model._registries.items():
+        if len(registry) == 0:
+            continue
+        handles = registry.handles()
+        objects = [registry[handle] for handle in handles]
+        by_class = {}
+        for handle, obj in zip(handles, objects):
+            by_class.setdefault(type(obj), []).append((handle, obj))
+        classes.append({"owner": _class_path(owner),
+                        "next_handle": registry._next_handle,
+                        "tag_numbers": registry._tag_numbers,
+                        "types": [_encode_objects(cls, rows, writer, strings)
+                                  for cls, rows in by_class.items()]})
+    class_codes = {}
+    maps = {name: _encode_map(getattr(model, name), writer, class_codes)
+            for name in ["_material_stream_equipment_map", "_energy_stream_equipment_map"]}
+    header = {"version": VERSION,
+              "classes": classes,
+              "maps": maps,
+              "map_classes": list(class_codes),
+              "strings": strings.encode(writer)}
+    header = json.dumps(header).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(header))
+    with open(path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        f.write(b"\0" * (data_start - _PREAMBLE.size - len(header)))
+        writer.write(f)
+
+def load(path):
+    """
+    DESCRIPTION:
+        Loads model saved by save. File is memory-mapped and columns are read
+        directly from the mapping without copying. Handles, tags and connections
+        are loaded at once. Every object is created from the mapping when it
+        is first accessed, so loading time does not depend on number of
+        attributes of objects.
+
+    PARAMETERS:
+        path:
+            Required: Yes
+            Type: str
+            Description: Path of the snapshot file.
+
+    RETURN VALUE:
+        Type: propylean.model.Model
+        Description: New model with all objects and connections of the snapshot.
+
+    ERROR RAISED:
+        Type: Exception
+        Description: If file is not a snapshot or its version is not supported.
+
+    SAMPLE USE CASES:
+        >>> from propylean import Model
+        >>> model = Model.load("plant.prs")
+        >>> with model:
+        >>>     ...
+    """
+    from propylean.model import Model
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        magic, version, header_length = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise Exception("File '{}' is not a propylean snapshot.".format(path))
+        if version > VERSION:
+            raise Exception("Snapshot version {} not supported. Supported versions are upto {}.".format(
+                            version, VERSION))
+        header = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+        reader = _BlockReader(buffer, _aligned(_PREAMBLE.size + header_length))
+        strings = _StringTable.decode(header["strings"], reader)
+        model = Model()
+        for saved in header["classes"]:
+            registry = _LazyRegistry()
+            for saved_type in saved["types"]:
+                registry._add_pending(_ObjectColumns(saved_type, reader, strings))
+            # Objects are yet to be created, so only handles are sorted.
+            registry._objects = dict.fromkeys(sorted(registry._objects))
+            registry._next_handle = saved["next_handle"]
+            registry._tag_numbers = saved["tag_numbers"]
+            model._registries[_resolve_class(saved["owner"])] = registry
+        map_classes = [_resolve_class(path) for path in header["map_classes"]]
+        for name, saved_map in header["maps"].items():
+            getattr(model, name).update(_decode_map(saved_map, reader, map_classes))
+    except Exception:
+        buffer.close()
+        raise
+    # Mapping stays open while objects are yet to be created from it.
+    return model
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+def _class_path(cls):
+    return cls.__module__ + ":" + cls.__qualname__
+
+def _resolve_class(path):
+    module, _, qualname = path.partition(":")
+    obj = import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+class _BlockWriter(object):
+    """
+    Internal writer of aligned binary blocks. Offsets are relative to start of data.
+    """
+    def __init__(self):
+        self._blocks = []
+        self._size = 0
+
+    def add(self, array):
+        array = np.ascontiguousarray(array)
+        offset = _aligned(self._size)
+        self._blocks.append((offset, array.tobytes()))
+        self._size = offset + array.nbytes
+        return {"offset": offset, "dtype": array.dtype.str, "count": int(array.size)}
+
+    def add_bytes(self, data):
+        return self.add(np.frombuffer(data, dtype=np.uint8))
+
+    def write(self, f):
+        position = 0
+        for offset, data in self._blocks:
+            f.write(b"\0" * (offset - position))
+            f.write(data)
+            position = offset + len(data)
+
+class _BlockReader(object):
+    """
+    Internal reader of blocks as numpy arrays viewing the memory-mapped file.
+    """
+    def __init__(self, buffer, data_start):
+        self._buffer = buffer
+        self._data_start = data_start
+
+    def get(self, block):
+        return np.frombuffer(self._buffer, dtype=np.dtype(block["dtype"]), count=block["count"],
+                             offset=self._data_start + block["offset"])
+
+class _StringTable(object):
+    """
+    Internal table of unique strings. Columns store int32 codes, -1 for None.
+    """
+    def __init__(self, strings=None):
+        self.strings = strings if strings is not None else []
+        self._codes = {string: code for code, string in enumerate(self.strings)}
+
+    def code(self, string):
+        if string is None:
+            return -1
+        code = self._codes.get(string)
+        if code is None:
+            code = self._codes[string] = len(self.strings)
+            self.strings.append(string)
+        return code
+
+    def encode(self, writer):
+        encoded = [string.encode("utf-8") for string in self.strings]
+        offsets = np.cumsum([0] + [len(data) for data in encoded], dtype=np.int64)
+        return {"offsets": writer.add(offsets),
+                "data": writer.add_bytes(b"".join(encoded))}
+
+    @classmethod
+    def decode(cls, saved, reader):
+        offsets = reader.get(saved["offsets"]).tolist()
+        data = reader.get(saved["data"]).tobytes()
+        return cls([data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])])
+
+def _column_kind(values):
+    first = values[0]
+    if isinstance(first, _Property) and all(type(value) is type(first) for value in values):
+        return "property"
+    if all(value is None or type(value) in (int, float, bool) for value in values):
+        return "number"
+    if all(value is None or type(value) is str for value in values):
+        return "string"
+    return "pickle"
+
+def _encode_objects(cls, rows, writer, strings):
+    """
+    Internal function to encode objects of one class column-wise.
+    """
+    handles = np.array([handle for handle, _ in rows], dtype=np.int64)
+    states = [vars(obj) for _, obj in rows]
+    names = list(dict.fromkeys(name for state in states for name in state))
+    columns = []
+    for name in names:
+        present = np.array([name in state for state in states], dtype=np.uint8)
+        values = [state[name] for state in states if name in state]
+        column = {"name": name,
+                  "mask": None if present.all() else writer.add(present)}
+        kind = column["kind"] = _column_kind(values)
+        if kind == "property":
+            column["type"] = _class_path(type(values[0]))
+            column["value"] = writer.add(np.array([value._value for value in values], dtype=np.float64))
+            column["min_val"] = writer.add(np.array([np.nan if value._min_val is None else value._min_val
+                                                     for value in values], dtype=np.float64))
+            column["max_val"] = writer.add(np.array([np.nan if value._max_val is None else value._max_val
+                                                     for value in values], dtype=np.float64))
+            column["unit"] = writer.add(np.array([strings.code(value._unit) for value in values], dtype=np.int32))
+            if isinstance(values[0], Dimensionless):
+                column["names"] = writer.add(np.array([strings.code(value._name) for value in values],
+                                                      dtype=np.int32))
+        elif kind == "number":
+            codes = [_NONE if value is None else _BOOL if type(value) is bool else
+                     _INT if type(value) is int else _FLOAT for value in values]
+            column["code"] = writer.add(np.array(codes, dtype=np.uint8))
+            column["value"] = writer.add(np.array([np.nan if value is None else value for value in values],
+                                                  dtype=np.float64))
+        elif kind == "string":
+            column["value"] = writer.add(np.array([strings.code(value) for value in values], dtype=np.int32))
+        else:
+            blobs = [pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) for value in values]
+            column["offsets"] = writer.add(np.cumsum([0] + [len(blob) for blob in blobs], dtype=np.int64))
+            column["data"] = writer.add_bytes(b"".join(blobs))
+        columns.append(column)
+    return {"class": _class_path(cls),
+            "handles": writer.add(handles),
+            "columns": columns}
+
+class _ObjectColumns(object):
+    """
+    Internal decoder of objects of one class from their columns in the
+    memory-mapped snapshot. Objects are created one row at a time.
+    """
+    def __init__(self, saved, reader, strings):
+        self.cls = _resolve_class(saved["class"])
+        self.handles = reader.get(saved["handles"]).tolist()
+        self._strings = strings.strings
+        self._columns = []
+        self.tags = None
+        for column in saved["columns"]:
+            arrays = {key: reader.get(block) for key, block in column.items()
+                      if isinstance(block, dict)}
+            if column["mask"] is not None:
+                # Position of every row among rows which have the attribute.
+                arrays["position"] = np.cumsum(arrays["mask"], dtype=np.int64) - 1
+            if column["kind"] == "property":
+                arrays["from_trusted"] = _resolve_class(column["type"])._from_trusted
+            self._columns.append((column["name"], column["kind"], arrays))
+            if column["name"] == "_tag" and column["kind"] == "string":
+                self.tags = [None if code < 0 else self._strings[code]
+                             for code in arrays["value"].tolist()]
+
+    def _value(self, kind, arrays, i):
+        if kind == "property":
+            min_val = float(arrays["min_val"][i])
+            max_val = float(arrays["max_val"][i])
+            value = arrays["from_trusted"](float(arrays["value"][i]), self._strings[arrays["unit"][i]],
+                                           None if min_val != min_val else min_val,
+                                           None if max_val != max_val else max_val)
+            if "names" in arrays:
+                code = arrays["names"][i]
+                value._name = None if code < 0 else self._strings[code]
+            return value
+        if kind == "number":
+            code = arrays["code"][i]
+            if code == _NONE:
+                return None
+            return (None, int, float, bool)[code](arrays["value"][i])
+        if kind == "string":
+            code = arrays["value"][i]
+            return None if code < 0 else self._strings[code]
+        offsets = arrays["offsets"]
+        return pickle.loads(arrays["data"][offsets[i]:offsets[i + 1]])
+
+    def create(self, row, columns=None):
+        state = {}
+        for name, kind, arrays in columns or self._columns:
+            if "mask" in arrays:
+                if not arrays["mask"][row]:
+                    continue
+                i = arrays["position"][row]
+            else:
+                i = row
+            state[name] = self._value(kind, arrays, i)
+        obj = self.cls.__new__(self.cls)
+        obj.__dict__ = state
+        return obj
+
+    def create_many(self, rows):
+        """
+        Creates objects of many rows. Columns are converted to lists once
+        as indexing lists is faster than indexing arrays.
+        """
+        columns = [(name, kind, {key: value.tolist() if isinstance(value, np.ndarray) and key != "data"
+                                 else value for key, value in arrays.items()})
+                   for name, kind, arrays in self._columns]
+        # Objects created here are acyclic, so collection of cycles
+        # is paused instead of being triggered by every few allocations.
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [self.create(row, columns) for row in rows]
+        finally:
+            if enabled:
+                gc.enable()
+
+class _LazyRegistry(_Registry):
+    def __init__(self):
+        """
+        DESCRIPTION:
+            Internal registry of a loaded snapshot. Handles and tags are known
+            on load, objects are created from the snapshot on first access.
+            Object of handle not yet created is held as None.
+        """
+        super().__init__()
+        self._pending = {}
+        self._pending_tags = {}
+
+    def _add_pending(self, decoder):
+        self._objects.update(dict.fromkeys(decoder.handles))
+        self._pending.update((handle, (decoder, row)) for row, handle in enumerate(decoder.handles))
+        self._pending_tags.update(zip(decoder.tags, decoder.handles))
+
+    def _create(self, handle):
+        decoder, row = self._pending.pop(handle)
+        obj = decoder.create(row)
+        self._objects[handle] = obj
+        self._pending_tags.pop(obj._tag, None)
+        self._tags[obj._tag] = obj
+        return obj
+
+    def _create_all(self):
+        rows = {}
+        for handle, (decoder, row) in self._pending.items():
+            rows.setdefault(decoder, []).append((handle, row))
+        for decoder, handle_rows in rows.items():
+            objects = decoder.create_many([row for _, row in handle_rows])
+            for (handle, _), obj in zip(handle_rows, objects):
+                self._objects[handle] = obj
+                self._tags[obj._tag] = obj
+        self._pending.clear()
+        self._pending_tags.clear()
+
+    def __getitem__(self, handle):
+        if handle in self._pending:
+            return self._create(handle)
+        return super().__getitem__(handle)
+
+    def get_by_tag(self, tag):
+        handle = self._pending_tags.get(tag)
+        if handle is not None:
+            return self._create(handle)
+        return super().get_by_tag(tag)
+
+    def has_tag(self, tag):
+        return tag in self._pending_tags or super().has_tag(tag)
+
+    def __setitem__(self, handle, obj):
+        if handle in self._pending:
+            self._create(handle)
+        super().__setitem__(handle, obj)
+
+    def __delitem__(self, handle):
+        if handle in self._pending:
+            self._create(handle)
+        super().__delitem__(handle)
+
+    def __iter__(self):
+        self._create_all()
+        return super().__iter__()
+
+    def __repr__(self):
+        self._create_all()
+        return super().__repr__()
+
+    def update_tag(self, obj, old_tag, new_tag):
+        self._create_all()
+        super().update_tag(obj, old_tag, new_tag)
+
+    def clear(self):
+        self._pending.clear()
+        self._pending_tags.clear()
+        super().clear()
+
+    def __getstate__(self):
+        # Snapshot is not pickled, only created objects.
+        self._create_all()
+        return vars(self)
+
+def _encode_map(stream_equipment_map, writer, class_codes):
+    """
+    Internal function to encode stream-equipment map as columns of
+    stream handle, from index, from class, to index and to class.
+    """
+    def class_code(cls):
+        if cls is None:
+            return -1
+        return class_codes.setdefault(_class_path(cls), len(class_codes))
+    def index(value):
+        return -1 if value is None else value
+    items = list(stream_equipment_map.items())
+    return {"stream": writer.add(np.array([stream for stream, _ in items], dtype=np.int64)),
+            "from_index": writer.add(np.array([index(row[0]) for _, row in items], dtype=np.int64)),
+            "from_class": writer.add(np.array([class_code(row[1]) for _, row in items], dtype=np.int32)),
+            "to_index": writer.add(np.array([index(row[2]) for _, row in items], dtype=np.int64)),
+            "to_class": writer.add(np.array([class_code(row[3]) for _, row in items], dtype=np.int32))}
+
+def _decode_map(saved, reader, classes):
+    columns = [reader.get(saved[name]).tolist()
+               for name in ["stream", "from_index", "from_class", "to_index", "to_class"]]
+    return {stream: [None if from_index < 0 else from_index,
+                     None if from_class < 0 else classes[from_class],
+                     None if to_index < 0 else to_index,
+                     None if to_class < 0 else classes[to_class]]
+            for stream, from_index, from_class, to_index, to_class in zip(*columns)}
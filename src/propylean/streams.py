@@ -1,8 +1,12 @@
-from thermo import Mixture
 import propylean.properties as prop
-from propylean.series import Series
+from propylean.series import Series, _elementwise
+from pandas import Series as PdSeries
 from propylean.validators import _Validators
+from propylean.settings import Settings
 from statistics import fmean
+from collections import OrderedDict
+from threading import RLock
+from propylean.registry import _Registry
 
 class Stream(object):
     def __init__(self, tag=None, **inputs) -> None:
@@ -22,6 +26,7 @@ class Stream(object):
             value = self._create_stream_tag()
         elif self._check_tag_assigned(value):
             raise Exception("Tag already assinged!")
+        self.items.update_tag(self, self._tag, value)
         self._tag = value
         self._update_stream_object(self)
     
@@ -29,55 +34,158 @@ class Stream(object):
     def index(self):
         return self._index
     
+    def to_dict(self):
+        """
+        DESCRIPTION:
+            Returns dictionary of the stream with its class, tag and all properties.
+            See propylean.interchange.to_dict for the format.
+
+        RETURN VALUE:
+            Type: dict
+
+        SAMPLE USE CASES:
+            >>> data = MaterialStream.items.get_by_tag("S-1").to_dict()
+        """
+        from propylean.interchange import to_dict
+        return to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        DESCRIPTION:
+            Creates stream from dictionary returned by to_dict. Use
+            propylean.load_many to create many objects at once.
+
+        PARAMETERS:
+            data:
+                Required: Yes
+                Type: dict
+
+        RETURN VALUE:
+            Type: Object of the class.
+
+        SAMPLE USE CASES:
+            >>> stream = MaterialStream.from_dict(data)
+        """
+        from propylean.interchange import from_dict
+        return from_dict(data, cls=cls)
+
     @classmethod
     def _update_stream_object(cls, obj):
         if cls.__name__ != type(obj).__name__:
             raise Exception("Object type should be {} type. Type passed is {}".format(cls.__name__, type(obj).__name__))
+        if obj not in cls.items:
+            return
+        obj._mark_downstream_dirty()
+
+    def _mark_downstream_dirty(self):
+        """
+        Internal function to mark equipment the stream goes to, and all
+        equipments downstream of it, as dirty.
+        """
+        from propylean.equipments import abstract_equipment_classes as equipments
+        if isinstance(self, EnergyStream):
+            stream_equipment_map = equipments._energy_stream_equipment_map
+        else:
+            stream_equipment_map = equipments._material_stream_equipment_map
+        mapping = stream_equipment_map.get(self.index)
+        if mapping is None or mapping[2] is None:
+            return
         try:
-            cls.items[obj.index] = obj
-        except:
-            pass
+            equipment = mapping[3].items[mapping[2]]
+        except IndexError:
+            return
+        equipment._mark_dirty(inlet_changed=True)
     
     def _get_stream_index(cls, tag):
-        for index, stream in enumerate(cls.items):
-            if stream.tag == tag:
-                return index
-        return None
+        stream = cls.items.get_by_tag(tag)
+        return None if stream is None else stream.index
 
     def _get_stream_object(cls, obj):
         try:
-            return cls.items[obj.index]
+            return cls.items.resolve(obj, "Stream")
         except IndexError:
             raise Exception("Stream does not exist!")
         except AttributeError:
             return obj
 
     def _create_stream_tag(cls):
-        i = 1
-        class_name = type(cls).__name__
-        tag = class_name + "_" + str(i)
-        while cls._check_tag_assigned(tag):
-            tag = class_name+ "_" + str(i)
-            i += 1
-        return tag
+        return cls.items.create_tag(type(cls).__name__)
     
     def _check_tag_assigned(cls, tag):
-        for stream in cls.items:
-            if tag == stream.tag:
-                return True
-        return False
+        return cls.items.has_tag(tag)
     
     def _tuple_property_value_unit_returner(self, value, property_type):
         if isinstance(value, tuple):
             return value[0], value[1]
         elif isinstance(value, property_type):
             return value.value, value.unit
+        elif isinstance(value, Series):
+            return value, value.unit
         elif any([isinstance(value, float), isinstance(value, int)]):
             return value, None
 
 
+class _PropertyCache(object):
+    def __init__(self):
+        """
+        DESCRIPTION:
+            Internal least recently used cache of properties evaluated from flashed
+            Mixture. Shared by all MaterialStream objects so that same composition
+            at same temperature and pressure is flashed only once.
+            Size is governed by Settings.property_cache_size and temperature and
+            pressure are rounded as per Settings.property_cache_tolerance.
+            Cache is shared by all models and threads, so it is guarded by a lock.
+        """
+        self._states = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, components, T, P):
+        """
+        Returns key for the cache. T in K and P in Pa.
+        """
+        tolerance = Settings.property_cache_tolerance
+        fractions = tuple(sorted(components.fractions.items()))
+        return (fractions, components.type,
+                round(T / tolerance), round(P / tolerance))
+
+    def get(self, key):
+        with self._lock:
+            values = self._states.get(key)
+            if values is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._states.move_to_end(key)
+            return values
+
+    def put(self, key, values):
+        if Settings.property_cache_size <= 0:
+            return
+        with self._lock:
+            self._states[key] = values
+            self._states.move_to_end(key)
+            while len(self._states) > Settings.property_cache_size:
+                self._states.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "size": len(self._states),
+                    "max_size": Settings.property_cache_size}
+
+
 class EnergyStream(Stream):
-    items = [] 
+    items = _Registry()
     def __init__(self, tag=None, amount=(0, 'W')):
         """ 
         DESCRIPTION:
@@ -117,8 +225,7 @@ class EnergyStream(Stream):
         self._amount = prop.Power() 
         self.amount = amount
 
-        self._index = len(EnergyStream.items)
-        EnergyStream.items.append(self)
+        self._index = EnergyStream.items.add(self)
 
     @property
     def amount(self):
@@ -131,7 +238,7 @@ class EnergyStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Power)
         if unit is None:
             unit = self.amount.unit
-        self._amount = prop.Power(value, unit)
+        self._amount = prop.Power(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
 
     def __repr__(self) -> str:
@@ -175,7 +282,8 @@ class EnergyStream(Stream):
       
 class MaterialStream(Stream):
     property_package = None
-    items = [] 
+    items = _Registry()
+    _property_cache = _PropertyCache()
     def __init__(self, tag=None, mass_flowrate=0, pressure=101325,
                  temperature=298):
         """ 
@@ -278,15 +386,21 @@ class MaterialStream(Stream):
 
             phase:
                 The phase of the material stream. "l" for liguid, "g" for gas, "l/g" for mixed phase as per fluids package.
-                Type: String
+                If temperature or pressure is Series, pandas Series with phase of every row, aligned with
+                index of temperature or pressure Series.
+                Type: String or pandas Series of String
             
             pressure:
                 The pressure of the material stream. It is recommended to set it to help derive other properties.
-                Type: Pressure
+                Type: Pressure or Series
 
             temperature:
                 The temperature of the material stream. It is recommended to set it to help derive other properties.
-                Type: Temperature
+                Type: Temperature or Series
+
+            If pressure and/or temperature is set as Series, properties derived from components
+            (densities, viscosities, Z, molecular_weight, isentropic_exponent, Psat and Pc)
+            are evaluated for every row in one call and are Series aligned with the input Series.
 
         
         RETURN VALUE:
@@ -340,8 +454,7 @@ class MaterialStream(Stream):
         self._Psat = None
         self._Pc = None
 
-        self._index = len(MaterialStream.items)
-        MaterialStream.items.append(self)
+        self._index = MaterialStream.items.add(self)
         
     @property
     def pressure(self):
@@ -354,7 +467,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Pressure)
         if unit is None:
             unit = self._pressure.unit
-        self._pressure = prop.Pressure(value, unit)
+        self._pressure = prop.Pressure(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
 
     @property
@@ -368,7 +481,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Temperature)
         if unit is None:
             unit = self._temperature.unit
-        self._temperature = prop.Temperature(value, unit)
+        self._temperature = prop.Temperature(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
 
     @property
@@ -382,20 +495,22 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.MassFlowRate)
         if unit is None:
             unit = self._mass_flowrate.unit
-        self._mass_flowrate = prop.MassFlowRate(value, unit)
+        self._mass_flowrate = prop.MassFlowRate(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
     
     @property
     def vol_flowrate(self):
         self = self._get_stream_object(self)
-        old_mf_unit = self.mass_flowrate.unit
-        density = self.density
-        self.mass_flowrate.unit = 'kg/s'
-        density.unit = 'kg/m^3'
-        unit = self._vol_flowrate.unit
-        self._vol_flowrate = prop.VolumetricFlowRate(self.mass_flowrate.value/density.value)
-        self._vol_flowrate.unit = unit
-        self.mass_flowrate.unit = old_mf_unit
+        mass_flowrate = self.mass_flowrate.to_unit('kg/s')
+        density = self.density.to_unit('kg/m^3')
+        # Series if temperature, pressure or mass flowrate is Series.
+        vol_flowrate = _elementwise(lambda mass_flowrate, density: mass_flowrate / density,
+                                    [mass_flowrate, density], prop.VolumetricFlowRate, 'm^3/s')
+        vol_flowrate = vol_flowrate.to_unit(self._vol_flowrate.unit)
+        if isinstance(vol_flowrate, Series):
+            return vol_flowrate
+        # Published only after conversion so that readers never see partial value.
+        self._vol_flowrate = vol_flowrate
         return self._vol_flowrate
     
     @property
@@ -411,21 +526,20 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.MolecularWeigth)
         if unit is None:
             unit = self._molecular_weight.unit
-        self._molecular_weight = prop.MolecularWeigth(value, unit)
+        self._molecular_weight = prop.MolecularWeigth(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
 
     @property
     def mol_flowrate(self):
         self = self._get_stream_object(self)
-        old_mf_unit = self.mass_flowrate.unit
-        old_mw_unit = self.molecular_weight.unit
-        self.mass_flowrate.unit = 'kg/s'
-        self.molecular_weight.unit = 'kg/mol'
-        unit = self._mol_flowrate.unit
-        self._mol_flowrate = prop.MolarFlowRate(self.mass_flowrate.value/self.molecular_weight.value)
-        self._mol_flowrate.unit = unit
-        self.mass_flowrate.unit = old_mf_unit
-        self.molecular_weight.unit = old_mw_unit
+        mass_flowrate = self.mass_flowrate.to_unit('kg/s')
+        molecular_weight = self.molecular_weight.to_unit('kg/mol')
+        mol_flowrate = _elementwise(lambda mass_flowrate, molecular_weight: mass_flowrate / molecular_weight,
+                                    [mass_flowrate, molecular_weight], prop.MolarFlowRate, 'mol/s')
+        mol_flowrate = mol_flowrate.to_unit(self._mol_flowrate.unit)
+        if isinstance(mol_flowrate, Series):
+            return mol_flowrate
+        self._mol_flowrate = mol_flowrate
         return self._mol_flowrate
 
     @property
@@ -456,7 +570,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Density)
         if unit is None:
             unit = self._density.unit
-        self._density = prop.Density(value, unit)
+        self._density = prop.Density(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
     
     @property
@@ -472,7 +586,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Density)
         if unit is None:
             unit = self._density_l.unit
-        self._density_l = prop.Density(value, unit)
+        self._density_l = prop.Density(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
     
     @property
@@ -488,7 +602,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Density)
         if unit is None:
             unit = self._density_g.unit
-        self._density_g = prop.Density(value, unit)
+        self._density_g = prop.Density(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
     
     @property
@@ -504,7 +618,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.Density)
         if unit is None:
             unit = self._density_s.unit
-        self._density_s = prop.Density(value, unit)
+        self._density_s = prop.Density(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
 
     @property
@@ -520,7 +634,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.DViscosity)
         if unit is None:
             unit = self._d_viscosity.unit
-        self._d_viscosity = prop.DViscosity(value, unit)
+        self._d_viscosity = prop.DViscosity(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
     
     @property
@@ -536,7 +650,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.DViscosity)
         if unit is None:
             unit = self._density_l.unit
-        self._d_viscosity_l = prop.DViscosity(value, unit)
+        self._d_viscosity_l = prop.DViscosity(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
     
     @property
@@ -552,7 +666,7 @@ class MaterialStream(Stream):
         value, unit = self._tuple_property_value_unit_returner(value, prop.DViscosity)
         if unit is None:
             unit = self._d_viscosity_g.unit
-        self._d_viscosity_g = prop.DViscosity(value, unit)
+        self._d_viscosity_g = prop.DViscosity(value, unit) if not isinstance(value, Series) else value
         self._update_stream_object(self)
     
     @property
@@ -574,7 +688,7 @@ class MaterialStream(Stream):
         return self._phase
     @phase.setter
     def phase(self, value):
-        _Validators.validate_arg_prop_value_type("phase", value, (str))
+        _Validators.validate_arg_prop_value_type("phase", value, (str, PdSeries))
         if MaterialStream.property_package:
             raise Exception("Property cannot be changed when using a Property Package.")
         self = self._get_stream_object(self)
@@ -649,91 +763,199 @@ class MaterialStream(Stream):
     def _update_properties(self):
         if self.components.fractions is None:
             return
-        arg_map = {'mass': 'ws',
-                   'mol': 'zs',
-                   'vol_l': 'Vfls',
-                   'vol_g': 'Vfgs'}
-        old_p_unit = self.pressure.unit 
-        old_t_unit = self.temperature.unit
-        self.pressure.unit = 'Pa'
-        self.temperature.unit = 'K'
-        kwarg = {arg_map[self.components.type]: self.components.fractions,
-                 'T': self.temperature.value,
-                 'P': self.pressure.value}  
-        mx = Mixture(**kwarg)
-        self.pressure.unit = old_p_unit
-        self.temperature.unit = old_t_unit
+        if (isinstance(self._temperature, Series) or
+            isinstance(self._pressure, Series)):
+            return self._update_properties_batch()
+        T = self.temperature.to_unit('K').value
+        P = self.pressure.to_unit('Pa').value
+        cache_key = self._property_cache.key(self.components, T, P)
+        values = self._property_cache.get(cache_key)
+        if values is None:
+            from thermo import Mixture
+            kwarg = self._mixture_kwarg()
+            kwarg['T'] = T
+            kwarg['P'] = P
+            mx = Mixture(**kwarg)
+            values = self._get_mixture_properties(mx)
+            self._property_cache.put(cache_key, values)
         
         # Assigning Phase.
-        phase = mx.phase
-        if phase is not None:
-            self.phase = phase
+        if values["phase"] is not None:
+            self.phase = values["phase"]
 
         # Assigning Densities
-        rho = mx.rho
-        if rho is not None:
-            self.density = prop.Density(rho, 'kg/m^3')
-        
-        rhol = mx.rhol
-        if rhol is not None:
-            self.density_l = prop.Density(rhol, 'kg/m^3')
-    
-        rhog = mx.rhog
-        if rhog is not None:
-            self.density_g = prop.Density(rhog, 'kg/m^3')
+        if values["rho"] is not None:
+            self.density = prop.Density._from_trusted(values["rho"], 'kg/m^3')
+        if values["rhol"] is not None:
+            self.density_l = prop.Density._from_trusted(values["rhol"], 'kg/m^3')
+        if values["rhog"] is not None:
+            self.density_g = prop.Density._from_trusted(values["rhog"], 'kg/m^3')
 
         # Assigning Viscosities
-        mu = mx.mu
-        if mu is not None:
-            self.d_viscosity = prop.DViscosity(mu, 'Pa-s')
-        
-        mul = mx.mul
-        if mul is not None:
-            self.d_viscosity_l = prop.DViscosity(mul, 'Pa-s')
-            
-        mug = mx.mug       
-        if mug is not None:
-            self.d_viscosity_g = prop.DViscosity(mug, 'Pa-s')
+        if values["mu"] is not None:
+            self.d_viscosity = prop.DViscosity._from_trusted(values["mu"], 'Pa-s')
+        if values["mul"] is not None:
+            self.d_viscosity_l = prop.DViscosity._from_trusted(values["mul"], 'Pa-s')
+        if values["mug"] is not None:
+            self.d_viscosity_g = prop.DViscosity._from_trusted(values["mug"], 'Pa-s')
         
         # Assigning Molecular Weight
-        MW = mx.MW
-        if MW is not None:
-            self.molecular_weight = prop.MolecularWeigth(MW, 'g/mol')
+        if values["MW"] is not None:
+            self.molecular_weight = prop.MolecularWeigth._from_trusted(values["MW"], 'g/mol')
         
         #Assiging Compressibility Factor Z
-        Z = mx.Z
-        if Z is not None:
-            self.Z = prop.Dimensionless(value=Z, name="Compressibility factor (Z)")
-        
-        Z_l = mx.Zl
-        if Z_l is not None:
-            self.Z_l = prop.Dimensionless(value=Z_l, name="Compressibility factor of mixture in liquid phase (Z_l)")
-        
-        Z_g = mx.Zg
-        if Z_g is not None:
-            self.Z_g = prop.Dimensionless(value=Z_g, name="Compressibility factor of mixture gaseous phase (Z_g)")
+        if values["Z"] is not None:
+            self.Z = prop.Dimensionless(value=values["Z"], name="Compressibility factor (Z)")
+        if values["Zl"] is not None:
+            self.Z_l = prop.Dimensionless(value=values["Zl"], name="Compressibility factor of mixture in liquid phase (Z_l)")
+        if values["Zg"] is not None:
+            self.Z_g = prop.Dimensionless(value=values["Zg"], name="Compressibility factor of mixture gaseous phase (Z_g)")
         
         # Assigning Isnetropic Exponent.
-        isentropic_exponent = mx.isentropic_exponent
-        if isentropic_exponent is not None:
-            self.isentropic_exponent = prop.Dimensionless(value=isentropic_exponent, name="Isentropic Exponent")
+        if values["isentropic_exponent"] is not None:
+            self.isentropic_exponent = prop.Dimensionless(value=values["isentropic_exponent"], name="Isentropic Exponent")
         
         # Assigning Psat and Pc.
+        if values["Psat"] is not None:
+            self.Psat = prop.Pressure._from_trusted(values["Psat"], "Pa")
+        if values["Pc"] is not None:
+            self.Pc = prop.Pressure._from_trusted(values["Pc"], "Pa")
+
+    def _update_properties_batch(self):
+        """
+        Internal function to evaluate properties when temperature and/or pressure
+        of the stream is a Series. Mixture is created only once so that component
+        constants are reused, and it is flashed once per unique (T, P) row not
+        found in the property cache.
+        Each evaluated property is set as Series aligned with the input Series.
+        """
+        T, P = self._temperature, self._pressure
+        if (isinstance(T, Series) and isinstance(P, Series) and
+            len(T._instance) != len(P._instance)):
+            raise Exception("Temperature and pressure Series should be of same length. Provided {} and {}."\
+                            .format(len(T._instance), len(P._instance)))
+        index = T._instance.index if isinstance(T, Series) else P._instance.index
+        T_values = self._batch_values(T, 'K', index)
+        P_values = self._batch_values(P, 'Pa', index)
+
+        mx = None
+        evaluated = {}
+        rows = []
+        for T_value, P_value in zip(T_values, P_values):
+            key = (T_value, P_value)
+            if key not in evaluated:
+                cache_key = self._property_cache.key(self.components, T_value, P_value)
+                values = self._property_cache.get(cache_key)
+                if values is None:
+                    if mx is None:
+                        from thermo import Mixture
+                        kwarg = self._mixture_kwarg()
+                        kwarg['T'] = T_value
+                        kwarg['P'] = P_value
+                        mx = Mixture(**kwarg)
+                    else:
+                        mx.flash_caloric(T=T_value, P=P_value)
+                    values = self._get_mixture_properties(mx)
+                    self._property_cache.put(cache_key, values)
+                evaluated[key] = values
+            rows.append(evaluated[key])
+        
+        def column(name, property_type, unit=None):
+            values = [row[name] for row in rows]
+            return Series(data=PdSeries(values, index=index, dtype=float),
+                          prop=property_type, unit=unit)
+
+        # Phase is not a physical property, so it is pandas Series of strings.
+        self._phase = PdSeries([row["phase"] for row in rows], index=index, dtype=object)
+        self._density = column("rho", prop.Density, 'kg/m^3')
+        self._density_l = column("rhol", prop.Density, 'kg/m^3')
+        self._density_g = column("rhog", prop.Density, 'kg/m^3')
+        self._d_viscosity = column("mu", prop.DViscosity, 'Pa-s')
+        self._d_viscosity_l = column("mul", prop.DViscosity, 'Pa-s')
+        self._d_viscosity_g = column("mug", prop.DViscosity, 'Pa-s')
+        self._molecular_weight = column("MW", prop.MolecularWeigth, 'g/mol')
+        self._Z = column("Z", prop.Dimensionless)
+        self._Z_l = column("Zl", prop.Dimensionless)
+        self._Z_g = column("Zg", prop.Dimensionless)
+        self._isentropic_exponent = column("isentropic_exponent", prop.Dimensionless)
+        self._Psat = column("Psat", prop.Pressure, 'Pa')
+        self._Pc = column("Pc", prop.Pressure, 'Pa')
+        self._update_stream_object(self)
+
+    def _batch_values(self, value, unit, index):
+        """
+        Internal function to get values of a property as list in unit provided.
+        Scalar properties are repeated for length of the index.
+        """
+        if isinstance(value, Series):
+            return value.to_unit(unit)._instance.to_numpy().tolist()
+        value = type(value)(value.value, value.unit)
+        value.unit = unit
+        return [value.value] * len(index)
+
+    def _mixture_kwarg(self):
+        arg_map = {'mass': 'ws',
+                   'mol': 'zs',
+                   'vol_l': 'Vfls',
+                   'vol_g': 'Vfgs'}
+        return {arg_map[self.components.type]: self.components.fractions}
+
+    @staticmethod
+    def _get_mixture_properties(mx):
+        """
+        Internal function to read all properties of the stream from flashed Mixture.
+        """
         Psat_indiv = mx.Psats
-        Psat = None
         if len(Psat_indiv)==1:
             Psat = Psat_indiv[0]
         else:
             Psat = fmean(Psat_indiv)
-        if Psat is not None:
-            self.Psat = prop.Pressure(Psat, unit="Pa")
-        Pc = mx.Pc
-        if Pc is not None:
-            self.Pc = prop.Pressure(Pc, unit="Pa")
+        return {"phase": mx.phase,
+                "rho": mx.rho,
+                "rhol": mx.rhol,
+                "rhog": mx.rhog,
+                "mu": mx.mu,
+                "mul": mx.mul,
+                "mug": mx.mug,
+                "MW": mx.MW,
+                "Z": mx.Z,
+                "Zl": mx.Zl,
+                "Zg": mx.Zg,
+                "isentropic_exponent": mx.isentropic_exponent,
+                "Psat": Psat,
+                "Pc": mx.Pc}
 
     @classmethod
     def list_objects(cls):
         return cls.items
+
+    @classmethod
+    def property_cache_info(cls):
+        """ 
+        DESCRIPTION:
+            Method to get statistics of the property cache shared by all MaterialStream
+            objects. Maximum size of cache is set using Settings.property_cache_size.
+        
+        RETURN VALUE:
+            Type: dict
+            Description: Dictionary with keys 'hits', 'misses', 'size' and 'max_size'.
+        
+        SAMPLE USE CASES:
+            >>> MaterialStream.property_cache_info()
+            {'hits': 12, 'misses': 3, 'size': 3, 'max_size': 1024}
+        """
+        return cls._property_cache.info()
+
+    @classmethod
+    def clear_property_cache(cls):
+        """ 
+        DESCRIPTION:
+            Method to remove all states from the property cache and reset its counters.
+        
+        SAMPLE USE CASES:
+            >>> MaterialStream.clear_property_cache()
+        """
+        cls._property_cache.clear()
     
     def __repr__(self) -> str:
         self = self._get_stream_object(self)
@@ -783,8 +1005,8 @@ def get_stream_index(tag, stream_type=None):
     else:
         raise Exception('Stream type does not exist! Please ensure stream type is either Energy or Material')
 
-    for index, stream in enumerate(stream_list):        
-        if stream.tag == tag:
-            return index
+    stream = stream_list.get_by_tag(tag)
+    if stream is not None:
+        return stream.index
     
     raise Exception("Stream tag not found!!")
\ No newline at end of file
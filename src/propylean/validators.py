@@ -119,11 +119,18 @@ class _Validators(object):
                 Type: Any 
                 Description: Value of the argument or property.
         """
-        if not isinstance(value, (int, float, tuple)):
+        if hasattr(value, "_instance"):
+            # propylean Series. Checked on wrapped pandas or Spark series.
+            value = value._instance
+        elif not isinstance(value, (int, float, tuple)):
             value = value.value
         elif isinstance(value, tuple):
             value = value[0]
-        if value < 0:
+        negative = value < 0
+        if hasattr(negative, "any"):
+            # Array of values, for e.g. PropertyArray or Series.
+            negative = negative.any()
+        if negative:
             raise Exception("""Value passed to '{0}' should be greater than or equal to 0.
             Value provided is {1}.""".format(arg_prop_name, value))
         return True
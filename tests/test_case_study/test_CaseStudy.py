@@ -0,0 +1,53 @@
+import pytest
+import unittest
+import pandas as pd
+from propylean import CentrifugalPump, MaterialStream
+from propylean.case_study import CaseStudy
+from propylean.settings import Settings
+import propylean.properties as prop
+
+def pump_head_difference(case):
+    pump = CentrifugalPump.items.get_by_tag("CS-P-1")
+    return {"outlet_minus_inlet": (pump.outlet_pressure - pump.inlet_pressure).to_unit('bar').value,
+            "pipe_dp_method": Settings.pipe_dp_method}
+
+class test_CaseStudy(unittest.TestCase):
+    def setUp(self):
+        if MaterialStream.items.get_by_tag("CS-Feed") is None:
+            feed = MaterialStream(tag="CS-Feed", pressure=(2, 'bar'), temperature=(30, 'C'),
+                                  mass_flowrate=(1000, 'kg/h'))
+            pump = CentrifugalPump(tag="CS-P-1", differential_pressure=(3, 'bar'))
+            pump.connect_stream(feed, direction="in")
+
+    @pytest.mark.positive
+    def test_CaseStudy_run(self):
+        cases = pd.DataFrame({"CS-P-1.differential_pressure": [(1, 'bar'), (2, 'bar'), (4, 'bar')],
+                              "CS-Feed.pressure": [(1, 'bar'), (2, 'bar'), (3, 'bar')],
+                              "Settings.pipe_dp_method": ["Haaland", "Colebrook", "Clamond"]})
+        study = CaseStudy(cases, outputs=[("CS-P-1.outlet_pressure", 'bar'), "CS-P-1.tag"],
+                          function=pump_head_difference)
+        results = study.run(max_workers=2)
+        self.assertEqual(len(results), 3)
+        for i, (dp, p) in enumerate([(1, 1), (2, 2), (4, 3)]):
+            self.assertAlmostEqual(results["CS-P-1.outlet_pressure"][i], dp + p)
+            self.assertAlmostEqual(results["outlet_minus_inlet"][i], dp)
+        self.assertEqual(list(results["pipe_dp_method"]), ["Haaland", "Colebrook", "Clamond"])
+        self.assertEqual(list(results["CS-P-1.tag"]), ["CS-P-1"] * 3)
+        self.assertTrue(results["error"].isna().all())
+        # Cases run on copies of the model.
+        pump = CentrifugalPump.items.get_by_tag("CS-P-1")
+        self.assertAlmostEqual(pump.differential_pressure.to_unit('bar').value, 3)
+
+    @pytest.mark.negative
+    def test_CaseStudy_case_error(self):
+        study = CaseStudy([{"CS-Unknown.pressure": 10}, {"CS-P-1.differential_pressure": (1, 'bar')}],
+                          outputs=[("CS-P-1.outlet_pressure", 'bar')])
+        results = study.run(max_workers=1)
+        self.assertIn("No object with tag 'CS-Unknown' found.", results["error"][0])
+        self.assertTrue(pd.isna(results["error"][1]))
+
+    @pytest.mark.negative
+    def test_CaseStudy_incorrect_type_to_cases(self):
+        with pytest.raises(Exception) as exp:
+            CaseStudy(cases="cases")
+        self.assertIn("Incorrect type 'str' provided to 'cases'.", str(exp))
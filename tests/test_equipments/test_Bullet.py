@@ -23,7 +23,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -31,7 +31,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -39,7 +39,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -55,7 +55,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -63,7 +63,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -79,7 +79,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.temperature_increase = []
-        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                                      
 
     @pytest.mark.negative
@@ -209,7 +209,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.operating_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'operating_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'operating_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))  
 
     @pytest.mark.negative
@@ -217,7 +217,7 @@ class test_Bullet(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = Bullet()
             m4.operating_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'operating_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'operating_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))          
 
     @pytest.mark.negative
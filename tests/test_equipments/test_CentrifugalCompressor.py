@@ -64,7 +64,7 @@ class test_CentrifugalCompressor(unittest.TestCase):
         performance_curve = pd.DataFrame([{'flow':[2,10,30,67], 'head':[45,20,10,2]}])
         compressor = CentrifugalCompressor(tag="compressor_4",
                                             performance_curve=performance_curve)
-        self.assertEqual(compressor.performace_curve.shape, performance_curve.shape)
+        self.assertEqual(compressor.performance_curve.shape, performance_curve.shape)
     
     @pytest.mark.positive
     def test_CentrifugalCompressor_representation(self):
@@ -99,7 +99,7 @@ class test_CentrifugalCompressor(unittest.TestCase):
         compressor = CentrifugalCompressor(tag="compressor_9",
                                differential_pressure=(10, 'bar'))
         compressor.outlet_temperature = (130, 'F')
-        self.assertEqual(compressor.outlet_temperature, prop.Temperature(129.99999, 'F'))
+        self.assertEqual(compressor.outlet_temperature, prop.Temperature(130, 'F'))
     
     @pytest.mark.positive
     def test_CentrifugalCompressor_setting_inlet_mass_flowrate(self):
@@ -360,7 +360,7 @@ class test_CentrifugalCompressor(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalCompressor()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -368,7 +368,7 @@ class test_CentrifugalCompressor(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalCompressor()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -376,7 +376,7 @@ class test_CentrifugalCompressor(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalCompressor()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -392,7 +392,7 @@ class test_CentrifugalCompressor(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalCompressor()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -400,7 +400,7 @@ class test_CentrifugalCompressor(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalCompressor()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
                                                      
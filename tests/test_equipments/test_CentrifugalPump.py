@@ -5,6 +5,7 @@ from propylean.streams import MaterialStream, EnergyStream
 import propylean.properties as prop
 import pandas as pd
 from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
 from propylean import MaterialStream, EnergyStream
 
 class test_CentrifugalPump(unittest.TestCase):
@@ -53,7 +54,7 @@ class test_CentrifugalPump(unittest.TestCase):
         performance_curve = pd.DataFrame([{'flow':[2,10,30,67], 'head':[45,20,10,2]}])
         pump = CentrifugalPump(tag="Pump_4",
                                performance_curve=performance_curve)
-        self.assertEqual(pump.performace_curve.shape, performance_curve.shape)
+        self.assertEqual(pump.performance_curve.shape, performance_curve.shape)
     
     @pytest.mark.positive
     def test_CentrifugalPump_representation(self):
@@ -348,12 +349,35 @@ class test_CentrifugalPump(unittest.TestCase):
         self.assertAlmostEqual(expected_hydraulic_power.value, pump_hydraulic_power.value, 1)
         self.assertAlmostEqual(expected_brake_horse_power, pump_brake_horse_power.value, 1)
 
+    @pytest.mark.positive
+    def test_CentrifugalPump_getters_concurrently_without_changing_units(self):
+        pump = CentrifugalPump(tag="Pump_23",
+                               differential_pressure=(100, 'bar'),
+                               efficiency=40)
+        inlet_stream = MaterialStream(tag="Inlet_Pump_23",
+                                      mass_flowrate=(1000, 'kg/h'),
+                                      pressure=(30, 'bar'),
+                                      temperature=(25, 'C'))
+        inlet_stream.components = prop.Components({"water": 1})
+        pump.connect_stream(inlet_stream, 'in', stream_governed=True)
+        expected = (pump.head.value, pump.NPSHa.value, pump.hydraulic_power.value, pump.power.value)
+        def evaluate(_):
+            return (pump.head.value, pump.NPSHa.value, pump.hydraulic_power.value, pump.power.value)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(evaluate, range(200)))
+        for result in results:
+            self.assertEqual(result, expected)
+        self.assertEqual(pump.differential_pressure.unit, "bar")
+        self.assertEqual(pump.inlet_pressure.unit, "bar")
+        self.assertEqual(inlet_stream.density.unit, "kg/m^3")
+        self.assertEqual(inlet_stream.mass_flowrate.unit, "kg/h")
+
     @pytest.mark.negative
     def test_CentrifugalPump_inlet_pressure_incorrect_type_to_value(self):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalPump()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -361,7 +385,7 @@ class test_CentrifugalPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalPump()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -369,7 +393,7 @@ class test_CentrifugalPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalPump()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -385,7 +409,7 @@ class test_CentrifugalPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalPump()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -393,7 +417,7 @@ class test_CentrifugalPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalPump()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -409,7 +433,7 @@ class test_CentrifugalPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = CentrifugalPump()
             m4.temperature_increase = []
-        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                                      
 
     @pytest.mark.negative
@@ -573,4 +597,129 @@ class test_CentrifugalPump(unittest.TestCase):
         self.assertIsNone(mse_map[outlet_stream.index][1]) 
 
         self.assertIsNone(ese_map[energy_in.index][2])
-        self.assertIsNone(ese_map[energy_in.index][3])
\ No newline at end of file
+        self.assertIsNone(ese_map[energy_in.index][3])
+    @pytest.mark.positive
+    def test_CentrifugalPump_tag_registry(self):
+        pump = CentrifugalPump(tag="registry_pump")
+        self.assertTrue(CentrifugalPump.items.has_tag("registry_pump"))
+        self.assertEqual(pump._get_equipment_index("registry_pump"), pump.index)
+        pump.tag = "registry_pump_renamed"
+        self.assertFalse(CentrifugalPump.items.has_tag("registry_pump"))
+        self.assertIs(CentrifugalPump.items.get_by_tag("registry_pump_renamed"), pump)
+        pump.delete()
+        self.assertFalse(CentrifugalPump.items.has_tag("registry_pump_renamed"))
+        with pytest.raises(Exception) as exp:
+            CentrifugalPump(tag="registry_pump_2").tag = "registry_pump_2"
+        self.assertIn("Tag 'registry_pump_2' already assigned!", str(exp))
+
+    @pytest.mark.positive
+    def test_CentrifugalPump_setting_property_array(self):
+        pump = CentrifugalPump(differential_pressure=(100, 'bar'))
+        pump.inlet_pressure = prop.PropertyArray([10, 20, 30], prop.Pressure, 'bar')
+        self.assertIsInstance(pump.outlet_pressure, prop.PropertyArray)
+        self.assertEqual(list(pump.outlet_pressure.value), [110, 120, 130])
+        pump.differential_pressure = prop.PropertyArray([1, 2, 3], prop.Pressure, 'bar')
+        self.assertEqual(list(pump.pressure_drop.value), [-1, -2, -3])
+        self.assertEqual(list(pump.outlet_pressure.value), [11, 22, 33])
+
+    @pytest.mark.positive
+    def test_CentrifugalPump_head_refreshes_dirty_upstream(self):
+        feed = MaterialStream(pressure=(2, 'bar'), temperature=(30, 'C'))
+        feed.components = prop.Components({"water": 1})
+        middle = MaterialStream()
+        product = MaterialStream()
+        pump_1 = CentrifugalPump(differential_pressure=(5, 'bar'))
+        pump_2 = CentrifugalPump(differential_pressure=(3, 'bar'))
+        pump_1.connect_stream(feed, direction="in")
+        pump_1.connect_stream(middle, direction="out", stream_governed=False)
+        pump_2.connect_stream(middle, direction="in")
+        pump_2.connect_stream(product, direction="out", stream_governed=False)
+        pump_2.head
+        self.assertAlmostEqual(middle.pressure.to_unit('bar').value, 7)
+        self.assertAlmostEqual(product.pressure.to_unit('bar').value, 10)
+
+        feed.pressure = (4, 'bar')
+        # Not refreshed until a derived value is read.
+        self.assertAlmostEqual(middle.pressure.to_unit('bar').value, 7)
+        self.assertAlmostEqual(product.pressure.to_unit('bar').value, 10)
+        head = pump_2.head
+        self.assertAlmostEqual(middle.pressure.to_unit('bar').value, 9)
+        self.assertAlmostEqual(product.pressure.to_unit('bar').value, 12)
+        self.assertAlmostEqual(head.value, 300000 / (9.8 * middle.density.value), 3)
+
+        pump_2.differential_pressure = (4, 'bar')
+        self.assertAlmostEqual(product.pressure.to_unit('bar').value, 12)
+        pump_2.head
+        self.assertAlmostEqual(middle.pressure.to_unit('bar').value, 9)
+        self.assertAlmostEqual(product.pressure.to_unit('bar').value, 13)
+
+    @pytest.mark.positive
+    def test_CentrifugalPump_operating_point(self):
+        from propylean import PipeSegment, ControlValve
+        import numpy as np
+        feed = MaterialStream(pressure=(2, 'bar'), temperature=(30, 'C'),
+                              mass_flowrate=(150000, 'kg/h'))
+        feed.components = prop.Components({"water": 1})
+        streams = [MaterialStream() for _ in range(4)]
+        suction_pipe = PipeSegment(ID=(200, 'mm'), length=(20, 'm'))
+        pump = CentrifugalPump(differential_pressure=(6, 'bar'))
+        pump.performance_curve = pd.DataFrame({'flow': [0, 100, 200, 300],
+                                               'head': [80, 75, 60, 35]})
+        discharge_pipe = PipeSegment(ID=(150, 'mm'), length=(200, 'm'), elevation=(10, 'm'))
+        valve = ControlValve(pressure_drop=(1.5, 'bar'))
+        suction_pipe.connect_stream(feed, 'in')
+        suction_pipe.connect_stream(streams[0], 'out', stream_governed=False)
+        pump.connect_stream(streams[0], 'in')
+        pump.connect_stream(streams[1], 'out', stream_governed=False)
+        discharge_pipe.connect_stream(streams[1], 'in')
+        discharge_pipe.connect_stream(streams[2], 'out', stream_governed=False)
+        valve.connect_stream(streams[2], 'in')
+        valve.connect_stream(streams[3], 'out', stream_governed=False)
+        Kv = valve.Cv
+
+        openings = np.array([0.25, 0.5, 1])
+        result = pump.operating_point(valve_openings=openings, destination_pressure=(3, 'bar'))
+        self.assertEqual(list(result["valve_opening"]), list(openings))
+        self.assertTrue(np.all(np.diff(result["flow"]) > 0))
+        density = feed.density.to_unit('kg/m^3').value
+        for _, row in result.iterrows():
+            flow = row["flow"] / 3600
+            system_dp = (1e5 + suction_pipe._pressure_drops(flow, density, feed.d_viscosity.value)
+                         + discharge_pipe._pressure_drops(flow, density, feed.d_viscosity.value)
+                         + density / 1000 * (row["flow"] / (row["valve_opening"] * Kv))**2 * 1e5)
+            self.assertAlmostEqual(row["differential_pressure"] / system_dp, 1, 6)
+            self.assertAlmostEqual(row["head"], np.interp(row["flow"], [0, 100, 200, 300],
+                                                          [80, 75, 60, 35]), 6)
+
+        result = pump.operating_point(speeds=[0.4, 1], destination_pressure=(3, 'bar'))
+        self.assertTrue(np.isnan(result["flow"][0]))
+        self.assertGreater(result["flow"][1], 0)
+
+    @pytest.mark.negative
+    def test_CentrifugalPump_operating_point_without_performance_curve(self):
+        pump = CentrifugalPump()
+        with pytest.raises(Exception) as exp:
+            pump.operating_point()
+        self.assertIn("Provide performance_curve of the pump to calculate operating point.", str(exp))
+
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_CentrifugalPump_head_and_power_with_series_differential_pressure(self):
+        from propylean.series import Series
+        feed = MaterialStream(tag="Pump_series_feed", pressure=(2, 'bar'), temperature=(30, 'C'),
+                              mass_flowrate=(1000, 'kg/h'))
+        feed.components = prop.Components({"water": 1})
+        pump = CentrifugalPump(tag="Pump_series")
+        pump.connect_stream(feed, 'in', stream_governed=True)
+        pressures = [1, 2, 3]
+        pump.differential_pressure = Series(pressures, prop=prop.Pressure, unit='bar', index=[10, 20, 30])
+        self.assertEqual(pump.outlet_pressure._instance.tolist(), [3, 4, 5])
+        head = pump.head
+        power = pump.power
+        self.assertEqual(head.prop, prop.Length)
+        self.assertEqual(head.unit, 'm')
+        self.assertEqual(list(head._instance.index), [10, 20, 30])
+        for i, dp in enumerate(pressures):
+            pump.differential_pressure = (dp, 'bar')
+            self.assertAlmostEqual(head._instance.iloc[i], pump.head.value, 6)
+            self.assertAlmostEqual(power._instance.iloc[i], pump.power.value, 6)
@@ -305,7 +305,7 @@ class test_ElectricHeater(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ElectricHeater()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -313,7 +313,7 @@ class test_ElectricHeater(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ElectricHeater()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -321,7 +321,7 @@ class test_ElectricHeater(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ElectricHeater()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -337,7 +337,7 @@ class test_ElectricHeater(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ElectricHeater()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -345,7 +345,7 @@ class test_ElectricHeater(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ElectricHeater()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -361,7 +361,7 @@ class test_ElectricHeater(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ElectricHeater()
             m4.temperature_increase = []
-        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                                      
 
     @pytest.mark.negative
@@ -346,6 +346,76 @@ class test_PipeSegment(unittest.TestCase):
         # TODO Change assert for better accuracy of pressure drop calculations
         self.assertGreater(ps.pressure_drop.value, 0)
     
+    @pytest.mark.positive
+    @pytest.mark.segment_frame
+    def test_PipeSegment_pressure_drop_profile_segment_frame(self):
+        segment_frame = pd.DataFrame({'segment_type': [1, 2, 1],
+                                      'ID': [(34.7675, 'cm'), prop.Length(347.675, 'mm'), 0.347675],
+                                      'length': [(20, 'm'), None, (10, 'm')],
+                                      'material': [2, 2, 2],
+                                      'elevation': [(10, 'm'), None, None]})
+        ps = PipeSegment(segment_frame=segment_frame)
+        inlet_stream = MaterialStream(mass_flowrate=(100000, 'kg/min'),
+                                      pressure=(100, 'bar'),
+                                      temperature=(40, 'C'))
+        inlet_stream.components = prop.Components({"water": 1})
+        ps.connect_stream(inlet_stream, 'in', stream_governed=True)
+        segment_count = len(PipeSegment.items)
+        profile = ps.pressure_drop_profile()
+        self.assertEqual(len(PipeSegment.items), segment_count)
+        self.assertEqual(len(profile), 3)
+        self.assertEqual(profile["Re"].nunique(), 1)
+        self.assertAlmostEqual(profile["equivalent_length"][1], 13 * 0.347675)
+        self.assertAlmostEqual(profile["dp_friction"][0], 2 * profile["dp_friction"][2])
+        self.assertAlmostEqual(profile["cumulative_pressure_drop"].iloc[-1],
+                               profile["pressure_drop"].sum())
+        self.assertAlmostEqual(profile["outlet_pressure"].iloc[-1],
+                               100e5 - profile["pressure_drop"].sum())
+        self.assertAlmostEqual(ps.pressure_drop.to_unit('Pa').value,
+                               profile["pressure_drop"].sum())
+        self.assertEqual(len(PipeSegment.items), segment_count)
+
+        single = PipeSegment(ID=(347.675, "mm"), length=(20, 'm'), material=2, elevation=(10, 'm'))
+        single_stream = MaterialStream(mass_flowrate=(100000, 'kg/min'),
+                                       pressure=(100, 'bar'),
+                                       temperature=(40, 'C'))
+        single_stream.components = prop.Components({"water": 1})
+        single.connect_stream(single_stream, 'in', stream_governed=True)
+        self.assertAlmostEqual(single.pressure_drop.to_unit('Pa').value,
+                               profile["pressure_drop"][0], 2)
+
+    @pytest.mark.positive
+    def test_PipeSegment_dp_friction_flowrate_sweep(self):
+        from propylean import PropertyArray
+        from propylean.series import Series
+        ps = PipeSegment(ID=(100, "mm"), length=(50, 'm'))
+        ps.inlet_pressure = (10, 'bar')
+        args = (prop.Length(0.1), prop.Length(50), prop.Density(1000), prop.DViscosity(0.001))
+        flows = [0.001, 0.01, 0.02]
+        drops = ps.dp_friction(Series(flows, prop=prop.VolumetricFlowRate), *args)
+        self.assertEqual(drops.prop, prop.Pressure)
+        self.assertEqual(drops.unit, 'bar')
+        array_drops = ps.dp_friction(PropertyArray(flows, prop.VolumetricFlowRate), *args)
+        self.assertIsInstance(array_drops, PropertyArray)
+        for i, flow in enumerate(flows):
+            drop = ps.dp_friction(prop.VolumetricFlowRate(flow), *args)
+            self.assertAlmostEqual(drops.iloc[i], drop.value, 6)
+            self.assertAlmostEqual(array_drops[i].value, drop.value, 6)
+
+    @pytest.mark.negative
+    @pytest.mark.segment_frame
+    def test_PipeSegment_segment_frame_straight_tube_without_length(self):
+        segment_frame = pd.DataFrame({'segment_type': [1, 2],
+                                      'ID': [(20, 'cm'), (20, 'cm')]})
+        ps = PipeSegment(segment_frame=segment_frame)
+        inlet_stream = MaterialStream(mass_flowrate=(1000, 'kg/h'),
+                                      pressure=(10, 'bar'),
+                                      temperature=(40, 'C'))
+        inlet_stream.components = prop.Components({"water": 1})
+        with pytest.raises(Exception) as exp:
+            ps.connect_stream(inlet_stream, 'in', stream_governed=True)
+        self.assertIn('Straight Tube segment requires "length" value.', str(exp))
+
     @pytest.mark.positive
     def test_PipeSegment_pressure_drop_others(self):
         for i in range(2, 12):
@@ -390,7 +460,7 @@ class test_PipeSegment(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PipeSegment(segment_type=13, ID=(18, 'mm'), shape=(20, 18))
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -398,7 +468,7 @@ class test_PipeSegment(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PipeSegment(segment_type=13, ID=(18, 'mm'), shape=(20, 18))
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
                             
@@ -415,7 +485,7 @@ class test_PipeSegment(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PipeSegment(segment_type=13, ID=(18, 'mm'), shape=(20, 18))
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -423,7 +493,7 @@ class test_PipeSegment(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PipeSegment(segment_type=13, ID=(18, 'mm'), shape=(20, 18))
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -439,7 +509,7 @@ class test_PipeSegment(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PipeSegment(segment_type=13, ID=(18, 'mm'), shape=(20, 18))
             m4.temperature_increase = []
-        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                                      
 
     @pytest.mark.negative
@@ -51,7 +51,7 @@ class test_PositiveDisplacementPump(unittest.TestCase):
         performance_curve = pd.DataFrame([{'flow':[2,10,30,67], 'head':[45,20,10,2]}])
         pump = PositiveDisplacementPump(tag="PDPump_4",
                                performance_curve=performance_curve)
-        self.assertEqual(pump.performace_curve.shape, performance_curve.shape)
+        self.assertEqual(pump.performance_curve.shape, performance_curve.shape)
     
     @pytest.mark.positive
     def test_PositiveDisplacementPump_representation(self):
@@ -328,7 +328,7 @@ class test_PositiveDisplacementPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PositiveDisplacementPump()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -336,7 +336,7 @@ class test_PositiveDisplacementPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PositiveDisplacementPump()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -344,7 +344,7 @@ class test_PositiveDisplacementPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PositiveDisplacementPump()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -360,7 +360,7 @@ class test_PositiveDisplacementPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PositiveDisplacementPump()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -368,7 +368,7 @@ class test_PositiveDisplacementPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PositiveDisplacementPump()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -384,7 +384,7 @@ class test_PositiveDisplacementPump(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = PositiveDisplacementPump()
             m4.temperature_increase = []
-        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                                      
 
     @pytest.mark.negative
@@ -64,7 +64,7 @@ class test_TurboExpander(unittest.TestCase):
         performance_curve = pd.DataFrame([{'flow':[2,10,30,67], 'head':[45,20,10,2]}])
         expander = TurboExpander(tag="expander_4",
                                             performance_curve=performance_curve)
-        self.assertEqual(expander.performace_curve.shape, performance_curve.shape)
+        self.assertEqual(expander.performance_curve.shape, performance_curve.shape)
     
     @pytest.mark.positive
     def test_TurboExpander_representation(self):
@@ -359,7 +359,7 @@ class test_TurboExpander(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = TurboExpander()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -367,7 +367,7 @@ class test_TurboExpander(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = TurboExpander()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -375,7 +375,7 @@ class test_TurboExpander(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = TurboExpander()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -391,7 +391,7 @@ class test_TurboExpander(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = TurboExpander()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -399,7 +399,7 @@ class test_TurboExpander(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = TurboExpander()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
                                                      
     @pytest.mark.negative
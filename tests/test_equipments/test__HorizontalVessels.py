@@ -330,6 +330,30 @@ class test__HorizontalVessels(unittest.TestCase):
         self.assertEqual(calculated_liq_volume.unit,
                                expected_liquid_volume.unit)       
     
+    @pytest.mark.positive
+    @pytest.mark.get_inventory
+    @pytest.mark.time_series
+    def test__HorizontalVessels_get_inventory_series_liquid_level(self):
+        from propylean.series import Series
+        from propylean.properties import PropertyArray
+        horizontal_vessel = _HorizontalVessels(tag="horizontal_vessel_series",
+                                               ID=(4, "m"), length=(10, "m"),
+                                               head_type="elliptical")
+        horizontal_vessel.main_fluid = "liquid"
+        levels = [80, 180, 300]
+        horizontal_vessel.liquid_level = Series(levels, prop=prop.Length, unit="cm", index=["a", "b", "c"])
+        volumes = horizontal_vessel.get_inventory()
+        self.assertEqual(volumes.unit, "m^3")
+        self.assertEqual(list(volumes._instance.index), ["a", "b", "c"])
+        horizontal_vessel.liquid_level = PropertyArray(levels, prop.Length, "cm")
+        array_volumes = horizontal_vessel.get_inventory()
+        for i, level in enumerate(levels):
+            horizontal_vessel.liquid_level = (level, "cm")
+            expected = horizontal_vessel.get_inventory().value
+            self.assertAlmostEqual(volumes._instance.iloc[i], expected, 6)
+            self.assertAlmostEqual(array_volumes[i].value, expected, 6)
+        self.assertAlmostEqual(volumes._instance.iloc[1], 61.97, 2)
+
     @pytest.mark.positive
     @pytest.mark.vessel_volume
     def test__HorizontalVessels_volume_calculations_torispherical(self):
@@ -431,7 +455,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -439,7 +463,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -447,7 +471,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -463,7 +487,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -471,7 +495,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -487,7 +511,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.temperature_increase = []
-        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                                      
 
     @pytest.mark.negative
@@ -630,7 +654,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.operating_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'operating_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'operating_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))  
 
     @pytest.mark.negative
@@ -638,7 +662,7 @@ class test__HorizontalVessels(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = _HorizontalVessels()
             m4.operating_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'operating_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'operating_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -0,0 +1,119 @@
+import pytest
+import unittest
+from propylean import Flowsheet, CentrifugalPump, MaterialStream, ControlValve
+import numpy as np
+import propylean.properties as prop
+
+class test_Flowsheet(unittest.TestCase):
+    def _pumps_in_series(self):
+        feed = MaterialStream(pressure=(2, 'bar'), temperature=(30, 'C'),
+                              mass_flowrate=(1000, 'kg/h'))
+        middle = MaterialStream()
+        product = MaterialStream()
+        pump_1 = CentrifugalPump(differential_pressure=(5, 'bar'))
+        pump_2 = CentrifugalPump(differential_pressure=(3, 'bar'))
+        return feed, middle, product, pump_1, pump_2
+
+    @pytest.mark.positive
+    def test_Flowsheet_deferred_propagation_solves_in_order(self):
+        feed, middle, product, pump_1, pump_2 = self._pumps_in_series()
+        flowsheet = Flowsheet(equipments=[pump_1, pump_2])
+        with flowsheet.deferred_propagation():
+            # Connected in reverse order on purpose.
+            pump_2.connect_stream(product, direction="out")
+            pump_2.connect_stream(middle, direction="in")
+            pump_1.connect_stream(middle, direction="out")
+            pump_1.connect_stream(feed, direction="in")
+            self.assertEqual(pump_1.inlet_pressure, prop.Pressure())
+        self.assertEqual(flowsheet.topological_order(), [pump_1, pump_2])
+        self.assertEqual(flowsheet.downstream(pump_1), [pump_2])
+        self.assertEqual(flowsheet.upstream(pump_2), [pump_1])
+        self.assertAlmostEqual(pump_1.outlet_pressure.to_unit('bar').value, 7)
+        self.assertAlmostEqual(middle.pressure.to_unit('bar').value, 7)
+        self.assertAlmostEqual(pump_2.inlet_pressure.to_unit('bar').value, 7)
+        self.assertAlmostEqual(product.pressure.to_unit('bar').value, 10)
+        self.assertEqual(product.mass_flowrate, feed.mass_flowrate)
+
+    @pytest.mark.positive
+    def test_Flowsheet_solve_after_change(self):
+        feed, middle, product, pump_1, pump_2 = self._pumps_in_series()
+        flowsheet = Flowsheet(equipments=[pump_1, pump_2])
+        with flowsheet.deferred_propagation():
+            pump_1.connect_stream(feed, direction="in")
+            pump_1.connect_stream(middle, direction="out")
+            pump_2.connect_stream(middle, direction="in")
+            pump_2.connect_stream(product, direction="out")
+        feed.pressure = (4, 'bar')
+        self.assertEqual(flowsheet.solve(), [pump_1, pump_2])
+        self.assertAlmostEqual(product.pressure.to_unit('bar').value, 12)
+
+    @pytest.mark.negative
+    def test_Flowsheet_cycle(self):
+        s1 = MaterialStream()
+        s2 = MaterialStream()
+        pump_1 = CentrifugalPump()
+        pump_2 = CentrifugalPump()
+        pump_1.connect_stream(s1, direction="out")
+        pump_2.connect_stream(s1, direction="in")
+        pump_2.connect_stream(s2, direction="out")
+        pump_1.connect_stream(s2, direction="in")
+        flowsheet = Flowsheet(equipments=[pump_1, pump_2])
+        with pytest.raises(Exception) as exp:
+            flowsheet.topological_order()
+        self.assertIn("Flowsheet has a cycle between equipments", str(exp))
+
+    @pytest.mark.negative
+    def test_Flowsheet_incorrect_type_to_equipments(self):
+        with pytest.raises(Exception) as exp:
+            Flowsheet(equipments=[MaterialStream()])
+        self.assertIn("Incorrect type 'MaterialStream' provided to 'equipments'.", str(exp))
+
+
+    def _recycle_loop(self, valve_pressure_drop):
+        s1 = MaterialStream(pressure=(5, 'bar'), temperature=(30, 'C'),
+                            mass_flowrate=(1000, 'kg/h'))
+        s2 = MaterialStream(pressure=(5, 'bar'), temperature=(30, 'C'),
+                            mass_flowrate=(1000, 'kg/h'))
+        pump = CentrifugalPump(differential_pressure=(3, 'bar'))
+        valve = ControlValve(pressure_drop=valve_pressure_drop)
+        flowsheet = Flowsheet(equipments=[pump, valve])
+        with flowsheet.deferred_propagation():
+            pump.connect_stream(s2, direction="in")
+            pump.connect_stream(s1, direction="out", stream_governed=False)
+            valve.connect_stream(s1, direction="in")
+            valve.connect_stream(s2, direction="out", stream_governed=False)
+        return flowsheet, s1, s2
+
+    @pytest.mark.positive
+    def test_Flowsheet_solve_recycles(self):
+        flowsheet, s1, s2 = self._recycle_loop((3, 'bar'))
+        self.assertEqual(len(flowsheet.tear_streams()), 1)
+        report = flowsheet.solve_recycles(method="Wegstein", tolerances={"pressure": 1e-9})
+        self.assertEqual(list(report.columns),
+                         ["iteration", "mass_flowrate", "pressure", "temperature", "time"])
+        self.assertLessEqual(len(report), 3)
+        self.assertLessEqual(report["pressure"].iloc[-1], 1e-9)
+        self.assertAlmostEqual((s1.pressure - s2.pressure).to_unit('bar').value, 3)
+        self.assertAlmostEqual(s1.mass_flowrate.to_unit('kg/h').value, 1000)
+
+    @pytest.mark.negative
+    def test_Flowsheet_solve_recycles_not_converged(self):
+        flowsheet, s1, s2 = self._recycle_loop((2, 'bar'))
+        with pytest.warns(UserWarning, match="Recycles not converged in 5 iterations."):
+            report = flowsheet.solve_recycles(method="direct", max_iterations=5)
+        self.assertEqual(len(report), 5)
+        self.assertGreater(report["pressure"].iloc[-1], 1e-6)
+        with pytest.raises(Exception) as exp:
+            flowsheet.solve_recycles(method="Newton")
+        self.assertIn("Method 'Newton' not supported.", str(exp))
+
+    @pytest.mark.positive
+    def test_Flowsheet_recycle_accelerators(self):
+        from propylean.flowsheet import _Wegstein, _Broyden
+        for accelerator, g in [(_Wegstein(), lambda x: 0.5 * x + 1),
+                               (_Broyden(), lambda x: 0.5 * x + 1),
+                               (_Broyden(), lambda x: 2 * x - 1)]:
+            x = np.array([10.0])
+            for _ in range(3):
+                x = accelerator.step(x, g(x))
+            self.assertAlmostEqual(x[0], g(x)[0], 9)
@@ -0,0 +1,50 @@
+import pytest
+import unittest
+import numpy as np
+from fluids import friction as fluids_friction
+from propylean.friction import friction_factor, Clamond, Colebrook, Haaland
+from propylean.settings import Settings
+
+class test_friction(unittest.TestCase):
+    Re = np.logspace(np.log10(2500), 8, 40)
+    eD = np.array([0, 1e-6, 1e-4, 1e-2, 5e-2])
+
+    @pytest.mark.positive
+    def test_friction_methods_against_fluids(self):
+        Re, eD = np.meshgrid(self.Re, self.eD)
+        Re, eD = Re.ravel(), eD.ravel()
+        for method, function in [("Clamond", Clamond), ("Colebrook", Colebrook),
+                                 ("Haaland", Haaland)]:
+            expected = np.array([fluids_friction.friction_factor(Re=r, eD=e, Method=method)
+                                 for r, e in zip(Re, eD)])
+            np.testing.assert_allclose(function(Re, eD), expected, rtol=1e-9)
+            np.testing.assert_allclose(friction_factor(Re, eD, method=method),
+                                       expected, rtol=1e-9)
+
+    @pytest.mark.positive
+    def test_friction_laminar_and_scalar(self):
+        fd = friction_factor(Re=[1000, 1e5], eD=1e-4, method="Clamond")
+        self.assertAlmostEqual(fd[0], 0.064)
+        self.assertAlmostEqual(fd[1], fluids_friction.Clamond(1e5, 1e-4), 12)
+        fd = friction_factor(1e5, 1e-4, method="Colebrook")
+        self.assertIsInstance(fd, float)
+        self.assertAlmostEqual(fd, fluids_friction.Colebrook(1e5, 1e-4), 12)
+        self.assertAlmostEqual(friction_factor(1e5, method="laminar"), 64e-5)
+
+    @pytest.mark.positive
+    def test_friction_Darcy_Fanning_and_settings(self):
+        darcy = friction_factor(1e5, 1e-4, method="Haaland", Darcy=True)
+        fanning = friction_factor(1e5, 1e-4, method="Haaland", Darcy=False)
+        self.assertAlmostEqual(darcy, 4 * fanning)
+        old_method = Settings.pipe_dp_method
+        try:
+            Settings.pipe_dp_method = "Haaland"
+            self.assertEqual(friction_factor(1e5, 1e-4, Darcy=True), darcy)
+        finally:
+            Settings.pipe_dp_method = old_method
+
+    @pytest.mark.negative
+    def test_friction_incorrect_method(self):
+        with pytest.raises(Exception) as exp:
+            friction_factor(1e5, 1e-4, method="Moody")
+        self.assertIn("Friction factor method 'Moody' not supported.", str(exp))
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import pytest
+import unittest
+import numpy as np
+import pandas as pd
+from propylean import Model
+from propylean.equipments.storages import Bullet
+from propylean.historian import read_historian, calculate_chunks
+from propylean.series import Series
+import propylean.properties as prop
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "Models", "LPG_bullet_data.csv")
+COLUMNS = {"liquid_level": ("liquid_level(cm)", prop.Length, "cm"),
+           "operating_pressure": ("operating_press(bar)", prop.Pressure, "bar"),
+           "operating_temperature": ("operating_temp(C)", prop.Temperature, "C")}
+
+class test_historian(unittest.TestCase):
+    def setUp(self):
+        self.model = Model()
+        self.model.__enter__()
+        self.bullet = Bullet(tag="LPG-Bullet", ID=(3.5, "m"), length=(36, "m"), liquid_level=(1, "m"))
+
+    def tearDown(self):
+        self.model.__exit__(None, None, None)
+
+    @pytest.mark.positive
+    def test_read_historian_csv_in_chunks(self):
+        chunks = list(read_historian(DATA_PATH, COLUMNS, chunksize=1000, sep=";", index_col="time(s)"))
+        self.assertEqual([len(chunk["liquid_level"]._instance) for chunk in chunks], [1000, 1000, 500])
+        level = chunks[1]["liquid_level"]
+        self.assertIsInstance(level, Series)
+        self.assertEqual(level.prop, prop.Length)
+        self.assertEqual(level.unit, "cm")
+        self.assertEqual(chunks[2]["operating_pressure"].unit, "bar")
+
+    @pytest.mark.positive
+    def test_calculate_chunks_matches_full_series(self):
+        full = pd.read_csv(DATA_PATH, sep=";", index_col="time(s)")
+        bullet = self.bullet
+        bullet.liquid_level = Series(full["liquid_level(cm)"], prop=prop.Length, unit="cm")
+        expected = bullet.get_inventory()._instance.to_numpy()
+        bullet.liquid_level = (1, "m")
+        chunks = read_historian(DATA_PATH, COLUMNS, chunksize=700, sep=";", index_col="time(s)")
+        results = list(calculate_chunks(bullet, chunks, "get_inventory"))
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0].unit, "m^3")
+        calculated = np.concatenate([result._instance.to_numpy() for result in results])
+        np.testing.assert_allclose(calculated, expected)
+        self.assertEqual(bullet.liquid_level.value, 1)
+        self.assertEqual(bullet.liquid_level.unit, "m")
+
+    @pytest.mark.positive
+    def test_read_historian_parquet(self):
+        pytest.importorskip("pyarrow")
+        frame = pd.read_csv(DATA_PATH, sep=";", index_col=0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bullet.parquet")
+            frame.to_parquet(path)
+            results = calculate_chunks(self.bullet,
+                                       read_historian(path, COLUMNS, chunksize=1000),
+                                       lambda bullet: bullet.get_inventory().max())
+            self.assertEqual(len(list(results)), 3)
+
+    @pytest.mark.negative
+    def test_read_historian_incorrect_arguments(self):
+        with pytest.raises(Exception) as exp:
+            next(read_historian(DATA_PATH, COLUMNS, chunksize=0, sep=";"))
+        self.assertIn("positive", str(exp))
+        with pytest.raises(Exception) as exp:
+            next(read_historian(DATA_PATH, COLUMNS, sep=";", file_format="xlsx"))
+        self.assertIn("file_format", str(exp))
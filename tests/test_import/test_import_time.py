@@ -0,0 +1,46 @@
+import sys
+import json
+import subprocess
+import pytest
+import unittest
+
+# Modules loaded only on first use of Spark Series, property packages,
+# compressor or control valve calculations and pipe networks.
+DEFERRED_MODULES = ["pyspark", "thermo", "fluids", "scipy", "multiprocessing"]
+
+def run_python(code):
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+class test_import_time(unittest.TestCase):
+    @pytest.mark.positive
+    def test_import_does_not_load_deferred_modules(self):
+        loaded = run_python("import sys, json, propylean; "
+                            "print(json.dumps(sorted({m.split('.')[0] for m in sys.modules})))")
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, loaded)
+
+    @pytest.mark.positive
+    def test_lazy_attributes_load_on_first_use(self):
+        loaded = run_python("import sys, json, propylean; "
+                            "propylean.PipeNetwork; propylean.Flowsheet; propylean.load_many; "
+                            "print(json.dumps(['scipy' in sys.modules, 'PipeNetwork' in dir(propylean)]))")
+        self.assertEqual(loaded, [False, True])
+        import propylean
+        from propylean.network import PipeNetwork
+        self.assertIs(propylean.PipeNetwork, PipeNetwork)
+        from propylean import Series
+        from propylean.series import Series as SeriesClass
+        self.assertIs(Series, SeriesClass)
+        with pytest.raises(AttributeError):
+            propylean.NotAnAttribute
+
+    @pytest.mark.positive
+    def test_import_time_benchmark(self):
+        # Time of importing propylean after pandas and numpy, which it needs anyway.
+        # Best of three runs to be less sensitive to load on the machine.
+        code = ("import time, json; import pandas; start = time.perf_counter(); "
+                "import propylean; print(json.dumps(time.perf_counter() - start))")
+        seconds = min(run_python(code) for _ in range(3))
+        self.assertLess(seconds, 0.3)
@@ -269,7 +269,7 @@ class test_ControlValve(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ControlValve()
             m4.inlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -277,7 +277,7 @@ class test_ControlValve(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ControlValve()
             m4.outlet_pressure = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_pressure'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -285,7 +285,7 @@ class test_ControlValve(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ControlValve()
             m4.pressure_drop = []
-        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'pressure_drop'. Can be any one from '('Pressure', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                    
 
     @pytest.mark.negative
@@ -301,7 +301,7 @@ class test_ControlValve(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ControlValve()
             m4.inlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'inlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))
 
     @pytest.mark.negative
@@ -309,7 +309,7 @@ class test_ControlValve(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ControlValve()
             m4.outlet_temperature = []
-        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'outlet_temperature'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp)) 
 
     @pytest.mark.negative
@@ -325,7 +325,7 @@ class test_ControlValve(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = ControlValve()
             m4.temperature_increase = []
-        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series')'",
+        self.assertIn("Incorrect type 'list' provided to 'temperature_increase'. Can be any one from '('Temperature', 'int', 'float', 'tuple', 'Series', 'PropertyArray')'",
                       str(exp))                                                      
 
     @pytest.mark.negative
@@ -441,4 +441,44 @@ class test_ControlValve(unittest.TestCase):
         print(cv)
         cv.delete()
         with pytest.raises(Exception) as exp:
-            print(cv)        
\ No newline at end of file
+            print(cv)
+
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_ControlValve_Cv_with_series_pressure_drop(self):
+        from propylean.series import Series
+        inlet = MaterialStream(tag="cv_series_inlet", pressure=(10, 'bar'), temperature=(30, 'C'),
+                               mass_flowrate=(1000, 'kg/h'))
+        inlet.components = prop.Components({"water": 1})
+        cv = ControlValve(tag="cv_series")
+        cv.connect_stream(inlet, 'in', stream_governed=True)
+        drops = [0.5, 1, 2]
+        cv.pressure_drop = Series(drops, prop=prop.Pressure, unit='bar')
+        Cv = cv.Cv
+        self.assertEqual(Cv.prop, prop.Dimensionless)
+        for i, drop in enumerate(drops):
+            cv.pressure_drop = (drop, 'bar')
+            self.assertAlmostEqual(Cv._instance.iloc[i], cv.Cv, 6)
+
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_ControlValve_Cv_with_series_inlet_stream(self):
+        from propylean.series import Series
+        inlet = MaterialStream(tag="cv_batch_inlet", temperature=(150, 'C'),
+                               mass_flowrate=(1000, 'kg/h'))
+        pressures = [10, 8, 1]
+        inlet.pressure = Series(pressures, prop=prop.Pressure, unit='bar')
+        inlet.components = prop.Components({"water": 1})
+        self.assertEqual(list(inlet.phase), ['l', 'l', 'g'])
+        cv = ControlValve(tag="cv_batch", pressure_drop=(0.5, 'bar'))
+        cv.connect_stream(inlet, 'in', stream_governed=True)
+        Cv = cv.Cv
+        self.assertIsInstance(Cv, Series)
+        self.assertEqual(Cv.prop, prop.Dimensionless)
+        for i, pressure in enumerate(pressures):
+            row_inlet = MaterialStream(tag="cv_row_inlet_{}".format(i), pressure=(pressure, 'bar'),
+                                       temperature=(150, 'C'), mass_flowrate=(1000, 'kg/h'))
+            row_inlet.components = prop.Components({"water": 1})
+            row_cv = ControlValve(tag="cv_row_{}".format(i), pressure_drop=(0.5, 'bar'))
+            row_cv.connect_stream(row_inlet, 'in', stream_governed=True)
+            self.assertAlmostEqual(Cv._instance.iloc[i], row_cv.Cv, 6)
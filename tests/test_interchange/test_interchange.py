@@ -0,0 +1,100 @@
+import json
+import pytest
+import unittest
+import pandas as pd
+from propylean import Model, MaterialStream, EnergyStream, PipeSegment, CentrifugalPump, load_many
+from propylean.equipments import static, exchangers, separators, rotary, storages
+from propylean.instruments import safety, control, measurement
+from propylean.equipments.abstract_equipment_classes import _material_stream_equipment_map as mse_map
+from propylean.equipments.abstract_equipment_classes import _energy_stream_equipment_map as ese_map
+import propylean.properties as prop
+
+CLASSES = [static.Filters, static.Strainers, exchangers.AirCooler,
+           exchangers.ElectricHeater, exchangers.ShellnTubeExchanger,
+           separators.Column, separators.FlareKOD, separators.HorizontalSeparator,
+           separators.VerticalSeparator, rotary.CentrifugalCompressor,
+           rotary.CentrifugalPump, rotary.PositiveDisplacementPump,
+           rotary.TurboExpander, storages.Bullet, storages.HotOilExpansionVessel,
+           storages.Sphere, storages.Tank, storages.VerticalStorage,
+           safety.PressureSafetyValve, control.ControlValve,
+           measurement.FlowMeter, measurement.PressureGuage,
+           measurement.TemperatureGuage]
+
+def build_objects():
+    objects = [cls(tag="T-" + cls.__name__) for cls in CLASSES]
+    feed = MaterialStream(tag="Feed", pressure=(2, 'bar'), temperature=(30, 'C'),
+                          mass_flowrate=(1000, 'kg/h'))
+    feed.components = prop.Components({"water": 1})
+    discharge = MaterialStream(tag="Discharge")
+    power = EnergyStream(tag="Power", amount=(5, 'kW'))
+    pump = CentrifugalPump(tag="P-1", differential_pressure=(3, 'bar'))
+    pump.performance_curve = pd.DataFrame({"flow": [0.0, 5.0, 10.0], "head": [40.0, 35.0, 20.0]})
+    pump.connect_stream(feed, direction="in")
+    pump.connect_stream(discharge, direction="out", stream_governed=False)
+    pump.connect_stream(power, direction="in", stream_type="energy")
+    segments = pd.DataFrame({"segment_type": [1, 2], "ID": [(2, 'inch'), (2, 'inch')],
+                             "length": [(10, 'm'), None], "material": [2, 2]})
+    pipe = PipeSegment(tag="L-1", segment_frame=segments)
+    pipe.connect_stream(discharge, direction="in")
+    return objects + [pump, pipe, feed, discharge, power]
+
+def connections_by_tag():
+    """Stream-equipment maps with tags instead of handles, which differ after loading."""
+    tags = {}
+    for stream_map, stream_cls in [(mse_map, MaterialStream), (ese_map, EnergyStream)]:
+        for handle, (from_index, from_type, to_index, to_type) in stream_map.items():
+            tags[stream_cls.items[handle].tag] = (
+                None if from_type is None else from_type.items[from_index].tag,
+                None if to_type is None else to_type.items[to_index].tag)
+    return tags
+
+class test_interchange(unittest.TestCase):
+    @pytest.mark.positive
+    def test_to_dict_from_dict_all_classes(self):
+        with Model():
+            objects = build_objects()
+            records = json.loads(json.dumps([obj.to_dict() for obj in objects]))
+            connections = connections_by_tag()
+            performance_curve = CentrifugalPump.items.get_by_tag("P-1").performance_curve
+        with Model():
+            loaded = load_many(list(reversed(records)))[::-1]
+            for obj, loaded_obj, record in zip(objects, loaded, records):
+                self.assertIs(type(obj), type(loaded_obj))
+                self.assertEqual(loaded_obj.to_dict(), record)
+            self.assertEqual(connections_by_tag(), connections)
+            pump = CentrifugalPump.items.get_by_tag("P-1")
+            self.assertAlmostEqual(pump.outlet_pressure.to_unit('bar').value, 5)
+            pd.testing.assert_frame_equal(pump.performance_curve, performance_curve)
+            pipe = PipeSegment.items.get_by_tag("L-1")
+            self.assertEqual(pipe.get_stream_tag("m", "in"), "Discharge")
+            self.assertEqual(len(pipe.pressure_drop_profile()), 2)
+
+    @pytest.mark.positive
+    def test_from_dict_single_object(self):
+        with Model():
+            stream = MaterialStream(tag="S-1", pressure=(3, 'bar'))
+            data = stream.to_dict()
+        with Model():
+            loaded = MaterialStream.from_dict(data)
+            self.assertEqual(loaded.pressure, prop.Pressure(3, 'bar'))
+            self.assertIs(MaterialStream.items.get_by_tag("S-1"), loaded)
+            self.assertEqual(MaterialStream(tag=None).tag, "MaterialStream_1")
+
+    @pytest.mark.negative
+    def test_load_many_errors(self):
+        with Model():
+            data = MaterialStream(tag="S-1").to_dict()
+            with pytest.raises(Exception, match="Tag already assinged!"):
+                MaterialStream.from_dict(data)
+            with pytest.raises(Exception, match="cannot be loaded as"):
+                EnergyStream.from_dict(data)
+        with Model():
+            wrong_unit = dict(data, pressure={"property": "Pressure", "value": 1, "unit": "xyz"})
+            with pytest.raises(Exception):
+                MaterialStream.from_dict(wrong_unit)
+            with pytest.raises(Exception, match="Class 'Reactor' not supported"):
+                load_many([dict(data, **{"class": "Reactor"})])
+            pump = dict(CentrifugalPump(tag="P-9").to_dict(), tag="P-10",
+                        connections={"inlet_material_stream": "Missing"})
+            with pytest.raises(Exception, match="Stream 'Missing' connected to 'P-10' not found."):
+                load_many([pump])
@@ -0,0 +1,114 @@
+import pytest
+import unittest
+from threading import Thread
+from propylean import Model, CentrifugalPump, MaterialStream
+from propylean.properties import Components
+from propylean.equipments.abstract_equipment_classes import _material_stream_equipment_map as mse_map
+
+def build_model(dp):
+    model = Model()
+    with model:
+        feed = MaterialStream(tag="Feed", pressure=(2, 'bar'), temperature=(30, 'C'),
+                              mass_flowrate=(1000, 'kg/h'))
+        feed.components = Components({"water": 1})
+        pump = CentrifugalPump(tag="P-1", differential_pressure=(dp, 'bar'))
+        pump.connect_stream(feed, direction="in")
+    return model
+
+class test_Model(unittest.TestCase):
+    @pytest.mark.positive
+    def test_Model_same_tags_in_different_models(self):
+        default_pumps = len(CentrifugalPump.items)
+        model_1 = build_model(1)
+        model_2 = build_model(4)
+        self.assertEqual(len(CentrifugalPump.items), default_pumps)
+        self.assertIsNone(CentrifugalPump.items.get_by_tag("P-1"))
+        for model, outlet in [(model_1, 3), (model_2, 6)]:
+            with model:
+                self.assertIs(Model.current(), model)
+                self.assertEqual(len(CentrifugalPump.items), 1)
+                self.assertEqual(len(MaterialStream.items), 1)
+                self.assertEqual(len(mse_map), 1)
+                pump = CentrifugalPump.items.get_by_tag("P-1")
+                self.assertAlmostEqual(pump.outlet_pressure.to_unit('bar').value, outlet)
+        self.assertIs(Model.current(), Model.default())
+
+    @pytest.mark.positive
+    def test_Model_registry_contains(self):
+        model_1 = build_model(1)
+        model_2 = build_model(1)
+        with model_1:
+            pump = CentrifugalPump.items.get_by_tag("P-1")
+            self.assertIn(pump, CentrifugalPump.items)
+            self.assertNotIn(MaterialStream.items.get_by_tag("Feed"), CentrifugalPump.items)
+            self.assertNotIn("P-1", CentrifugalPump.items)
+        with model_2:
+            self.assertNotIn(pump, CentrifugalPump.items)
+        with model_1:
+            pump.delete()
+            self.assertNotIn(pump, CentrifugalPump.items)
+
+    @pytest.mark.negative
+    def test_Model_object_outside_its_model(self):
+        model_1 = build_model(1)
+        model_2 = build_model(4)
+        with model_1:
+            pump_1 = CentrifugalPump.items.get_by_tag("P-1")
+        with model_2:
+            pump_2 = CentrifugalPump.items.get_by_tag("P-1")
+            # Same handle in both models.
+            self.assertEqual(pump_1.index, pump_2.index)
+            with pytest.raises(Exception) as exp:
+                pump_1.differential_pressure
+            self.assertIn("belongs to another model", str(exp.value))
+            with pytest.raises(Exception) as exp:
+                pump_1.differential_pressure = (3, 'bar')
+            self.assertIn("belongs to another model", str(exp.value))
+            self.assertAlmostEqual(pump_2.differential_pressure.to_unit('bar').value, 4)
+            self.assertAlmostEqual(pump_2.outlet_pressure.to_unit('bar').value, 6)
+        with pytest.raises(Exception):
+            pump_1.differential_pressure = (3, 'bar')
+        with model_1:
+            self.assertAlmostEqual(pump_1.differential_pressure.to_unit('bar').value, 1)
+            pump_1.differential_pressure = (3, 'bar')
+            self.assertAlmostEqual(pump_1.outlet_pressure.to_unit('bar').value, 5)
+        with model_2:
+            self.assertAlmostEqual(pump_2.differential_pressure.to_unit('bar').value, 4)
+
+    @pytest.mark.positive
+    def test_Model_clone(self):
+        model = build_model(1)
+        clone = model.clone()
+        with clone:
+            MaterialStream.items.get_by_tag("Feed").pressure = (5, 'bar')
+            pump = CentrifugalPump.items.get_by_tag("P-1")
+            # Change is propagated when derived property is read.
+            pump.head
+            self.assertAlmostEqual(pump.outlet_pressure.to_unit('bar').value, 6)
+        with model:
+            pump = CentrifugalPump.items.get_by_tag("P-1")
+            self.assertAlmostEqual(pump.inlet_pressure.to_unit('bar').value, 2)
+            self.assertAlmostEqual(pump.outlet_pressure.to_unit('bar').value, 3)
+        model.clear()
+        self.assertEqual(len(model.registry(CentrifugalPump)), 0)
+        self.assertEqual(len(clone.registry(CentrifugalPump)), 1)
+
+    @pytest.mark.positive
+    def test_Model_threads(self):
+        models = [build_model(dp) for dp in range(1, 9)]
+        results = {}
+        def evaluate(i, model):
+            with model:
+                for p in range(1, 21):
+                    MaterialStream.items.get_by_tag("Feed").pressure = (p, 'bar')
+                    pump = CentrifugalPump.items.get_by_tag("P-1")
+                    pump.head
+                    results[(i, p)] = pump.outlet_pressure.to_unit('bar').value
+        threads = [Thread(target=evaluate, args=(i, model)) for i, model in enumerate(models)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for (i, p), outlet in results.items():
+            self.assertAlmostEqual(outlet, p + i + 1)
+        self.assertEqual(len(results), 160)
@@ -0,0 +1,88 @@
+import pytest
+import unittest
+from propylean import PipeSegment, MaterialStream
+from propylean.network import PipeNetwork
+import propylean.properties as prop
+
+class test_PipeNetwork(unittest.TestCase):
+    def _water(self):
+        water = MaterialStream(pressure=(8, 'bar'), temperature=(25, 'C'),
+                               mass_flowrate=(1, 'kg/s'))
+        water.components = prop.Components({"water": 1})
+        return water
+
+    def _dp(self, pipe, flow, water):
+        density = water.density.to_unit('kg/m^3')
+        vol_flowrate = prop.VolumetricFlowRate(flow.to_unit('kg/s').value / density.value)
+        drop = pipe.dp_friction(vol_flowrate, pipe.ID.to_unit('m'),
+                                pipe.equivalent_length.to_unit('m'),
+                                density, water.d_viscosity.to_unit('Pa-s'))
+        return drop.to_unit('Pa').value + pipe.dp_hydrostatic(density).to_unit('Pa').value
+
+    @pytest.mark.positive
+    def test_PipeNetwork_loop_flow_split(self):
+        water = self._water()
+        pipe_1 = PipeSegment(ID=(150, 'mm'), length=(200, 'm'))
+        pipe_2 = PipeSegment(ID=(100, 'mm'), length=(100, 'm'), elevation=(5, 'm'))
+        pipe_3 = PipeSegment(ID=(100, 'mm'), length=(400, 'm'))
+        for pipe in [pipe_1, pipe_2, pipe_3]:
+            pipe.inlet_pressure = (8, 'bar')
+        network = PipeNetwork(connections=[(pipe_1, "header", "A"),
+                                           (pipe_2, "A", "B"),
+                                           (pipe_3, "header", "B")],
+                              pressures={"header": (8, 'bar')},
+                              demands={"B": (50, 'kg/s')},
+                              fluid=water)
+        network.solve()
+        flows = network.edge_flows
+        self.assertAlmostEqual(flows[pipe_1].value, flows[pipe_2].value, 6)
+        self.assertAlmostEqual(flows[pipe_2].value + flows[pipe_3].value, 50, 6)
+        self.assertGreater(flows[pipe_3].value, 0)
+        pressures = {node: pressure.to_unit('Pa').value
+                     for node, pressure in network.node_pressures.items()}
+        self.assertAlmostEqual(pressures["header"], 8e5)
+        self.assertAlmostEqual(pressures["header"] - pressures["A"],
+                               self._dp(pipe_1, flows[pipe_1], water), 1)
+        self.assertAlmostEqual(pressures["A"] - pressures["B"],
+                               self._dp(pipe_2, flows[pipe_2], water), 1)
+        self.assertAlmostEqual(pressures["header"] - pressures["B"],
+                               self._dp(pipe_3, flows[pipe_3], water), 1)
+
+    @pytest.mark.positive
+    def test_PipeNetwork_results_on_connected_streams(self):
+        water = self._water()
+        middle = MaterialStream(pressure=(8, 'bar'), temperature=(25, 'C'))
+        outlet = MaterialStream(pressure=(8, 'bar'), temperature=(25, 'C'))
+        middle.components = prop.Components({"water": 1})
+        outlet.components = prop.Components({"water": 1})
+        pipe_1 = PipeSegment(ID=(100, 'mm'), length=(100, 'm'))
+        pipe_2 = PipeSegment(ID=(80, 'mm'), length=(50, 'm'))
+        pipe_1.connect_stream(water, 'in', stream_governed=True)
+        pipe_1.connect_stream(middle, 'out', stream_governed=False)
+        pipe_2.connect_stream(middle, 'in', stream_governed=True)
+        pipe_2.connect_stream(outlet, 'out', stream_governed=False)
+        network = PipeNetwork(connections=[pipe_1, pipe_2],
+                              pressures={water: (8, 'bar'), outlet: (6, 'bar')})
+        network.solve()
+        flow = network.edge_flows[pipe_1]
+        self.assertAlmostEqual(flow.value, network.edge_flows[pipe_2].value, 6)
+        self.assertAlmostEqual(middle.mass_flowrate.to_unit('kg/s').value, flow.value, 6)
+        self.assertAlmostEqual(outlet.mass_flowrate.to_unit('kg/s').value, flow.value, 6)
+        self.assertAlmostEqual(middle.pressure.to_unit('Pa').value,
+                               8e5 - self._dp(pipe_1, flow, water), 0)
+        self.assertAlmostEqual(outlet.pressure.to_unit('bar').value, 6)
+
+    @pytest.mark.negative
+    def test_PipeNetwork_without_known_pressure(self):
+        pipe = PipeSegment(ID=(100, 'mm'), length=(100, 'm'))
+        with pytest.raises(Exception) as exp:
+            PipeNetwork(connections=[(pipe, "A", "B")], pressures={}, fluid=self._water())
+        self.assertIn("Provide atleast one node with known pressure to 'pressures'.", str(exp))
+
+    @pytest.mark.negative
+    def test_PipeNetwork_unknown_node(self):
+        pipe = PipeSegment(ID=(100, 'mm'), length=(100, 'm'))
+        with pytest.raises(Exception) as exp:
+            PipeNetwork(connections=[(pipe, "A", "B")], pressures={"C": 10},
+                        fluid=self._water())
+        self.assertIn("Node 'C' provided to 'pressures' is not connected to any PipeSegment.", str(exp))
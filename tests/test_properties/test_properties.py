@@ -155,6 +155,81 @@ def test_Temperature_instantiation_conversion():
     temp = properties.Temperature(value=2000, unit='R')
     temp.unit = 'C'
     assert abs(temp.value - 837.9611) < 0.0001
+
+@pytest.mark.positive
+def test_Temperature_conversion_min_max_and_round_trip():
+    temp = properties.Temperature(value=25, unit='C', min_val=20, max_val=30)
+    temp.unit = 'F'
+    assert abs(temp.value - 77) < 1e-9
+    assert abs(temp.min_val - 68) < 1e-9
+    assert abs(temp.max_val - 86) < 1e-9
+    converted = (temp.value, temp.min_val, temp.max_val)
+    for _ in range(50):
+        for unit in ['K', 'R', 'C', 'F']:
+            temp.unit = unit
+    assert (temp.value, temp.min_val, temp.max_val) == converted
+    temp.unit = 'C'
+    assert (temp.value, temp.min_val, temp.max_val) == (25, 20, 30)
+    assert properties.Temperature._unit_conversion('C', 'K') == (1, 273.15)
+
+@pytest.mark.positive
+@pytest.mark.parametrize("value", [130, 37.3, 500.123, 100, -40.7])
+@pytest.mark.parametrize("unit", ['K', 'C', 'F', 'R'])
+def test_Temperature_round_trip_exact(value, unit):
+    for other in ['K', 'C', 'F', 'R']:
+        temp = properties.Temperature(value, unit, min_val=value - 1.1, max_val=value + 2.3)
+        temp.unit = other
+        temp.unit = unit
+        assert (temp.value, temp.min_val, temp.max_val) == (value, value - 1.1, value + 2.3)
+        assert properties.Temperature(value, unit).to_unit(other).to_unit(unit).value == value
+    temp = properties.Temperature(value, unit)
+    for other in ['K', 'C', 'F', 'R', unit]:
+        temp.unit = other
+    assert temp.value == value
+    # Changed values are converted from the new values.
+    temp.unit = 'K' if unit != 'K' else 'C'
+    temp.value = 300
+    temp.unit = unit
+    assert temp.to_unit('K' if unit != 'K' else 'C').value == pytest.approx(300, abs=1e-9)
+
+@pytest.mark.positive
+@pytest.mark.parametrize("value, unit, expected, to_unit",
+                         [(100, 'C', 212, 'F'), (212, 'F', 100, 'C'), (32, 'F', 0, 'C'),
+                          (0, 'C', 32, 'F'), (-40, 'C', -40, 'F'), (0, 'F', 459.67, 'R'),
+                          (491.67, 'R', 32, 'F'), (0, 'C', 273.15, 'K'), (300, 'K', 540, 'R')])
+def test_Temperature_exact_conversions(value, unit, expected, to_unit):
+    assert properties.Temperature(value, unit).to_unit(to_unit).value == expected
+    assert properties.Temperature(value, unit) == properties.Temperature(expected, to_unit)
+
+@pytest.mark.positive
+@pytest.mark.parametrize("unit", ['K', 'C', 'F', 'R'])
+def test_Temperature_array_round_trip(unit):
+    import numpy as np
+    from propylean.series import Series
+    values = [130, 37.3, 500.123, 100]
+    array = properties.PropertyArray(values, properties.Temperature, unit)
+    series = Series(values, prop=properties.Temperature, unit=unit)
+    for other in ['K', 'C', 'F', 'R']:
+        array = array.to_unit(other)
+        series = series.to_unit(other)
+    array = array.to_unit(unit)
+    series = series.to_unit(unit)
+    # Not rounded on conversion, so only floating point error remains.
+    np.testing.assert_allclose(array.value, values, rtol=1e-13, atol=0)
+    np.testing.assert_allclose(series._instance.to_numpy(), values, rtol=1e-13, atol=0)
+
+@pytest.mark.addition
+def test_Temperature_addition_does_not_change_operands():
+    t1 = properties.Temperature(300, 'K')
+    t2 = properties.Temperature(10, 'C')
+    t3 = t1 + t2
+    assert t1.unit == 'K' and t1.value == 300
+    assert t2.unit == 'C' and t2.value == 10
+    assert t3.unit == 'K'
+    assert abs(t3.value - 310) < 1e-9
+    k = t2.to_unit('K')
+    assert k == properties.Temperature(283.15, 'K')
+    assert t2.unit == 'C'
    
 @pytest.mark.negative
 def test_Temperature_incorrect_instantiation_conversion():
@@ -599,4 +674,75 @@ def test_Dimensionless_setting_unit():
         l = properties.Dimensionless(name="Reynolds Number")
         l.unit = 10
     assert "Reynolds Number does not have unit." in str(exp)
-   
\ No newline at end of file
+   
+@pytest.mark.positive
+def test_property_slots_and_trusted_construction():
+    p = properties.Pressure(1, 'bar')
+    assert not hasattr(p, '__dict__')
+    with pytest.raises(AttributeError):
+        p.some_attribute = 1
+    p = properties.Pressure._from_trusted(2, 'bar', min_val=1, max_val=3)
+    assert p == properties.Pressure(2, 'bar')
+    assert p.min_val == 1
+    assert p.max_val == 3
+    d = properties.Dimensionless._from_trusted(5, None)
+    assert d.name == "Dimensionless"
+    assert d.unit is None
+
+@pytest.mark.addition
+def test_property_addition_does_not_change_other():
+    p1 = properties.Pressure(1, 'bar')
+    p2 = properties.Pressure(14.5, 'psi')
+    p3 = p1 + p2
+    assert p2.unit == 'psi'
+    assert p2.value == 14.5
+    assert p3.unit == 'bar'
+    assert abs(p3.value - 1.999485) < 0.0001
+    factor, offset = properties.Pressure._unit_conversion('bar', 'Pa')
+    assert abs(factor - 100000) < 1e-6
+    assert offset == 0
+
+@pytest.mark.positive
+def test_PropertyArray_instantiation_conversion():
+    pa = properties.PropertyArray([1, 2, 3], properties.Pressure, 'bar')
+    assert len(pa) == 3
+    assert pa.unit == 'bar'
+    assert pa[1] == properties.Pressure(2, 'bar')
+    pa.unit = 'kPa'
+    assert list(pa.value) == [100, 200, 300]
+    assert list(pa.min_val) == [100, 200, 300]
+
+    ta = properties.PropertyArray([0, 100], properties.Temperature, 'C',
+                                  min_val=[-10, 90], max_val=[10, 110])
+    ka = ta.to_unit('K')
+    assert ta.unit == 'C'
+    assert abs(ka.value[0] - 273.15) < 1e-9
+    assert abs(ka.min_val[1] - 363.15) < 1e-9
+    assert abs(ka.max_val[1] - 383.15) < 1e-9
+
+@pytest.mark.negative
+def test_PropertyArray_incorrect_instantiation():
+    with pytest.raises(Exception) as exp:
+        properties.PropertyArray([1, 2], properties.Pressure, 'C')
+    assert "Selected unit is not supported or a correct unit" in str(exp)
+    with pytest.raises(Exception) as exp:
+        properties.PropertyArray([1, 2], properties.Pressure, 'bar', min_val=[1])
+    assert "Length of 'min_val' should be same as that of values." in str(exp)
+
+@pytest.mark.addition
+def test_PropertyArray_arithmetic():
+    pa = properties.PropertyArray([1, 2], properties.Pressure, 'bar')
+    p = properties.Pressure(100000, 'Pa')
+    added = pa + p
+    assert added.unit == 'bar'
+    assert list(added.value) == [2, 3]
+    assert p.unit == 'Pa'
+    subtracted = p - pa
+    assert subtracted.unit == 'Pa'
+    assert abs(subtracted.value[0]) < 1e-6
+    assert abs(subtracted.value[1] + 100000) < 1e-6
+    assert list(pa / p) == [1, 2]
+    assert list((pa - pa).value) == [0, 0]
+    with pytest.raises(Exception) as exp:
+        pa + properties.Length(1)
+    assert "Cannot operate Pressure with Length." in str(exp)
@@ -34,6 +34,25 @@ class test_Series_pandas(unittest.TestCase):
         self.assertIn("Property: Time", str(pps))
         self.assertIn("unit: hour", str(pps))
     
+    @pytest.mark.positive
+    def test_Series_pandas_representation_is_bounded(self):
+        from unittest.mock import patch
+        to_numpy = pd.Series.to_numpy
+        def bounded_to_numpy(series, *args, **kwargs):
+            self.assertLessEqual(len(series), 6)
+            return to_numpy(series, *args, **kwargs)
+        pps = pplSeries(range(1000000), prop=Time)
+        with patch.object(pd.Series, "to_numpy", bounded_to_numpy):
+            representation = repr(pps)
+        self.assertEqual(len(pps), 1000000)
+        self.assertIn("4", representation)
+        self.assertNotIn("5\n", representation)
+        self.assertIn("\n:\n", representation)
+        short = repr(pplSeries([1, 2, 3, 4, 5], prop=Time))
+        self.assertIn("5", short)
+        self.assertNotIn("\n:\n", short)
+        self.assertEqual(len(pplSeries([1, 2, 3], prop=Time)), 3)
+
     @pytest.mark.negative
     def test_Series_pandas_incorrect_instantiation_required_only(self):
         from propylean import CentrifugalCompressor
@@ -47,4 +66,147 @@ class test_Series_pandas(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             pps = pplSeries(df, prop=Time, unit="C")
         self.assertIn("Selected unit is not supported or a correct unit of Time",
-                      str(exp))
\ No newline at end of file
+                      str(exp))
+    @pytest.mark.positive
+    @pytest.mark.addition
+    @pytest.mark.subtraction
+    def test_Series_pandas_arithmetic_with_different_units(self):
+        from propylean.properties import Pressure, Temperature
+        bar = pplSeries([1, 2, 3], prop=Pressure, unit="bar")
+        kPa = pplSeries([100, 200, 300], prop=Pressure, unit="kPa")
+        total = bar + kPa
+        self.assertEqual(total.unit, "bar")
+        self.assertEqual(total._instance.tolist(), [2, 4, 6])
+        difference = kPa - bar
+        self.assertEqual(difference.unit, "kPa")
+        self.assertEqual(difference._instance.tolist(), [0, 0, 0])
+        self.assertEqual(kPa.unit, "kPa")
+        self.assertEqual(kPa._instance.tolist(), [100, 200, 300])
+
+        pressure = Pressure(50, "kPa")
+        self.assertEqual((bar + pressure)._instance.tolist(), [1.5, 2.5, 3.5])
+        self.assertEqual(pressure.unit, "kPa")
+        self.assertEqual(pressure.value, 50)
+        reflected = Pressure(5, "bar") - kPa
+        self.assertEqual(reflected.unit, "bar")
+        self.assertEqual(reflected._instance.tolist(), [4, 3, 2])
+
+        # Temperatures operate as properties do.
+        celsius = pplSeries([10, 20], prop=Temperature, unit="C")
+        kelvin = Temperature(300, "K")
+        expected = [(Temperature(value, "C") + Temperature(300, "K")).value for value in [10, 20]]
+        for calculated, value in zip((celsius + kelvin)._instance.tolist(), expected):
+            self.assertAlmostEqual(calculated, value, 9)
+
+    @pytest.mark.positive
+    def test_Series_pandas_multiplication_division_comparison_reduction(self):
+        from propylean.properties import Pressure, Dimensionless
+        bar = pplSeries([1, 2, 3], prop=Pressure, unit="bar")
+        self.assertEqual((bar * 2)._instance.tolist(), [2, 4, 6])
+        self.assertEqual((2 * bar).unit, "bar")
+        self.assertEqual((bar / 2)._instance.tolist(), [0.5, 1, 1.5])
+        fractions = pplSeries([0.5, 0.5, 0.5], prop=Dimensionless)
+        self.assertEqual((bar * fractions)._instance.tolist(), [0.5, 1, 1.5])
+        ratio = bar / pplSeries([100, 100, 100], prop=Pressure, unit="kPa")
+        self.assertEqual(ratio.prop, Dimensionless)
+        self.assertEqual(ratio._instance.tolist(), [1, 2, 3])
+
+        self.assertEqual((bar > Pressure(150, "kPa")).tolist(), [False, True, True])
+        self.assertEqual((bar == pplSeries([100, 0, 300], prop=Pressure, unit="kPa")).tolist(),
+                         [True, False, True])
+        self.assertEqual((bar <= 2).tolist(), [True, True, False])
+        self.assertFalse(bar == None)
+
+        self.assertEqual(bar.sum(), Pressure(6, "bar"))
+        self.assertEqual(bar.max().unit, "bar")
+        self.assertEqual(bar.mean().value, 2)
+        self.assertEqual(bar.min().value, 1)
+
+    @pytest.mark.positive
+    def test_Series_pandas_temperature_std(self):
+        from propylean.properties import Temperature, Dimensionless
+        celsius = pplSeries([20, 30, 40], prop=Temperature, unit="C")
+        std = celsius.std()
+        self.assertIsInstance(std, Dimensionless)
+        self.assertEqual(std.name, "Temperature difference (C)")
+        self.assertAlmostEqual(std.value, 10)
+        self.assertEqual(celsius.to_unit("K").std().name, "Temperature difference (K)")
+        self.assertAlmostEqual(celsius.to_unit("K").std().value, std.value)
+        self.assertAlmostEqual(celsius.to_unit("F").std().value, std.value * 9 / 5)
+
+    @pytest.mark.negative
+    def test_Series_pandas_arithmetic_incorrect_operands(self):
+        from propylean.properties import Pressure, Length
+        bar = pplSeries([1, 2, 3], prop=Pressure, unit="bar")
+        with pytest.raises(Exception) as exp:
+            bar + pplSeries([1, 2, 3], prop=Length)
+        self.assertIn("Physical property of both Series operands must be same.", str(exp))
+        with pytest.raises(Exception) as exp:
+            bar * Length(2)
+        self.assertIn("can be multiplied or divided only by numbers or dimensionless values", str(exp))
+        with pytest.raises(TypeError):
+            bar + 1
+
+    @pytest.mark.positive
+    @pytest.mark.instantiation
+    def test_Series_pandas_zero_copy_constructors(self):
+        import numpy as np
+        from propylean.properties import Pressure
+        values = np.array([1.0, 2.0, 3.0])
+        pps = pplSeries.from_numpy(values, prop=Pressure, unit="bar", index=["a", "b", "c"])
+        self.assertTrue(np.shares_memory(pps._instance.to_numpy(), values))
+        self.assertEqual(pps.unit, "bar")
+        self.assertEqual(list(pps._instance.index), ["a", "b", "c"])
+
+        buffer = bytearray(np.array([4.0, 5.0]).tobytes())
+        pps = pplSeries.from_buffer(memoryview(buffer), prop=Pressure)
+        self.assertTrue(np.shares_memory(pps._instance.to_numpy(), np.frombuffer(buffer)))
+        self.assertEqual(pps._instance.tolist(), [4.0, 5.0])
+        self.assertEqual(pps.unit, "Pa")
+
+        pa = pytest.importorskip("pyarrow")
+        array = pa.chunked_array([pa.array([6.0, 7.0])])
+        pps = pplSeries.from_arrow(array, prop=Pressure, unit="kPa")
+        self.assertTrue(np.shares_memory(pps._instance.to_numpy(),
+                                         array.chunk(0).to_numpy(zero_copy_only=True)))
+
+    @pytest.mark.negative
+    @pytest.mark.instantiation
+    def test_Series_pandas_zero_copy_constructors_incorrect_data(self):
+        import numpy as np
+        from propylean.properties import Pressure
+        with pytest.raises(Exception) as exp:
+            pplSeries.from_numpy(np.ones((2, 2)), prop=Pressure)
+        self.assertIn("Array should be one dimensional.", str(exp))
+        pa = pytest.importorskip("pyarrow")
+        with pytest.raises(Exception) as exp:
+            pplSeries.from_arrow(pa.array([1.0, None]), prop=Pressure)
+        self.assertIn("cannot be used without copying", str(exp))
+        with pytest.raises(Exception) as exp:
+            pplSeries.from_arrow(pa.chunked_array([[1.0], [2.0]]), prop=Pressure)
+        self.assertIn("Chunked array should have one chunk", str(exp))
+
+    @pytest.mark.positive
+    def test_Series_pandas_arithmetic_does_not_change_operands(self):
+        import numpy as np
+        from propylean.properties import Pressure, Temperature
+        first = np.array([1.0, 2.0, 3.0])
+        second = np.array([100.0, 200.0, 300.0])
+        bar = pplSeries.from_numpy(first, prop=Pressure, unit="bar")
+        kPa = pplSeries.from_numpy(second, prop=Pressure, unit="kPa")
+        total = bar + kPa
+        self.assertEqual(total._instance.tolist(), [2, 4, 6])
+        self.assertFalse(np.shares_memory(total._instance.to_numpy(), first))
+        self.assertFalse(np.shares_memory(total._instance.to_numpy(), second))
+        self.assertEqual((kPa - bar)._instance.tolist(), [0, 0, 0])
+        self.assertEqual((bar / kPa)._instance.tolist(), [1, 1, 1])
+        self.assertEqual(first.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(second.tolist(), [100.0, 200.0, 300.0])
+        # Different indexes are aligned as in pandas.
+        shifted = pplSeries([100, 200], prop=Pressure, unit="kPa", index=[1, 2])
+        self.assertEqual((bar + shifted)._instance.tolist()[1:], [3, 5])
+        celsius = pplSeries([10.0, 20.0], prop=Temperature, unit="C")
+        fahrenheit = pplSeries([50.0, 68.0], prop=Temperature, unit="F")
+        expected = [(Temperature(c, "C") - Temperature(f, "F")).value for c, f in [(10, 50), (20, 68)]]
+        for calculated, value in zip((celsius - fahrenheit)._instance.tolist(), expected):
+            self.assertAlmostEqual(calculated, value, 4)
@@ -8,6 +8,7 @@ from pyspark.pandas import Series as spkSeries
 
 spark = SparkSession \
     .builder \
+    .master("local[2]") \
     .appName("Python Spark SQL basic example") \
     .config("spark.some.config.option", "some-value") \
     .getOrCreate()
@@ -42,6 +43,16 @@ class test_Series_pyspark(unittest.TestCase):
         self.assertIn("Property: Time", str(pps))
         self.assertIn("unit: hour", str(pps))
     
+    @pytest.mark.positive
+    def test_Series_pyspark_representation_and_length(self):
+        pps = pplSeries(list(range(1000)), prop=Time, is_spark=True)
+        representation = repr(pps)
+        self.assertIn("4", representation)
+        self.assertIn("\n:\n", representation)
+        self.assertEqual(len(pps), 1000)
+        short = repr(pplSeries([1, 2, 3], prop=Time, is_spark=True))
+        self.assertNotIn("\n:\n", short)
+
     @pytest.mark.negative
     def test_Series_pyspark_incorrect_instantiation_required_only(self):
         from propylean import CentrifugalCompressor
@@ -55,4 +66,64 @@ class test_Series_pyspark(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             pps = pplSeries(df, prop=Time, unit="C")
         self.assertIn("Selected unit is not supported or a correct unit of Time",
-                      str(exp))
\ No newline at end of file
+                      str(exp))
+
+
+class test_Series_pyspark_calculations(unittest.TestCase):
+    # Equipment calculations on Spark-backed Series run as pandas UDFs in
+    # local-mode Spark and should give same values as pandas-backed Series.
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_Series_pyspark_CentrifugalPump_head(self):
+        from propylean import CentrifugalPump, MaterialStream
+        from propylean.properties import Pressure, Components
+        feed = MaterialStream(tag="spark_pump_feed", pressure=(2, 'bar'), temperature=(30, 'C'),
+                              mass_flowrate=(1000, 'kg/h'))
+        feed.components = Components({"water": 1})
+        pump = CentrifugalPump(tag="spark_pump")
+        pump.connect_stream(feed, 'in', stream_governed=True)
+        pressures = [1.0, 2.0, 3.0, 4.0]
+        pump.differential_pressure = pplSeries(pressures, prop=Pressure, unit='bar')
+        expected = pump.head._instance.tolist()
+        pump.differential_pressure = pplSeries(pressures, prop=Pressure, unit='bar', is_spark=True)
+        head = pump.head
+        self.assertTrue(head._is_spark)
+        self.assertIsInstance(head._instance, spkSeries)
+        self.assertEqual(head.unit, 'm')
+        for calculated, value in zip(head._instance.to_pandas().tolist(), expected):
+            self.assertAlmostEqual(calculated, value, 6)
+
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_Series_pyspark_Bullet_get_inventory(self):
+        from propylean.equipments.storages import Bullet
+        from propylean.properties import Length
+        bullet = Bullet(tag="spark_bullet", ID=(3.5, "m"), length=(36, "m"))
+        levels = [50.0, 120.0, 175.0, 300.0]
+        bullet.liquid_level = pplSeries(levels, prop=Length, unit="cm")
+        expected = bullet.get_inventory()._instance.tolist()
+        bullet.liquid_level = pplSeries(levels, prop=Length, unit="cm", is_spark=True)
+        inventory = bullet.get_inventory()
+        self.assertTrue(inventory._is_spark)
+        self.assertEqual(inventory.unit, "m^3")
+        for calculated, value in zip(inventory._instance.to_pandas().tolist(), expected):
+            self.assertAlmostEqual(calculated, value, 6)
+
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_Series_pyspark_ControlValve_Cv(self):
+        from propylean import ControlValve, MaterialStream
+        from propylean.properties import Pressure, Components
+        inlet = MaterialStream(tag="spark_cv_inlet", pressure=(10, 'bar'), temperature=(30, 'C'),
+                               mass_flowrate=(1000, 'kg/h'))
+        inlet.components = Components({"water": 1})
+        cv = ControlValve(tag="spark_cv")
+        cv.connect_stream(inlet, 'in', stream_governed=True)
+        drops = [0.5, 1.0, 2.0]
+        cv.pressure_drop = pplSeries(drops, prop=Pressure, unit='bar')
+        expected = cv.Cv._instance.tolist()
+        cv.pressure_drop = pplSeries(drops, prop=Pressure, unit='bar', is_spark=True)
+        Cv = cv.Cv
+        self.assertTrue(Cv._is_spark)
+        for calculated, value in zip(Cv._instance.to_pandas().tolist(), expected):
+            self.assertAlmostEqual(calculated, value, 6)
@@ -0,0 +1,134 @@
+import os
+import struct
+import tempfile
+import pytest
+import unittest
+import pandas as pd
+from propylean import Model, MaterialStream, EnergyStream, PipeSegment, CentrifugalPump
+from propylean.equipments import static, exchangers, separators, rotary, storages
+from propylean.instruments import safety, control, measurement
+from propylean.properties import _Property, Components, Dimensionless
+from propylean import snapshot
+
+EQUIPMENT_CLASSES = [static.Filters, static.Strainers, exchangers.AirCooler,
+                     exchangers.ElectricHeater, exchangers.ShellnTubeExchanger,
+                     separators.Column, separators.FlareKOD, separators.HorizontalSeparator,
+                     separators.VerticalSeparator, rotary.CentrifugalCompressor,
+                     rotary.CentrifugalPump, rotary.PositiveDisplacementPump,
+                     rotary.TurboExpander, storages.Bullet, storages.HotOilExpansionVessel,
+                     storages.Sphere, storages.Tank, storages.VerticalStorage,
+                     safety.PressureSafetyValve, control.ControlValve,
+                     measurement.FlowMeter, measurement.PressureGuage,
+                     measurement.TemperatureGuage]
+
+def build_model():
+    model = Model()
+    with model:
+        for cls in EQUIPMENT_CLASSES:
+            cls(tag="T-" + cls.__name__)
+        feed = MaterialStream(tag="Feed", pressure=(2, 'bar'), temperature=(30, 'C'),
+                              mass_flowrate=(1000, 'kg/h'))
+        feed.components = Components({"water": 1})
+        discharge = MaterialStream(tag="Discharge")
+        power = EnergyStream(tag="Power", amount=(5, 'kW'))
+        pump = CentrifugalPump(tag="P-1", differential_pressure=(3, 'bar'))
+        pump.performance_curve = pd.DataFrame({"flow": [0.0, 5.0, 10.0], "head": [40.0, 35.0, 20.0]})
+        pump.connect_stream(feed, direction="in")
+        pump.connect_stream(discharge, direction="out", stream_governed=False)
+        pump.connect_stream(power, direction="in", stream_type="energy")
+        segments = pd.DataFrame({"segment_type": [1, 2], "ID": [(2, 'inch'), (2, 'inch')],
+                                 "length": [(10, 'm'), None], "material": [2, 2]})
+        pipe = PipeSegment(tag="L-1", segment_frame=segments)
+        pipe.connect_stream(discharge, direction="in")
+    return model
+
+def assert_same(test, first, second):
+    test.assertIs(type(first), type(second))
+    if isinstance(first, _Property):
+        test.assertEqual((first.value, first.unit, first._min_val, first._max_val),
+                         (second.value, second.unit, second._min_val, second._max_val))
+        if isinstance(first, Dimensionless):
+            test.assertEqual(first.name, second.name)
+    elif isinstance(first, pd.DataFrame):
+        pd.testing.assert_frame_equal(first, second)
+    elif isinstance(first, Components):
+        test.assertEqual((first.fractions, first.type), (second.fractions, second.type))
+    else:
+        test.assertEqual(first, second)
+
+class test_snapshot(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".prs")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    @pytest.mark.positive
+    def test_snapshot_round_trip_all_equipments(self):
+        model = build_model()
+        model.save(self.path)
+        loaded = Model.load(self.path)
+        self.assertEqual(set(loaded._registries), set(cls for cls, registry in model._registries.items()
+                                                      if len(registry) > 0))
+        for owner, registry in model._registries.items():
+            if len(registry) == 0:
+                continue
+            loaded_registry = loaded._registries[owner]
+            self.assertEqual(registry.handles(), loaded_registry.handles())
+            self.assertEqual(registry._next_handle, loaded_registry._next_handle)
+            for handle in registry.handles():
+                obj, loaded_obj = registry[handle], loaded_registry[handle]
+                self.assertIsNot(obj, loaded_obj)
+                self.assertEqual(set(vars(obj)), set(vars(loaded_obj)))
+                for name, value in vars(obj).items():
+                    assert_same(self, value, vars(loaded_obj)[name])
+        self.assertEqual(model._material_stream_equipment_map, loaded._material_stream_equipment_map)
+        self.assertEqual(model._energy_stream_equipment_map, loaded._energy_stream_equipment_map)
+
+    @pytest.mark.positive
+    def test_snapshot_loaded_model_is_usable(self):
+        build_model().save(self.path)
+        loaded = Model.load(self.path)
+        with loaded.clone():
+            self.assertEqual(len(MaterialStream.items), 2)
+            self.assertEqual(MaterialStream.items.get_by_tag("Feed").pressure.to_unit('bar').value, 2)
+        with loaded:
+            pump = CentrifugalPump.items.get_by_tag("P-1")
+            pipe = PipeSegment.items.get_by_tag("L-1")
+            self.assertAlmostEqual(pump.outlet_pressure.to_unit('bar').value, 5)
+            self.assertEqual(pipe.inlet_pressure, pump.outlet_pressure)
+            self.assertEqual(len(pipe.pressure_drop_profile()), 2)
+            MaterialStream.items.get_by_tag("Feed").pressure = (4, 'bar')
+            self.assertAlmostEqual(pump.outlet_pressure.to_unit('bar').value, 5)
+            # Change is propagated when derived property downstream is read.
+            pipe.pressure_drop
+            self.assertAlmostEqual(pump.outlet_pressure.to_unit('bar').value, 7)
+            self.assertEqual(pipe.inlet_pressure, pump.outlet_pressure)
+            self.assertEqual(CentrifugalPump().tag, "CentrifugalPump_1")
+
+    @pytest.mark.positive
+    def test_snapshot_dimensionless_names(self):
+        model = build_model()
+        with model:
+            feed = MaterialStream.items.get_by_tag("Feed")
+            names = {"Z": feed.Z.name, "isentropic_exponent": feed.isentropic_exponent.name}
+        self.assertEqual(names["Z"], "Compressibility factor (Z)")
+        model.save(self.path)
+        with Model.load(self.path):
+            feed = MaterialStream.items.get_by_tag("Feed")
+            self.assertEqual(feed.Z.name, names["Z"])
+            self.assertEqual(feed.isentropic_exponent.name, names["isentropic_exponent"])
+
+    @pytest.mark.negative
+    def test_snapshot_version_and_magic(self):
+        build_model().save(self.path)
+        with open(self.path, "r+b") as f:
+            f.seek(8)
+            f.write(struct.pack("<I", snapshot.VERSION + 1))
+        with pytest.raises(Exception, match="version"):
+            Model.load(self.path)
+        with open(self.path, "wb") as f:
+            f.write(b"NOTASNAPSHOT" * 4)
+        with pytest.raises(Exception, match="not a propylean snapshot"):
+            Model.load(self.path)
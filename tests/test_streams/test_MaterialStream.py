@@ -4,6 +4,7 @@ import unittest
 
 from thermo import Mixture
 from propylean.streams import MaterialStream
+from propylean.series import Series
 import propylean.properties as prop
 import pandas as pd
 
@@ -160,6 +161,113 @@ class test_MaterialStream(unittest.TestCase):
         mx = Mixture(zs=mol_fraction, T=300, P=p.value)
         self.assertEqual(m4.phase, mx.phase)
 
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_MaterialStream_components_series_temperature_pressure(self):
+        m4 = MaterialStream(tag="m11_series",
+                            mass_flowrate=prop.MassFlowRate(1000, "kg/h"))
+        m4.temperature = Series([300, 310, 300], prop=prop.Temperature, index=["a", "b", "c"])
+        m4.pressure = Series([10, 12, 10], prop=prop.Pressure, unit="bar", index=["a", "b", "c"])
+        mol_fraction = OrderedDict([('benzene', 0.96522),('toluene', 0.00259)])
+        m4.components = prop.Components(mol_fraction, 'mol')
+        mx = Mixture(zs=mol_fraction, T=310, P=12e5)
+        self.assertIsInstance(m4.density, Series)
+        self.assertEqual(m4.density.prop, prop.Density)
+        self.assertEqual(m4.density.unit, "kg/m^3")
+        self.assertEqual(list(m4.density.index), ["a", "b", "c"])
+        self.assertAlmostEqual(m4.density.loc["b"], mx.rho)
+        self.assertAlmostEqual(m4.d_viscosity.loc["b"], mx.mu)
+        self.assertAlmostEqual(m4.Z.loc["b"], mx.Z)
+        self.assertAlmostEqual(m4.molecular_weight.loc["b"], mx.MW)
+        self.assertAlmostEqual(m4.isentropic_exponent.loc["b"], mx.isentropic_exponent)
+        self.assertAlmostEqual(m4.Pc.loc["b"], mx.Pc)
+        self.assertEqual(m4.phase.loc["b"], mx.phase)
+        self.assertEqual(m4.density.loc["a"], m4.density.loc["c"])
+
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_MaterialStream_series_flowrates(self):
+        m4 = MaterialStream(tag="m14_series",
+                            mass_flowrate=prop.MassFlowRate(1000, "kg/h"))
+        m4.temperature = Series([300, 310, 300], prop=prop.Temperature, index=["a", "b", "c"])
+        m4.pressure = Series([10, 12, 10], prop=prop.Pressure, unit="bar", index=["a", "b", "c"])
+        mol_fraction = OrderedDict([('benzene', 0.96522),('toluene', 0.00259)])
+        m4.components = prop.Components(mol_fraction, 'mol')
+        mx = Mixture(zs=mol_fraction, T=310, P=12e5)
+        vol_flowrate = m4.vol_flowrate
+        self.assertIsInstance(vol_flowrate, Series)
+        self.assertEqual(vol_flowrate.prop, prop.VolumetricFlowRate)
+        self.assertEqual(list(vol_flowrate.index), ["a", "b", "c"])
+        self.assertAlmostEqual(vol_flowrate.to_unit("m^3/h").loc["b"], 1000/mx.rho)
+        mol_flowrate = m4.mol_flowrate
+        self.assertIsInstance(mol_flowrate, Series)
+        self.assertEqual(mol_flowrate.prop, prop.MolarFlowRate)
+        self.assertAlmostEqual(mol_flowrate.to_unit("mol/h").loc["b"], 1000000/mx.MW)
+        m4.temperature = 300
+        m4.pressure = (10, 'bar')
+        m4.components = prop.Components(mol_fraction, 'mol')
+        self.assertIsInstance(m4.vol_flowrate, prop.VolumetricFlowRate)
+        self.assertAlmostEqual(m4.vol_flowrate.value, vol_flowrate.loc["a"])
+
+    @pytest.mark.positive
+    @pytest.mark.time_series
+    def test_MaterialStream_series_phase_to_connected_equipment(self):
+        from propylean import CentrifugalPump
+        from propylean.constants import Constants
+        m4 = MaterialStream(tag="m12_series", temperature=(30, "C"),
+                            mass_flowrate=prop.MassFlowRate(1000, "kg/h"))
+        m4.pressure = Series([9, 10, 11], prop=prop.Pressure, unit="bar", index=["a", "b", "c"])
+        m4.components = prop.Components({"water": 1})
+        self.assertIsInstance(m4.phase, pd.Series)
+        self.assertEqual(list(m4.phase.index), ["a", "b", "c"])
+        self.assertEqual(list(m4.phase), ["l", "l", "l"])
+        m5 = MaterialStream(tag="m13_series")
+        pump = CentrifugalPump(tag="pump_series_phase", differential_pressure=(2, "bar"))
+        pump.connect_stream(m4, "in", stream_governed=True)
+        pump.connect_stream(m5, "out", stream_governed=True)
+        self.assertEqual(list(m5.phase), ["l", "l", "l"])
+        self.assertEqual(list(m5.phase.index), ["a", "b", "c"])
+        head = pump.head
+        self.assertIsInstance(head, Series)
+        self.assertEqual(list(head.index), ["a", "b", "c"])
+        self.assertAlmostEqual(head.loc["b"], 2e5 / (m4.density.loc["b"] * Constants.g))
+
+    @pytest.mark.positive
+    def test_MaterialStream_property_cache(self):
+        MaterialStream.clear_property_cache()
+        mol_fraction = OrderedDict([('benzene', 0.96522),('toluene', 0.00259)])
+        m1 = MaterialStream(tag="m_cache_1", pressure=(10, 'bar'), temperature=300)
+        m1.components = prop.Components(mol_fraction, 'mol')
+        self.assertEqual(MaterialStream.property_cache_info()["misses"], 1)
+        self.assertEqual(MaterialStream.property_cache_info()["hits"], 0)
+        m2 = MaterialStream(tag="m_cache_2", pressure=(1000, 'kPa'), temperature=(26.85, 'C'))
+        m2.components = prop.Components(mol_fraction, 'mol')
+        self.assertEqual(MaterialStream.property_cache_info()["hits"], 1)
+        self.assertEqual(MaterialStream.property_cache_info()["size"], 1)
+        self.assertEqual(m1.density, m2.density)
+        self.assertEqual(m1.Z.value, m2.Z.value)
+
+    @pytest.mark.positive
+    def test_MaterialStream_property_cache_eviction(self):
+        from propylean.settings import Settings
+        MaterialStream.clear_property_cache()
+        old_size = Settings.property_cache_size
+        Settings.property_cache_size = 2
+        try:
+            m1 = MaterialStream(tag="m_cache_3")
+            m1.temperature = Series([300, 310, 320], prop=prop.Temperature)
+            m1.components = prop.Components({"water": 1})
+            info = MaterialStream.property_cache_info()
+            self.assertEqual(info["misses"], 3)
+            self.assertEqual(info["size"], 2)
+            self.assertEqual(info["max_size"], 2)
+            m1.temperature = Series([320], prop=prop.Temperature)
+            m1.components = prop.Components({"water": 1})
+            self.assertEqual(MaterialStream.property_cache_info()["hits"], 1)
+        finally:
+            Settings.property_cache_size = old_size
+            MaterialStream.clear_property_cache()
+
     @pytest.mark.positive
     @pytest.mark.unit_change
     def test_MaterialStream_property_unit_change(self):
@@ -291,7 +399,7 @@ class test_MaterialStream(unittest.TestCase):
         with pytest.raises(Exception) as exp:
             m4 = MaterialStream()
             m4.phase = []
-        self.assertIn("Incorrect type 'list' provided to 'phase'. Should be \'str\'", str(exp))
+        self.assertIn("Incorrect type 'list' provided to 'phase'. Can be any one from '('str', 'Series')'", str(exp))
 
     @pytest.mark.negative
     def test_MaterialStream_Z_incorrect_type_to_value(self):
@@ -372,3 +480,44 @@ class test_MaterialStream(unittest.TestCase):
         
         self.assertNotIn(inlet_stream.index, mse_map.keys())
         self.assertNotIn(outlet_stream.index, mse_map.keys())
+
+    @pytest.mark.positive
+    def test_MaterialStream_tag_registry(self):
+        from propylean.streams import get_stream_index
+        m1 = MaterialStream(tag="registry_m1")
+        m2 = MaterialStream()
+        self.assertIs(MaterialStream.items.get_by_tag("registry_m1"), m1)
+        self.assertIs(MaterialStream.items.get_by_tag(m2.tag), m2)
+        self.assertEqual(get_stream_index("registry_m1", "material"), m1.index)
+
+        m1.tag = "registry_m1_renamed"
+        self.assertFalse(MaterialStream.items.has_tag("registry_m1"))
+        self.assertIs(MaterialStream.items.get_by_tag("registry_m1_renamed"), m1)
+        m3 = MaterialStream(tag="registry_m1")
+        self.assertEqual(m3.tag, "registry_m1")
+
+        auto_tag = m2.tag
+        m2.delete()
+        self.assertFalse(MaterialStream.items.has_tag(auto_tag))
+        self.assertEqual(MaterialStream().tag, auto_tag)
+
+    @pytest.mark.delete
+    def test_MaterialStream_stable_index_after_delete(self):
+        from propylean.equipments.abstract_equipment_classes import _material_stream_equipment_map as mse_map
+        from propylean import CentrifugalPump
+        m1 = MaterialStream(pressure=(5, 'bar'))
+        m2 = MaterialStream(pressure=(7, 'bar'))
+        pump = CentrifugalPump()
+        pump.connect_stream(m2, direction="in")
+        m2_index = m2.index
+        m1.delete()
+        self.assertEqual(m2.index, m2_index)
+        self.assertIs(MaterialStream.items[m2.index], m2)
+        self.assertEqual(mse_map[m2.index][2], pump.index)
+        self.assertIs(MaterialStream.items[pump._inlet_material_stream_index], m2)
+        self.assertEqual(m2.pressure, prop.Pressure(7, 'bar'))
+        m3 = MaterialStream()
+        self.assertNotEqual(m3.index, m1.index)
+        with pytest.raises(Exception) as exp:
+            repr(m1)
+        self.assertIn("Stream does not exist!", str(exp))